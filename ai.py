@@ -0,0 +1,154 @@
+"""AI paddle komputer. Tidak bergantung pada pygame."""
+from constants import *
+
+_neural_policy = None  # nnpolicy.MLPPolicy (False jika tidak tersedia), dimuat saat pertama dipakai
+
+
+def get_neural_policy():
+    """Policy MLP dari models/ai_mlp.npz, atau None jika NumPy/bobot tidak ada."""
+    global _neural_policy
+    if _neural_policy is None:
+        # Impor di sini supaya simulasi heuristik tidak ikut memuat NumPy
+        from nnpolicy import load_policy
+        _neural_policy = load_policy() or False
+    return _neural_policy or None
+
+
+# Profil AI per difficulty; ADAPTIF dan NEURAL (tanpa bobot) memakai SEDANG.
+# Bisa dikalibrasi ulang terhadap pemain referensi dengan `cli.py calibrate`.
+AI_PROFILES = {
+    DIFFICULTY_EASY: {
+        'speed': 1.2,
+        'prediction_error': 0.80,
+        'reaction_time': 0.80,
+        'accuracy': 0.1
+    },
+    DIFFICULTY_MEDIUM: {
+        'speed': 1.4,
+        'prediction_error': 0.70,
+        'reaction_time': 0.70,
+        'accuracy': 0.2
+    },
+    DIFFICULTY_HARD: {
+        'speed': 1.6,
+        'prediction_error': 0.60,
+        'reaction_time': 0.60,
+        'accuracy': 0.3
+    },
+}
+
+
+def get_ai_settings(difficulty, adjustment=0.0):
+    """Mendapatkan setting AI berdasarkan tingkat kesulitan
+
+    `adjustment` (AIState.difficulty_adjustment, dipakai AI adaptif) menggeser
+    semua parameter secara kontinu: positif = AI lebih sulit. Dict hasil
+    hanya untuk dibaca.
+    """
+    settings = AI_PROFILES.get(difficulty) or AI_PROFILES[DIFFICULTY_MEDIUM]
+    if adjustment:
+        settings = dict(settings)
+        settings['speed'] += adjustment
+        settings['prediction_error'] = max(0.05, settings['prediction_error'] - adjustment)
+        settings['reaction_time'] = max(0.1, settings['reaction_time'] - adjustment * 0.8)
+        settings['accuracy'] = min(1.0, max(0.0, settings['accuracy'] + adjustment * 0.6))
+    return settings
+
+
+def update_ai(ai, match, dt=SIM_DT):
+    """Hitung gerakan paddle AI (matchstate.AIState `ai`) untuk step `dt` detik ini"""
+    if ai.difficulty == DIFFICULTY_NEURAL:
+        policy = get_neural_policy()
+        if policy is not None:
+            return policy.move(ai, match)
+        # Tanpa bobot: jatuh ke heuristik SEDANG
+    rng = match.rng
+    # difficulty_adjustment hanya diubah di antara poin (Match.set_ai_adjustment)
+    ai_settings = get_ai_settings(ai.difficulty, ai.difficulty_adjustment)
+
+    ball_centerx = match.ball.x + BALL_RADIUS
+    ball_centery = match.ball.y + BALL_RADIUS
+    # Paddle kiri dicerminkan supaya logika prediksi sama untuk kedua sisi
+    if ai.side == 2:
+        vel_toward = match.ball.vel_x
+        distance = PADDLE_2_X - ball_centerx
+        paddle_y = match.paddle_2.y
+    else:
+        vel_toward = -match.ball.vel_x
+        distance = ball_centerx - (PADDLE_1_X + PADDLE_WIDTH)
+        paddle_y = match.paddle_1.y
+
+    # AI hanya bereaksi jika bola bergerak ke arahnya
+    if vel_toward > 0:
+        # Hitung waktu sampai bola mencapai paddle
+        time_to_paddle = distance / vel_toward
+
+        if time_to_paddle > 0:
+            # Bola bergerak lurus sampai kecepatannya berubah (pantulan dinding,
+            # pukulan, speed up) atau ronde baru, jadi titik potong cukup
+            # dihitung sekali per lintasan; frame lain hanya membaca cache
+            ball = match.ball
+            if (ball.vel_x != ai.path_vel_x or ball.vel_y != ai.path_vel_y
+                    or match.round_start_step != ai.path_round):
+                # Prediksi posisi bola dengan mempertimbangkan pantulan
+                predicted_y = ball_centery + (ball.vel_y * time_to_paddle)
+
+                # Simulasi pantulan dari dinding atas/bawah
+                bounces = 0
+                temp_y = predicted_y
+                while bounces < 3:  # Maksimal 3 pantulan
+                    if temp_y <= 0:
+                        temp_y = -temp_y
+                        bounces += 1
+                    elif temp_y >= LOW_RES_HEIGHT:
+                        temp_y = 2 * LOW_RES_HEIGHT - temp_y
+                        bounces += 1
+                    else:
+                        break
+                ai.intercept_y = temp_y
+                ai.path_vel_x = ball.vel_x
+                ai.path_vel_y = ball.vel_y
+                ai.path_round = match.round_start_step
+            predicted_y = ai.intercept_y
+
+            # Tambahkan error berdasarkan tingkat kesulitan
+            if ai.reaction_delay <= 0:
+                error_range = PADDLE_HEIGHT * ai_settings['prediction_error']
+                ai.error_offset = rng.uniform(-error_range, error_range)
+
+                # Waktu reaksi berdasarkan tingkat kesulitan (+- 2/60 detik)
+                reaction_time = ai_settings['reaction_time']
+                ai.reaction_delay = rng.uniform(reaction_time - 2 / 60, reaction_time + 2 / 60)
+
+            target_y = predicted_y + ai.error_offset
+
+            # Batasi target dalam area bermain
+            target_y = max(PADDLE_HEIGHT // 2,
+                           min(LOW_RES_HEIGHT - PADDLE_HEIGHT // 2, target_y))
+
+            # Kadang-kadang AI "mengantuk" untuk menambah variasi
+            if rng.random() > ai_settings['accuracy']:
+                target_y += rng.uniform(-PADDLE_HEIGHT, PADDLE_HEIGHT)
+            ai.target_y = target_y
+
+    # Kurangi delay reaksi
+    if ai.reaction_delay > 0:
+        ai.reaction_delay -= dt
+
+    # Gerakkan paddle AI menuju target
+    distance_to_target = ai.target_y - (paddle_y + PADDLE_HEIGHT / 2)
+
+    # Kecepatan AI berdasarkan tingkat kesulitan
+    ai_speed = ai_settings['speed']
+
+    # Dead zone untuk menghindari jitter
+    dead_zone = 3
+    if abs(distance_to_target) > dead_zone:
+        if distance_to_target > 0:
+            move = min(ai_speed, distance_to_target / 10)
+        else:
+            move = max(-ai_speed, distance_to_target / 10)
+    else:
+        move = 0
+
+    return move
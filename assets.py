@@ -0,0 +1,178 @@
+"""Manajer aset: memuat font dan pre-bake surface di thread latar belakang."""
+import json
+import os
+import threading
+
+import pygame
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+FONT_DIR = os.path.join(BASE_DIR, "fonts")
+
+# Cache di disk supaya peluncuran berikutnya tidak perlu scan font sistem lagi
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cozypong")
+FONT_CACHE_PATH = os.path.join(CACHE_DIR, "fonts.json")
+FONT_CACHE_VERSION = 2  # versi 2: tanpa metrik glyph
+
+FALLBACK_FONT_NAME = 'Consolas'
+
+# nama -> (file font kustom, ukuran, ukuran fallback font sistem)
+FONT_SPECS = {
+    "small": ("VT323-Regular.ttf", 14, 12),
+    "medium": ("VT323-Regular.ttf", 18, 16),
+    "large": ("PressStart2P-Regular.ttf", 16, 18),
+    "title": ("PressStart2P-Regular.ttf", 20, 20),
+}
+
+# Karakter ASCII yang bisa dicetak (atlas glyph, bench --glyphs)
+METRIC_CHARS = "".join(chr(c) for c in range(32, 127))
+
+# Batas jumlah surface teks yang disimpan sebelum cache dikosongkan
+TEXT_CACHE_LIMIT = 512
+
+
+class TextCache:
+    """Cache surface hasil font.render, dikunci (font, teks, warna)."""
+
+    def __init__(self, limit=TEXT_CACHE_LIMIT):
+        self.limit = limit
+        self._surfaces = {}
+
+    def render(self, font, text, color):
+        key = (font, text, color)
+        surf = self._surfaces.get(key)
+        if surf is None:
+            if len(self._surfaces) >= self.limit:
+                self._surfaces.clear()
+            surf = font.render(text, True, color)
+            self._surfaces[key] = surf
+        return surf
+
+    def clear(self):
+        self._surfaces.clear()
+
+
+def _file_stamp(path):
+    try:
+        return os.path.getmtime(path)
+    except OSError:
+        return None
+
+
+def load_font_cache(path=FONT_CACHE_PATH):
+    """Baca cache font dari disk. Mengembalikan dict kosong jika tidak valid."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != FONT_CACHE_VERSION:
+        return {}
+    fonts = data.get("fonts", {})
+    # Buang entri yang file-nya sudah berubah atau hilang
+    valid = {}
+    for name, entry in fonts.items():
+        font_path = entry.get("path")
+        if font_path is None or _file_stamp(font_path) == entry.get("mtime"):
+            valid[name] = entry
+    return valid
+
+
+def save_font_cache(fonts, path=FONT_CACHE_PATH):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": FONT_CACHE_VERSION, "fonts": fonts}, f)
+        os.replace(tmp_path, path)
+    except OSError:
+        # Cache hanya optimasi, game tetap jalan tanpa cache
+        pass
+
+
+def resolve_font(name, cached=None):
+    """Tentukan path dan ukuran font untuk `name`.
+
+    Font kustom di folder fonts/ dipakai jika ada. Kalau tidak, cari font
+    sistem (lambat, karena itu hasilnya di-cache). Path None berarti font
+    bawaan pygame.
+    """
+    filename, size, fallback_size = FONT_SPECS[name]
+    path = os.path.join(FONT_DIR, filename)
+    if os.path.isfile(path):
+        return path, size
+    if cached is not None:
+        return cached["path"], cached["size"]
+    return pygame.font.match_font(FALLBACK_FONT_NAME), fallback_size
+
+
+class AssetManager:
+    """Memuat font dan pre-bake surface umum di thread latar belakang.
+
+    Selama pemuatan belum selesai, `fonts` berisi font bawaan pygame supaya
+    layar judul bisa langsung tampil. Setelah `poll()` mengembalikan True,
+    `fonts` berisi font asli dan surface pre-bake sudah ada di `text_cache`.
+    """
+
+    def __init__(self, text_cache=None, cache_path=FONT_CACHE_PATH):
+        self.cache_path = cache_path
+        self.text_cache = text_cache if text_cache is not None else TextCache()
+        self.sprites = {}
+        # Font sementara (ringan, tanpa scan font sistem)
+        self.fonts = {name: pygame.font.Font(None, spec[1] + 4) for name, spec in FONT_SPECS.items()}
+        self._loaded_fonts = None
+        self._ready = threading.Event()
+        self._adopted = False
+        self._thread = None
+
+    def start(self, prebake_text=(), prebake_sprites=None):
+        """Mulai pemuatan di background.
+
+        prebake_text: iterable (teks, nama_font, warna).
+        prebake_sprites: dict nama -> fungsi tanpa argumen yang membuat surface.
+        """
+        self._thread = threading.Thread(
+            target=self._load, args=(list(prebake_text), dict(prebake_sprites or {})),
+            name="asset-loader", daemon=True)
+        self._thread.start()
+
+    def _load(self, prebake_text, prebake_sprites):
+        try:
+            cached = load_font_cache(self.cache_path)
+            fonts = {}
+            entries = {}
+            using_fallback = False
+            for name in FONT_SPECS:
+                path, size = resolve_font(name, cached.get(name))
+                if not using_fallback and (path is None or os.path.dirname(path) != FONT_DIR):
+                    using_fallback = True
+                    print("Font kustom tidak ditemukan, menggunakan font sistem.")
+                font = pygame.font.Font(path, size)
+                fonts[name] = font
+                entries[name] = {"path": path, "size": size,
+                                 "mtime": _file_stamp(path) if path else None}
+            if entries != cached:
+                save_font_cache(entries, self.cache_path)
+
+            for text, font_name, color in prebake_text:
+                self.text_cache.render(fonts[font_name], text, color)
+            for name, build in prebake_sprites.items():
+                self.sprites[name] = build()
+            self._loaded_fonts = fonts
+        finally:
+            self._ready.set()
+
+    def poll(self):
+        """True jika aset sudah siap. Dipanggil dari thread utama tiap frame."""
+        if self._adopted:
+            return True
+        if not self._ready.is_set():
+            return False
+        if self._loaded_fonts is not None:
+            self.fonts = self._loaded_fonts
+        self._adopted = True
+        return True
+
+    def wait(self, timeout=None):
+        """Tunggu pemuatan selesai (maksimal `timeout` detik)."""
+        self._ready.wait(timeout)
+        return self.poll()
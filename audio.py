@@ -0,0 +1,134 @@
+"""Efek suara: disintesis sekali dengan NumPy, diputar lewat pool channel tetap.
+
+Semua suara dibuat saat start (tanpa file aset) langsung ke buffer
+pygame.mixer.Sound dan disimpan. `play()` dipanggil dari event step fisika,
+jadi isinya hanya lookup dan loop kecil atas list yang sudah dialokasi;
+mixing dilakukan thread audio SDL sehingga game loop tidak pernah menunggu.
+Jika semua channel sibuk, suara baru mengambil alih channel dengan
+prioritas terendah (yang paling lama jika sama), atau dibuang jika semua
+channel memutar suara yang lebih penting. Tanpa NumPy atau perangkat audio
+game tetap jalan tanpa suara.
+"""
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+AUDIO_RATE = 22050
+AUDIO_BUFFER = 512       # sampel (~23 ms); lebih kecil = latensi lebih rendah
+AUDIO_CHANNELS = 8
+AUDIO_VOLUME = 0.35
+ATTACK_TIME = 0.002      # detik; mencegah "klik" di awal suara
+HIT_PITCH_STEPS = (1.0, 1.12, 1.26, 1.41)  # varian pukulan paddle per tingkat kecepatan bola
+
+# nama -> (prioritas, bentuk gelombang, [(frekuensi awal, frekuensi akhir, durasi)], decay per detik, volume)
+# Nama sama dengan jenis event sim.Match supaya bisa diputar langsung dari event.
+SOUND_SPECS = {
+    "paddle_hit": (2, "square", [(440, 330, 0.07)], 40.0, 0.8),
+    "wall": (1, "triangle", [(220, 200, 0.05)], 50.0, 0.7),
+    "shield_block": (2, "noise", [(0, 0, 0.10)], 30.0, 0.5),
+    "speed_up": (3, "square", [(300, 900, 0.18)], 8.0, 0.5),
+    "powerup": (3, "square", [(523, 523, 0.05), (659, 659, 0.05), (784, 784, 0.05), (1047, 1047, 0.08)], 6.0, 0.5),
+    "point": (4, "triangle", [(784, 784, 0.10), (523, 392, 0.22)], 5.0, 1.0),
+    "menu_move": (1, "square", [(660, 660, 0.03)], 60.0, 0.4),
+    "menu_select": (1, "square", [(660, 660, 0.04), (990, 990, 0.07)], 25.0, 0.4),
+}
+
+
+def synthesize(waveform, notes, decay, volume, rate=AUDIO_RATE, pitch=1.0, seed=0):
+    """Sampel float32 -1..1 untuk satu suara: nada-nada berurutan dengan envelope eksponensial."""
+    parts = []
+    for start_freq, end_freq, duration in notes:
+        n = max(1, int(duration * rate))
+        t = np.arange(n, dtype=np.float64) / rate
+        if waveform == "noise":
+            wave = np.random.default_rng(seed).uniform(-1.0, 1.0, n)
+        else:
+            # Sweep frekuensi linear; fase = integral frekuensi
+            freq = np.linspace(start_freq, end_freq, n) * pitch
+            phase = np.cumsum(freq) / rate
+            if waveform == "square":
+                wave = np.where(phase % 1.0 < 0.5, 1.0, -1.0)
+            elif waveform == "triangle":
+                wave = 4.0 * np.abs(phase % 1.0 - 0.5) - 1.0
+            else:
+                wave = np.sin(2 * np.pi * phase)
+        envelope = np.exp(-decay * t) * np.minimum(1.0, t / ATTACK_TIME)
+        # Fade out singkat di akhir tiap nada
+        tail = min(n, int(ATTACK_TIME * rate) + 1)
+        envelope[-tail:] *= np.linspace(1.0, 0.0, tail)
+        parts.append(wave * envelope)
+    return (np.concatenate(parts) * volume).astype(np.float32)
+
+
+class Audio:
+    """Suara yang sudah di-cache plus pool channel dengan pencurian berdasarkan prioritas."""
+
+    def __init__(self, enabled=True, channels=AUDIO_CHANNELS):
+        self.enabled = False
+        self._sounds = {}
+        self._channels = []
+        self._priority = []
+        self._started = []
+        self._clock = 0
+        if not enabled or np is None:
+            return
+        try:
+            pygame.mixer.init(AUDIO_RATE, -16, 1, AUDIO_BUFFER)
+            rate, size, mixer_channels = pygame.mixer.get_init()
+        except pygame.error as e:
+            print("Audio tidak tersedia: %s" % e)
+            return
+        if size != -16:
+            pygame.mixer.quit()
+            return
+        pygame.mixer.set_num_channels(channels)
+        self._channels = [pygame.mixer.Channel(i) for i in range(channels)]
+        self._priority = [0] * channels
+        self._started = [0] * channels
+        for name, (priority, waveform, notes, decay, volume) in SOUND_SPECS.items():
+            pitches = HIT_PITCH_STEPS if name == "paddle_hit" else (1.0,)
+            variants = []
+            for pitch in pitches:
+                samples = synthesize(waveform, notes, decay, volume * AUDIO_VOLUME, rate, pitch)
+                pcm = (samples * 32767).astype(np.int16)
+                if mixer_channels > 1:
+                    pcm = np.repeat(pcm, mixer_channels)  # interleave ke semua channel speaker
+                variants.append(pygame.mixer.Sound(buffer=pcm.tobytes()))
+            self._sounds[name] = (priority, tuple(variants), len(variants) - 1)
+        self.enabled = True
+
+    def play(self, name, variant=0):
+        """Putar suara `name` (nama event tanpa suara diabaikan). False jika dibuang."""
+        entry = self._sounds.get(name)
+        if entry is None:
+            return False
+        priority, variants, last = entry
+        sound = variants[variant if variant < last else last]
+        channels = self._channels
+        priorities = self._priority
+        started = self._started
+        victim = -1
+        for i in range(len(channels)):
+            if not channels[i].get_busy():
+                victim = i
+                break
+            if priorities[i] <= priority and (victim < 0 or priorities[i] < priorities[victim]
+                                              or (priorities[i] == priorities[victim]
+                                                  and started[i] < started[victim])):
+                victim = i
+        if victim < 0:
+            return False
+        # Channel.play menghentikan suara yang sedang diputar di channel itu
+        channels[victim].play(sound)
+        self._clock += 1
+        priorities[victim] = priority
+        started[victim] = self._clock
+        return True
+
+    def close(self):
+        if self.enabled:
+            pygame.mixer.quit()
+            self.enabled = False
@@ -0,0 +1,201 @@
+"""Kalibrasi profil AI (ai.AI_PROFILES) terhadap pemain referensi (tanpa pygame).
+
+Pemain referensi adalah skrip "manusia rata-rata": melihat bola dengan
+keterlambatan, membidik dengan error yang makin besar untuk bola jauh, dan
+menekan tombol penuh (PADDLE_SPEED) seperti keyboard. Tiap kandidat setting
+AI dinilai dari peluang AI memenangkan satu poin; target win rate
+pertandingan (first to WINNING_SCORE) dikonversi ke peluang poin, jadi
+sampel per poin bisa dipakai langsung.
+
+Pencarian memakai successive halving di grid: semua kandidat dinilai dengan
+budget poin kecil, kandidat yang interval kepercayaannya jelas jauh dari
+semua target dibuang, separuh terbaik lanjut ke ronde berikutnya dengan
+budget dua kali lipat. Satu job = satu kandidat x satu batch poin, dibagi
+ke beberapa process.
+"""
+import itertools
+import math
+import random
+
+import ai
+from constants import *
+from sim import Match
+
+# Grid kandidat (nilai per parameter get_ai_settings)
+CALIBRATION_GRID = {
+    'speed': (1.0, 1.4, 1.8, 2.2, 2.6, 3.0),
+    'prediction_error': (0.1, 0.3, 0.5, 0.7, 0.9),
+    'reaction_time': (0.2, 0.4, 0.6, 0.8),
+    'accuracy': (0.1, 0.4, 0.7, 1.0),
+}
+CALIBRATION_TARGETS = (0.2, 0.5, 0.8)  # win rate pertandingan AI: MUDAH, SEDANG, SULIT
+MAX_POINT_STEPS = SIM_RATE * 60        # poin yang terlalu lama dihitung seri (dibuang)
+
+# Pemain referensi
+REFERENCE_REACTION_STEPS = 15   # 0.25 detik
+REFERENCE_AIM_ERROR = 0.8       # simpangan bidikan (x PADDLE_HEIGHT) untuk bola di seberang lapangan
+REFERENCE_DEAD_ZONE = 4
+
+
+class ReferencePlayer:
+    """Pemain skrip untuk paddle kiri. RNG sendiri, jadi RNG match tidak terganggu."""
+
+    def __init__(self, seed=0):
+        self.rng = random.Random(seed)
+        self.history = []
+        self.aim_velocity = None
+        self.aim_error = 0.0
+
+    def reset(self):
+        self.history.clear()
+        self.aim_velocity = None
+
+    def move(self, match):
+        ball = match.ball
+        history = self.history
+        history.append((ball.x + BALL_RADIUS, ball.y + BALL_RADIUS, ball.vel_x, ball.vel_y))
+        if len(history) <= REFERENCE_REACTION_STEPS:
+            return 0.0
+        # Yang "terlihat" adalah bola beberapa step yang lalu
+        ball_x, ball_y, vel_x, vel_y = history.pop(0)
+        paddle_center = match.paddle_1.y + PADDLE_HEIGHT / 2
+        if vel_x < 0:
+            distance = ball_x - (PADDLE_1_X + PADDLE_WIDTH)
+            predicted = ball_y + vel_y * distance / -vel_x
+            # Pantulan dinding (tanpa batas jumlah)
+            predicted %= 2 * LOW_RES_HEIGHT
+            if predicted > LOW_RES_HEIGHT:
+                predicted = 2 * LOW_RES_HEIGHT - predicted
+            if (vel_x, vel_y) != self.aim_velocity:
+                # Bidikan baru tiap lintasan berubah
+                self.aim_velocity = (vel_x, vel_y)
+                spread = REFERENCE_AIM_ERROR * PADDLE_HEIGHT * max(0.0, distance) / LOW_RES_WIDTH
+                self.aim_error = self.rng.gauss(0.0, spread)
+            target = predicted + self.aim_error
+        else:
+            target = LOW_RES_HEIGHT / 2
+        diff = target - paddle_center
+        if diff > REFERENCE_DEAD_ZONE:
+            return PADDLE_SPEED
+        if diff < -REFERENCE_DEAD_ZONE:
+            return -PADDLE_SPEED
+        return 0.0
+
+
+def match_win_probability(p, target=WINNING_SCORE):
+    """Peluang menang pertandingan first-to-`target` jika peluang menang satu poin = p."""
+    q = 1.0 - p
+    return sum(math.comb(target - 1 + k, k) * p ** target * q ** k for k in range(target))
+
+
+def point_probability(match_rate, target=WINNING_SCORE):
+    """Kebalikan match_win_probability (bisection)."""
+    low, high = 0.0, 1.0
+    for _ in range(50):
+        mid = (low + high) / 2
+        if match_win_probability(mid, target) < match_rate:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def evaluate_candidate(job):
+    """Mainkan `points` poin AI (setting `settings`) vs pemain referensi.
+
+    Mengembalikan (index, poin AI, poin dimainkan). Dipanggil di worker
+    process; profil SEDANG diganti sementara dengan kandidat.
+    """
+    index, settings, seed, points = job
+    saved = ai.AI_PROFILES[DIFFICULTY_MEDIUM]
+    ai.AI_PROFILES[DIFFICULTY_MEDIUM] = settings
+    try:
+        player = ReferencePlayer(seed)
+        ai_points = played = 0
+        match_seed = seed
+        while played < points:
+            match = Match(MODE_VS_COMPUTER, DIFFICULTY_MEDIUM, seed=match_seed)
+            match.start()
+            match_seed += 1
+            while match.winner is None and played < points:
+                player.reset()
+                start = match.steps
+                while match.point_scored_by is None and match.steps - start < MAX_POINT_STEPS:
+                    match.step(SIM_DT, player.move(match), 0)
+                if match.point_scored_by is None:
+                    break  # rally tanpa akhir: lanjut ke pertandingan baru
+                played += 1
+                ai_points += match.point_scored_by == 2
+                if match.winner is None:
+                    match.next_round()
+        return index, ai_points, played
+    finally:
+        ai.AI_PROFILES[DIFFICULTY_MEDIUM] = saved
+
+
+def wilson_interval(wins, n, z=1.96):
+    if n == 0:
+        return 0.0, 1.0
+    p = wins / n
+    denominator = 1 + z * z / n
+    center = (p + z * z / (2 * n)) / denominator
+    half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denominator
+    return center - half, center + half
+
+
+def grid_candidates(grid=CALIBRATION_GRID):
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+
+def calibrate(targets=CALIBRATION_TARGETS, grid=CALIBRATION_GRID, points=16, rungs=5, seed=0, workers=1,
+              log=print):
+    """Successive halving. Mengembalikan list (target, setting, peluang poin AI, poin dinilai) per target."""
+    candidates = grid_candidates(grid)
+    point_targets = [point_probability(target) for target in targets]
+    wins = [0] * len(candidates)
+    played = [0] * len(candidates)
+    alive = list(range(len(candidates)))
+    pool = None
+    if workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers)
+    try:
+        for rung in range(rungs):
+            budget = points << rung
+            # Seed sama untuk semua kandidat di satu ronde (common random numbers)
+            rung_seed = seed + rung * 1000003
+            jobs = [(i, candidates[i], rung_seed, budget) for i in alive]
+            results = pool.imap_unordered(evaluate_candidate, jobs) if pool else map(evaluate_candidate, jobs)
+            for i, ai_points, n in results:
+                wins[i] += ai_points
+                played[i] += n
+
+            # Early stop: interval kepercayaan (plus margin) tidak memuat target mana pun
+            kept = []
+            for i in alive:
+                low, high = wilson_interval(wins[i], played[i])
+                if any(low - 0.05 <= t <= high + 0.05 for t in point_targets):
+                    kept.append(i)
+            # Separuh terbaik, dibagi rata per target (minimal dua kandidat per target)
+            per_target = max(2, len(alive) // (2 * len(targets)))
+            survivors = set()
+            for t in point_targets:
+                kept.sort(key=lambda i: abs(wins[i] / max(1, played[i]) - t))
+                survivors.update(kept[:per_target])
+            alive = sorted(survivors)
+            log("ronde %d: budget %d poin, %d kandidat lanjut" % (rung, budget, len(alive)))
+            if len(alive) <= 2 * len(targets):
+                break
+    finally:
+        if pool:
+            pool.close()
+
+    profiles = []
+    evaluated = [i for i in range(len(candidates)) if played[i]]
+    most = max(played[i] for i in evaluated)
+    for target, point_target in zip(targets, point_targets):
+        # Utamakan kandidat dengan sampel terbanyak (bertahan sampai ronde terakhir)
+        best = min(evaluated, key=lambda i: (played[i] < most / 2, abs(wins[i] / played[i] - point_target)))
+        profiles.append((target, candidates[best], wins[best] / played[best], played[best]))
+    return profiles
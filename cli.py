@@ -0,0 +1,546 @@
+"""Entry point command line Cozy Pong.
+
+    python cli.py play [--record FILE] [--fps 60|120|144|240|0] [--renderer software|gpu|auto] [--telemetry [DIR]]
+                        [--profile NAME] [--bloom] [--crt]
+    python cli.py simulate [--matches N] [--workers N] [--telemetry [DIR]]
+    python cli.py bench [--steps N] [--render [--max-blocks N_PER_FRAME] [--postfx]] [--glyphs]
+    python cli.py train [--generations N] [--population N] [--workers N] [--out FILE]
+    python cli.py calibrate [--targets 20,50,80] [--workers N] [--points N] [--rungs N]
+    python cli.py tables [--count 4|9|16] [--human] [--unfocused-divisor N] [--frames N]
+    python cli.py replay FILE
+    python cli.py stats [DIR]
+    python cli.py leaderboard [--top N] [--player NAME] [--db FILE]
+
+Modul game diimpor di dalam tiap subcommand, jadi simulate/bench/replay
+tidak pernah mengimpor atau menginisialisasi pygame (kecuali bench --render).
+"""
+import argparse
+import os
+import sys
+import time
+
+from constants import DISPLAY_BACKENDS, MODE_TWO_PLAYER, MODE_VS_COMPUTER, RENDER_RATES
+
+# adaptif tanpa model skill pemain (simulate/bench) = sedang
+DIFFICULTY_NAMES = {"mudah": 0, "sedang": 1, "sulit": 2, "adaptif": 3, "neural": 4}
+# Batas alokasi bersih bench --render; render yang di-cache terukur ~0.014 blok/frame
+MAX_BLOCKS_PER_FRAME = 0.05
+
+
+def _telemetry_dir(args):
+    """None jika --telemetry tidak dipakai, direktori default jika tanpa argumen."""
+    if args.telemetry is None:
+        return None
+    if args.telemetry:
+        return args.telemetry
+    from telemetry import TELEMETRY_DIR
+    return TELEMETRY_DIR
+
+
+def cmd_play(args):
+    import pingpong
+    pingpong.main(record_path=args.record, render_fps=args.fps, display_backend=args.renderer,
+                  telemetry_dir=_telemetry_dir(args), profile=args.profile, bloom=args.bloom, crt=args.crt)
+    return 0
+
+
+def cmd_tables(args):
+    if args.frames:
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from tables import run_tables
+    timings = run_tables(args.count, args.seed, args.human, args.fps, args.renderer, args.unfocused_divisor,
+                         args.frames)
+    if args.frames:
+        sim_time, render_time, present_time = timings
+        print("tables:       %d" % args.count)
+        print("simulasi:     %.3f ms/frame" % (sim_time * 1000))
+        print("render:       %.3f ms/frame" % (render_time * 1000))
+        print("present:      %.3f ms/frame" % (present_time * 1000))
+        print("total:        %.3f ms/frame" % (sum(timings) * 1000))
+    return 0
+
+
+def _simulate_one(job):
+    """Satu pertandingan AI vs AI (dipanggil di worker process)."""
+    from sim import Match, run_match
+    seed, difficulty, with_telemetry = job
+    match = Match(difficulty=difficulty, seed=seed, ai_sides=(1, 2))
+    rows = None
+    if with_telemetry:
+        from telemetry import match_end_row, match_event_rows, match_start_row
+        rows = [match_start_row(seed, match)]
+        steps = run_match(match, on_step=lambda m, events: rows.extend(match_event_rows(seed, m, events)))
+        rows.append(match_end_row(seed, match))
+    else:
+        steps = run_match(match)
+    return match.winner, match.score_1, match.score_2, steps, rows
+
+
+def cmd_simulate(args):
+    difficulty = DIFFICULTY_NAMES[args.difficulty]
+    telemetry_dir = _telemetry_dir(args)
+    writer = None
+    if telemetry_dir:
+        from telemetry import TelemetryWriter
+        writer = TelemetryWriter(telemetry_dir).start()
+    jobs = [(args.seed + i, difficulty, writer is not None) for i in range(args.matches)]
+    start = time.perf_counter()
+    if args.workers > 1:
+        import multiprocessing
+        with multiprocessing.Pool(args.workers) as pool:
+            results = pool.map(_simulate_one, jobs, chunksize=max(1, len(jobs) // (args.workers * 4)))
+    else:
+        results = [_simulate_one(job) for job in jobs]
+    elapsed = time.perf_counter() - start
+    if writer:
+        for result in results:
+            writer.emit_many(result[4])
+        writer.close()
+        print("telemetri:    %d baris, %d chunk %s di %s" % (writer.rows_written, writer.chunks, writer.format,
+                                                         telemetry_dir))
+
+    wins = {1: 0, 2: 0, None: 0}
+    total_steps = 0
+    total_points = 0
+    for winner, score_1, score_2, steps, _ in results:
+        wins[winner] += 1
+        total_steps += steps
+        total_points += score_1 + score_2
+    print("matches:      %d" % len(results))
+    print("wins P1/P2:   %d / %d (belum selesai: %d)" % (wins[1], wins[2], wins[None]))
+    print("avg points:   %.2f" % (total_points / max(1, len(results))))
+    print("avg frames:   %.1f" % (total_steps / max(1, len(results))))
+    print("time:         %.3fs (%.0f frame/s)" % (elapsed, total_steps / max(elapsed, 1e-9)))
+    return 0
+
+
+def bench_render(args):
+    """Render frame STATE_PLAY offscreen dan hitung alokasi bersih per frame."""
+    import gc
+    import os
+    import tracemalloc
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from assets import FONT_SPECS, resolve_font
+    from constants import (LOW_RES_WIDTH, LOW_RES_HEIGHT, BALL_RADIUS, PADDLE_1_X, PADDLE_2_X, PADDLE_WIDTH,
+                           PADDLE_HEIGHT, SIM_DT)
+    from particles import ParticleSystem
+    from render import GameRenderer
+    from sim import Match
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((1, 1))
+    fonts = {name: pygame.font.Font(*resolve_font(name)) for name in FONT_SPECS}
+    particles = ParticleSystem(seed=args.seed) if args.particles else None
+    renderer = GameRenderer(fonts["small"], fonts["medium"], particles=particles)
+    surface = pygame.Surface((LOW_RES_WIDTH, LOW_RES_HEIGHT))
+    match = Match(difficulty=DIFFICULTY_NAMES[args.difficulty], seed=args.seed, ai_sides=(1, 2))
+    match.start()
+    ball_rect = pygame.Rect(0, 0, BALL_RADIUS * 2, BALL_RADIUS * 2)
+    paddle_1_rect = pygame.Rect(PADDLE_1_X, 0, PADDLE_WIDTH, PADDLE_HEIGHT)
+    paddle_2_rect = pygame.Rect(PADDLE_2_X, 0, PADDLE_WIDTH, PADDLE_HEIGHT)
+    ball_trail = []
+
+    def frame(i):
+        match.step(SIM_DT)
+        if match.point_scored_by is not None:
+            if match.winner is not None:
+                match.start()
+            else:
+                match.next_round()
+        paddle_1_rect.y = int(match.paddle_1.y)
+        paddle_2_rect.y = int(match.paddle_2.y)
+        ball_rect.x = int(match.ball.x)
+        ball_rect.y = int(match.ball.y)
+        ball_trail.append(ball_rect.center)
+        if len(ball_trail) > int(8 + match.current_speed_multiplier * 2):
+            ball_trail.pop(0)
+        if particles is not None:
+            # Jaga jumlah partikel hidup sekitar --particles
+            if particles.count < args.particles:
+                particles.emit(ball_rect.centerx, ball_rect.centery, args.particles // 20,
+                               (255, 220, 100), speed=160, life=1.2)
+            particles.update(SIM_DT)
+        renderer.draw_play(surface, match, ball_rect, paddle_1_rect, paddle_2_rect, ball_trail,
+                      (i % 20) / 60, (i % 31) / 60, True, i * 16)
+
+    # Pemanasan: isi semua cache sprite/teks
+    for i in range(args.warmup):
+        frame(i)
+
+    collections = [0]
+
+    def on_gc(phase, info):
+        if phase == "start":
+            collections[0] += 1
+
+    gc.callbacks.append(on_gc)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    for i in range(args.frames):
+        frame(i)
+    elapsed = time.perf_counter() - start
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    gc.callbacks.remove(on_gc)
+
+    stats = after.compare_to(before, "filename")
+    # Abaikan alokasi milik tracemalloc sendiri
+    stats = [stat for stat in stats if "tracemalloc" not in str(stat.traceback)]
+    blocks = sum(stat.count_diff for stat in stats)
+    size = sum(stat.size_diff for stat in stats)
+    print("frames:       %d" % args.frames)
+    print("per frame:    %.1f us" % (elapsed / args.frames * 1e6))
+    print("net alloc:    %d blocks, %d bytes (%.3f blocks/frame)" % (blocks, size, blocks / args.frames))
+    print("gc runs:      %d" % collections[0])
+    if particles is not None:
+        print("particles:    %d hidup (numpy: %s)" % (particles.count, particles.enabled))
+
+    # Layar skor memakai layer statis yang di-cache
+    renderer.draw_score_screen(surface, match, ball_rect, paddle_1_rect, paddle_2_rect, True)
+    start = time.perf_counter()
+    for i in range(args.frames):
+        renderer.draw_score_screen(surface, match, ball_rect, paddle_1_rect, paddle_2_rect, True)
+    elapsed = time.perf_counter() - start
+    print("score screen: %.1f us/frame" % (elapsed / args.frames * 1e6))
+    if args.postfx:
+        bench_postfx(args, surface)
+    if blocks > args.max_blocks * args.frames:
+        print("FAIL: alokasi bersih %.3f blok/frame > batas %s" % (blocks / args.frames, args.max_blocks))
+        return 1
+    return 0
+
+
+def bench_postfx(args, surface):
+    """Biaya per frame tiap efek postfx, diukur terpisah."""
+    import pygame
+    from postfx import Bloom, build_crt_mask
+    from constants import LOW_RES_WIDTH
+
+    bloom = Bloom()
+    frame = surface.copy()
+    for _ in range(50):
+        frame.blit(surface, (0, 0))
+        bloom.apply(frame)
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        frame.blit(surface, (0, 0))
+        bloom.apply(frame)
+    elapsed = time.perf_counter() - start
+    print("bloom:        %.3f ms/frame" % (elapsed / args.frames * 1000))
+
+    output = tuple(int(n) for n in args.output.split("x"))
+    screen = pygame.Surface(output)
+    start = time.perf_counter()
+    mask = build_crt_mask(output, output[0] / LOW_RES_WIDTH)
+    print("crt mask:     %.1f ms (sekali per resolusi output)" % ((time.perf_counter() - start) * 1000))
+    start = time.perf_counter()
+    for _ in range(args.frames):
+        screen.blit(mask, (0, 0), special_flags=pygame.BLEND_MULT)
+    elapsed = time.perf_counter() - start
+    print("crt %-9s %.3f ms/frame" % (args.output + ":", elapsed / args.frames * 1000))
+
+
+def bench_glyphs(args):
+    """Atlas glyph vs font.render: cek identik per pixel lalu ukur string HUD pendek."""
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    import pygame
+    from assets import FONT_SPECS, METRIC_CHARS, resolve_font
+    from constants import COLOR_SHADOW, COLOR_TEXT, LOW_RES_HEIGHT, LOW_RES_WIDTH
+    from glyphs import draw_bitmap_text
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((1, 1))
+    expected = pygame.Surface((LOW_RES_WIDTH * 2, LOW_RES_HEIGHT))
+    actual = pygame.Surface((LOW_RES_WIDTH * 2, LOW_RES_HEIGHT))
+    samples = ([METRIC_CHARS[i:i + 16] for i in range(0, len(METRIC_CHARS), 16)]
+               + ["%d" % n for n in range(100)] + ["Speed: %.1fx" % (1 + n / 10) for n in range(16)]
+               + ["Koin: %d" % n for n in (0, 7, 95, 120, 1234)])
+    center = (LOW_RES_WIDTH, LOW_RES_HEIGHT // 2)
+    failures = 0
+    for name in FONT_SPECS:
+        font = pygame.font.Font(*resolve_font(name))
+        mismatched = 0
+        for text in samples:
+            expected.fill((40, 30, 45))
+            shadow = font.render(text, False, COLOR_SHADOW)
+            main = font.render(text, False, COLOR_TEXT)
+            expected.blit(shadow, shadow.get_rect(center=(center[0] + 1, center[1] + 1)))
+            expected.blit(main, main.get_rect(center=center))
+            actual.fill((40, 30, 45))
+            draw_bitmap_text(actual, text, font, COLOR_TEXT, COLOR_SHADOW, *center)
+            if pygame.image.tobytes(expected, "RGB") != pygame.image.tobytes(actual, "RGB"):
+                mismatched += 1
+        failures += mismatched
+
+        # Pola HUD: teks + bayangan, nilai berubah tiap kali (tanpa cache per string)
+        for label, texts in (("0-99", ["%d" % n for n in range(100)]),
+                             ("Speed", ["Speed: %.1fx" % (1 + n / 10) for n in range(16)])):
+            start = time.perf_counter()
+            for _ in range(20):
+                for text in texts:
+                    shadow = font.render(text, False, COLOR_SHADOW)
+                    main = font.render(text, False, COLOR_TEXT)
+                    actual.blit(shadow, shadow.get_rect(center=(center[0] + 1, center[1] + 1)))
+                    actual.blit(main, main.get_rect(center=center))
+            render_time = (time.perf_counter() - start) / (20 * len(texts))
+            start = time.perf_counter()
+            for _ in range(20):
+                for text in texts:
+                    draw_bitmap_text(actual, text, font, COLOR_TEXT, COLOR_SHADOW, *center)
+            atlas_time = (time.perf_counter() - start) / (20 * len(texts))
+            print("%-7s %-6s identik %d/%d  font.render %5.1f us  atlas %5.1f us  (%.1fx)" % (
+                name, label, len(samples) - mismatched, len(samples), render_time * 1e6, atlas_time * 1e6,
+                render_time / atlas_time))
+    return 1 if failures else 0
+
+
+def cmd_bench(args):
+    if args.glyphs:
+        return bench_glyphs(args)
+    if args.render:
+        return bench_render(args)
+    from constants import SIM_DT
+    from sim import Match
+    match = Match(difficulty=DIFFICULTY_NAMES[args.difficulty], seed=args.seed, ai_sides=(1, 2))
+    match.start()
+    dt = SIM_DT
+    start = time.perf_counter()
+    for _ in range(args.steps):
+        match.step(dt)
+        if match.point_scored_by is not None:
+            if match.winner is not None:
+                match.start()
+            else:
+                match.next_round()
+    elapsed = time.perf_counter() - start
+    print("steps:        %d" % args.steps)
+    print("time:         %.3fs" % elapsed)
+    print("per step:     %.2f us" % (elapsed / args.steps * 1e6))
+    print("pygame loaded: %s" % ("pygame" in sys.modules))
+    return 0
+
+
+def cmd_train(args):
+    """Latih policy MLP (nnpolicy.py) dengan evolution strategies melawan AI heuristik."""
+    from nnpolicy import POLICY_PATH, evaluate_population, load_policy, np, save_policy, train
+    if np is None:
+        print("train butuh NumPy")
+        return 1
+    path = args.out or POLICY_PATH
+    opponent = DIFFICULTY_NAMES[args.opponent]
+    initial = None
+    if args.resume:
+        policy = load_policy(path)
+        initial = policy.params if policy else None
+    start = time.perf_counter()
+    params = train(args.generations, args.population, args.episodes, args.sigma, args.lr, opponent,
+                   args.seed, args.workers, initial)
+    elapsed = time.perf_counter() - start
+    save_policy(params, path, opponent=opponent, generations=args.generations)
+    # Evaluasi di seed baru melawan tiap difficulty heuristik
+    seeds = list(range(10 ** 6, 10 ** 6 + args.eval_episodes))
+    for name in ("mudah", "sedang", "sulit"):
+        fitness = evaluate_population((params[None, :], seeds, DIFFICULTY_NAMES[name]))
+        print("vs %-7s fitness rata-rata %+.3f" % (name, fitness[0]))
+    print("bobot:        %s" % path)
+    print("time:         %.1fs" % elapsed)
+    return 0
+
+
+def cmd_calibrate(args):
+    """Cari setting AI per difficulty yang mencapai target win rate vs pemain referensi."""
+    import json
+    from calibrate import calibrate, grid_candidates, match_win_probability
+    targets = [float(value) / 100 for value in args.targets.split(",")]
+    workers = args.workers or os.cpu_count() or 1
+    print("kandidat:     %d, workers: %d" % (len(grid_candidates()), workers))
+    start = time.perf_counter()
+    profiles = calibrate(targets, points=args.points, rungs=args.rungs, seed=args.seed, workers=workers)
+    elapsed = time.perf_counter() - start
+    print("target  win rate AI (poin / pertandingan)  sampel  setting")
+    for target, settings, point_rate, samples in profiles:
+        print("%5.0f%%  %6.1f%% / %5.1f%%                  %6d  %s" % (
+            target * 100, point_rate * 100, match_win_probability(point_rate) * 100, samples,
+            json.dumps(settings)))
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump([{"target": target, "settings": settings, "point_rate": point_rate, "samples": samples}
+                       for target, settings, point_rate, samples in profiles], f, indent=2)
+        print("profil:       %s" % args.out)
+    print("time:         %.1fs" % elapsed)
+    return 0
+
+
+def cmd_replay(args):
+    from replay import load_replay, play_back
+    seed, mode, difficulty, sim_rate, records = load_replay(args.file)
+    start = time.perf_counter()
+    match = play_back(seed, mode, difficulty, sim_rate, records)
+    elapsed = time.perf_counter() - start
+    print("frames:       %d" % match.steps)
+    print("score:        %d - %d" % (match.score_1, match.score_2))
+    print("winner:       %s" % ("P%d" % match.winner if match.winner else "-"))
+    print("time:         %.3fs" % elapsed)
+    return 0
+
+
+def cmd_stats(args):
+    from telemetry import TELEMETRY_DIR, aggregate, read_chunks
+    start = time.perf_counter()
+    balance, skins = aggregate(read_chunks(args.dir or TELEMETRY_DIR))
+    elapsed = time.perf_counter() - start
+    mode_names = {MODE_TWO_PLAYER: "2P", MODE_VS_COMPUTER: "VS"}
+    difficulty_names = {value: name for name, value in DIFFICULTY_NAMES.items()}
+    print("mode difficulty  matches  P1 win   rallies  avg rally  hits/rally  |offset|")
+    for (mode, difficulty), stats in sorted(balance.items()):
+        rallies = max(1, stats["rallies"])
+        print("%-4s %-10s %8d  %5.1f%%  %8d  %8.2fs  %10.2f  %8.3f" % (
+            mode_names.get(mode, mode), difficulty_names.get(difficulty, difficulty), stats["matches"],
+            100.0 * stats["p1_wins"] / max(1, stats["matches"]), stats["rallies"], stats["rally_time"] / rallies,
+            stats["hits"] / rallies, stats["offset_sum"] / max(1, stats["hits"])))
+    if skins:
+        print("skin populer:")
+        for name, count in sorted(skins.items(), key=lambda item: -item[1]):
+            print("  %-20s %d" % (name, count))
+    print("time:         %.3fs" % elapsed)
+    return 0
+
+
+def cmd_leaderboard(args):
+    from leaderboard import LEADERBOARD_PATH, connect, player_history, top_players
+    conn = connect(args.db or LEADERBOARD_PATH)
+    try:
+        start = time.perf_counter()
+        rows = top_players(conn, args.top)
+        top_time = time.perf_counter() - start
+        print("rank pemain               rating  menang  main")
+        for rank, (name, kind, rating, matches, wins) in enumerate(rows, 1):
+            print("%4d %-20s %7.1f  %6d  %4d" % (rank, name, rating, wins, matches))
+        print("query top:     %.3f ms" % (top_time * 1000))
+        if args.player:
+            start = time.perf_counter()
+            history = player_history(conn, args.player, args.top)
+            history_time = time.perf_counter() - start
+            print("riwayat %s:" % args.player)
+            for played_at, opponent, own, other, won, rating in history:
+                print("  %s  %-6s %d-%d vs %-20s %7.1f" % (
+                    time.strftime("%Y-%m-%d %H:%M", time.localtime(played_at)), "MENANG" if won else "KALAH",
+                    own, other, opponent, rating))
+            print("query riwayat: %.3f ms" % (history_time * 1000))
+    finally:
+        conn.close()
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="cozypong", description="Cozy Pixel Pong")
+    sub = parser.add_subparsers(dest="command")
+
+    play = sub.add_parser("play", help="main game (default)")
+    play.add_argument("--record", metavar="FILE", help="rekam input pertandingan ke file replay")
+    play.add_argument("--fps", type=int, choices=RENDER_RATES, default=60,
+                      help="batas FPS render, 0 = tanpa batas (simulasi tetap 60 step/detik)")
+    play.add_argument("--renderer", choices=DISPLAY_BACKENDS, default="software",
+                      help="gpu/auto: upscale lewat pygame._sdl2 Renderer (auto jatuh ke software jika gagal)")
+    play.add_argument("--telemetry", nargs="?", const="", metavar="DIR",
+                      help="tulis telemetri event pertandingan (default ~/.cache/cozypong/telemetry)")
+    play.add_argument("--profile", default="player",
+                      help="profil pemain untuk model skill AI adaptif (~/.cache/cozypong/profiles.json)")
+    play.add_argument("--bloom", action="store_true", help="efek bloom untuk bola, glow, dan power up (butuh NumPy)")
+    play.add_argument("--crt", action="store_true", help="overlay scanline dan vignette CRT (butuh NumPy)")
+    play.set_defaults(func=cmd_play)
+
+    simulate = sub.add_parser("simulate", help="pertandingan AI vs AI tanpa layar")
+    simulate.add_argument("--matches", type=int, default=100)
+    simulate.add_argument("--difficulty", choices=sorted(DIFFICULTY_NAMES), default="sedang")
+    simulate.add_argument("--seed", type=int, default=0)
+    simulate.add_argument("--workers", type=int, default=1)
+    simulate.add_argument("--telemetry", nargs="?", const="", metavar="DIR",
+                          help="tulis telemetri tiap pertandingan (default ~/.cache/cozypong/telemetry)")
+    simulate.set_defaults(func=cmd_simulate)
+
+    bench = sub.add_parser("bench", help="ukur kecepatan step fisika")
+    bench.add_argument("--steps", type=int, default=100000)
+    bench.add_argument("--difficulty", choices=sorted(DIFFICULTY_NAMES), default="sedang")
+    bench.add_argument("--seed", type=int, default=0)
+    bench.add_argument("--render", action="store_true",
+                       help="ukur render STATE_PLAY (alokasi via tracemalloc) alih-alih fisika")
+    bench.add_argument("--frames", type=int, default=2000)
+    bench.add_argument("--warmup", type=int, default=3000)
+    bench.add_argument("--particles", type=int, default=0,
+                       help="jaga sekitar N partikel hidup selama bench --render")
+    bench.add_argument("--max-blocks", type=float, default=MAX_BLOCKS_PER_FRAME,
+                       help="gagal (exit 1) jika alokasi bersih bench --render melebihi N blok per frame "
+                            "(default %(default)s; terukur ~0.014)")
+    bench.add_argument("--postfx", action="store_true",
+                       help="ukur juga biaya bloom dan overlay CRT (--output WxH) per frame")
+    bench.add_argument("--output", default="1280x960", help="resolusi output untuk bench overlay CRT")
+    bench.add_argument("--glyphs", action="store_true",
+                       help="cek atlas glyph identik dengan font.render (antialias mati) dan ukur kecepatannya")
+    bench.set_defaults(func=cmd_bench)
+
+    train = sub.add_parser("train", help="latih AI neural (evolution strategies, butuh NumPy)")
+    train.add_argument("--generations", type=int, default=60)
+    train.add_argument("--population", type=int, default=32, help="jumlah kandidat per generasi (genap)")
+    train.add_argument("--episodes", type=int, default=8, help="ronde per kandidat per generasi")
+    train.add_argument("--sigma", type=float, default=0.1)
+    train.add_argument("--lr", type=float, default=0.05)
+    train.add_argument("--opponent", choices=["mudah", "sedang", "sulit"], default="sulit")
+    train.add_argument("--seed", type=int, default=0)
+    train.add_argument("--workers", type=int, default=1)
+    train.add_argument("--eval-episodes", type=int, default=100)
+    train.add_argument("--out", default=None, help="file .npz (default models/ai_mlp.npz)")
+    train.add_argument("--resume", action="store_true", help="lanjutkan dari bobot di --out")
+    train.set_defaults(func=cmd_train)
+
+    calibrate = sub.add_parser("calibrate", help="kalibrasi profil AI (ai.AI_PROFILES) vs pemain referensi")
+    calibrate.add_argument("--targets", default="20,50,80", help="win rate pertandingan AI dalam persen")
+    calibrate.add_argument("--workers", type=int, default=0, help="jumlah process (default semua core)")
+    calibrate.add_argument("--points", type=int, default=16, help="budget poin per kandidat di ronde pertama")
+    calibrate.add_argument("--rungs", type=int, default=5, help="jumlah ronde successive halving")
+    calibrate.add_argument("--seed", type=int, default=0)
+    calibrate.add_argument("--out", metavar="FILE", help="tulis profil hasil ke file JSON")
+    calibrate.set_defaults(func=cmd_calibrate)
+
+    tables = sub.add_parser("tables", help="mode turnamen: 4/9/16 pertandingan AI dalam grid di satu layar")
+    tables.add_argument("--count", type=int, choices=(4, 9, 16), default=4)
+    tables.add_argument("--human", action="store_true", help="paddle kiri meja 1 dimainkan pemain (W/S)")
+    tables.add_argument("--fps", type=int, choices=RENDER_RATES, default=60)
+    tables.add_argument("--renderer", choices=DISPLAY_BACKENDS, default="software")
+    tables.add_argument("--unfocused-divisor", type=int, default=4,
+                        help="meja yang tidak difokus digambar tiap N frame (1 = semua tiap frame)")
+    tables.add_argument("--seed", type=int, default=0)
+    tables.add_argument("--frames", type=int, default=None,
+                        help="berhenti setelah N frame (tanpa layar) dan cetak waktu per frame")
+    tables.set_defaults(func=cmd_tables)
+
+    replay = sub.add_parser("replay", help="jalankan ulang file replay tanpa layar")
+    replay.add_argument("file")
+    replay.set_defaults(func=cmd_replay)
+
+    stats = sub.add_parser("stats", help="ringkas telemetri: keseimbangan difficulty, skin populer")
+    stats.add_argument("dir", nargs="?", help="direktori telemetri (default ~/.cache/cozypong/telemetry)")
+    stats.set_defaults(func=cmd_stats)
+
+    leaderboard = sub.add_parser("leaderboard", help="tampilkan rating Elo dan riwayat pertandingan")
+    leaderboard.add_argument("--top", type=int, default=10)
+    leaderboard.add_argument("--player", metavar="NAME", help="tampilkan juga riwayat pemain ini")
+    leaderboard.add_argument("--db", metavar="FILE", help="database (default ~/.cache/cozypong/leaderboard.db)")
+    leaderboard.set_defaults(func=cmd_leaderboard)
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.command is None:
+        args = parser.parse_args(["play"] + (argv if argv is not None else sys.argv[1:]))
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
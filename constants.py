@@ -0,0 +1,94 @@
+"""Konstanta game, dipakai bersama oleh game dan simulasi headless (tanpa pygame)."""
+
+# Resolusi rendah internal untuk efek pixel art
+LOW_RES_WIDTH = 320
+LOW_RES_HEIGHT = 240
+
+# Warna Cozy Pixel (RGB)
+COLOR_BACKGROUND_DARK = (40, 30, 45)    # Ungu tua hangat
+COLOR_BACKGROUND_LIGHT = (65, 50, 70)   # Ungu sedikit lebih terang
+COLOR_PADDLE = (230, 200, 170)         # Krem hangat
+COLOR_BALL = (255, 160, 122)           # Oranye salmon muda (LightSalmon)
+COLOR_TEXT = (240, 230, 220)           # Putih gading
+COLOR_ACCENT = (255, 180, 100)         # Oranye aksen
+COLOR_SHADOW = (30, 20, 35)            # Bayangan tipis
+COLOR_SELECTED = (255, 220, 150)       # Warna untuk opsi yang dipilih
+COLOR_AI_PADDLE = (180, 220, 255)      # Biru muda untuk paddle AI
+
+# Konstanta Game
+PADDLE_WIDTH = 4
+PADDLE_HEIGHT = 40  
+BALL_RADIUS = 4     
+PADDLE_SPEED = 2.5  
+BALL_SPEED_X_INITIAL = 1.5
+BALL_SPEED_Y_INITIAL = 1.5
+WINNING_SCORE = 5
+
+# Konstanta AI yang diperbaiki
+AI_SPEED = 2.2  # Kecepatan AI sedikit lebih cepat
+AI_PREDICTION_ERROR = 0.12  # Tingkat kesalahan prediksi AI
+AI_REACTION_TIME = 0.15  # Waktu reaksi AI dalam detik
+AI_DIFFICULTY_ADAPTIVE = True  # AI menyesuaikan tingkat kesulitan
+AI_ADAPTIVE_RANGE = 0.5  # Batas difficulty adjustment AI adaptif (+-)
+
+# Konstanta untuk peningkatan kecepatan
+SPEED_INCREASE_INTERVAL = 3.0  # Detik
+SPEED_INCREASE_AMOUNT = 0.1    # Multiplier peningkatan kecepatan (lebih bertahap)
+MAX_SPEED_MULTIPLIER = 2.5     # Batas maksimum kecepatan
+
+# Game States
+STATE_MAIN_MENU = 0
+STATE_START = 1
+STATE_PLAY = 2
+STATE_SCORE_SCREEN = 3
+STATE_GAME_OVER = 4
+STATE_DIFFICULTY_SELECT = 5
+STATE_SHOP = 6
+STATE_LEADERBOARD = 7
+
+# Game Modes
+MODE_TWO_PLAYER = 0
+MODE_VS_COMPUTER = 1
+
+# AI Difficulty Levels
+DIFFICULTY_EASY = 0
+DIFFICULTY_MEDIUM = 1
+DIFFICULTY_HARD = 2
+DIFFICULTY_ADAPTIVE = 3  # Setting SEDANG, digeser terus-menerus oleh skill pemain (skill.py)
+DIFFICULTY_NEURAL = 4    # Policy MLP hasil training (nnpolicy.py); butuh NumPy + models/ai_mlp.npz
+
+# Power up
+POWERUP_SIZE = 14
+POWERUP_TYPES = [
+    {"type": "slow", "color": (100,255,255)},
+    {"type": "shield", "color": (255,255,100)}
+]
+POWERUP_DURATION = 6.0  # detik
+POWERUP_SPAWN_MEAN = 2.0  # rata-rata detik sampai power up muncul
+POWERUP_LIFETIME = (8, 15)  # detik sebelum power up hilang jika tidak diambil
+
+# Posisi awal paddle dan bola
+PADDLE_1_X = 15
+PADDLE_2_X = LOW_RES_WIDTH - 15 - PADDLE_WIDTH
+PADDLE_START_Y = LOW_RES_HEIGHT // 2 - PADDLE_HEIGHT // 2
+BALL_START_X = LOW_RES_WIDTH // 2 - BALL_RADIUS
+BALL_START_Y = LOW_RES_HEIGHT // 2 - BALL_RADIUS
+
+# Simulasi berjalan di rate tetap; render boleh lebih cepat (diinterpolasi)
+SIM_RATE = 60                 # step per detik
+SIM_DT = 1.0 / SIM_RATE
+MAX_FRAME_TIME = 0.25         # batas dt satu frame render (mis. setelah window di-drag)
+
+# Frame pacing (0 = tanpa batas)
+RENDER_RATES = (60, 120, 144, 240, 0)
+TARGET_FPS = 60
+DISPLAY_BACKENDS = ("software", "gpu", "auto")  # lihat display.py
+IDLE_WAIT_MS = 500          # Batas tidur di menu statis sebelum bangun sendiri
+IDLE_WAIT_LOADING_MS = 50   # Selama font masih dimuat di background
+ATTRACT_DELAY_MS = 8000     # Menu utama tanpa input selama ini -> demo AI vs AI di belakang menu
+
+# Durasi efek visual (detik)
+SCREEN_SHAKE_HIT = 5 / 60
+SCREEN_SHAKE_SPEED_UP = 3 / 60
+BALL_GLOW_DURATION = 0.25
+SPEED_UP_EFFECT_DURATION = 0.5
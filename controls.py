@@ -0,0 +1,144 @@
+"""Lapisan input: event keyboard/joystick bercap waktu dan state per tick.
+
+Event diberi cap waktu (time.perf_counter) saat diterima. `wait_events`
+menggantikan tidur clock.tick: loop menunggu event sampai batas frame, jadi
+cap waktunya akurat sampai ~1 ms walau render 60 FPS. Untuk tiap tick
+simulasi, `sample()` menghitung rata-rata input paddle selama jendela waktu
+tick itu, jadi tombol yang ditekan di tengah tick hanya berlaku sebagian.
+"""
+import time
+from collections import deque
+
+import pygame
+
+JOYSTICK_DEADZONE = 0.15
+JOYSTICK_AXIS = 1  # stik kiri, sumbu vertikal
+
+PADDLE_KEYS = {
+    1: {pygame.K_w: "up", pygame.K_s: "down"},
+    2: {pygame.K_UP: "up", pygame.K_DOWN: "down"},
+}
+
+
+def apply_deadzone(value, deadzone=JOYSTICK_DEADZONE):
+    """Nol di dalam deadzone, lalu diskalakan ulang supaya tetap mencapai +-1."""
+    if abs(value) <= deadzone:
+        return 0.0
+    sign = 1.0 if value > 0 else -1.0
+    return sign * min(1.0, (abs(value) - deadzone) / (1.0 - deadzone))
+
+
+class PaddleInput:
+    """State input satu paddle: tombol yang ditahan, sumbu analog, dan hat (d-pad)."""
+
+    def __init__(self):
+        self.up = False
+        self.down = False
+        self.axis = 0.0
+        self.hat = 0
+        # Event yang belum dipakai tick simulasi: (waktu, field, nilai)
+        self.pending = deque()
+
+    def value(self):
+        """Arah saat ini, -1 (atas) .. 1 (bawah)."""
+        # Menahan W dan S bersamaan saling meniadakan; melepas salah satunya
+        # tidak menghentikan yang lain
+        total = (self.down - self.up) + self.axis + self.hat
+        return max(-1.0, min(1.0, total))
+
+    def sample(self, t0, t1):
+        """Rata-rata `value()` selama [t0, t1); event sampai t1 diterapkan."""
+        pending = self.pending
+        if not pending or pending[0][0] >= t1:
+            return self.value()
+        total = 0.0
+        current = t0
+        while pending and pending[0][0] < t1:
+            stamp, field, value = pending.popleft()
+            # Event yang lebih tua dari jendela ini berlaku sejak t0
+            stamp = max(stamp, t0)
+            total += self.value() * (stamp - current)
+            setattr(self, field, value)
+            current = stamp
+        total += self.value() * (t1 - current)
+        return total / (t1 - t0)
+
+    def reset(self):
+        self.up = self.down = False
+        self.axis = 0.0
+        self.hat = 0
+        self.pending.clear()
+
+
+class InputManager:
+    """Menerima semua event input dan menyimpannya per paddle dengan cap waktu."""
+
+    def __init__(self):
+        self.paddles = {1: PaddleInput(), 2: PaddleInput()}
+        # instance_id -> (Joystick, sisi paddle)
+        self.joysticks = {}
+
+    def wait_events(self, deadline):
+        """Kumpulkan event sampai `deadline` (perf_counter). Mengembalikan [(waktu, event)]."""
+        events = []
+        while True:
+            for event in pygame.event.get():
+                events.append((time.perf_counter(), event))
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0.001:
+                break
+            event = pygame.event.wait(int(remaining * 1000))
+            if event.type != pygame.NOEVENT:
+                events.append((time.perf_counter(), event))
+        return events
+
+    def handle_event(self, event, stamp):
+        """Catat event keyboard/joystick yang relevan untuk paddle."""
+        if event.type in (pygame.KEYDOWN, pygame.KEYUP):
+            pressed = event.type == pygame.KEYDOWN
+            for side, keys in PADDLE_KEYS.items():
+                field = keys.get(event.key)
+                if field is not None:
+                    self.paddles[side].pending.append((stamp, field, pressed))
+        elif event.type == pygame.JOYAXISMOTION:
+            side = self._joystick_side(event.instance_id)
+            if side is not None and event.axis == JOYSTICK_AXIS:
+                self.paddles[side].pending.append((stamp, "axis", apply_deadzone(event.value)))
+        elif event.type == pygame.JOYHATMOTION:
+            side = self._joystick_side(event.instance_id)
+            if side is not None:
+                # Hat y positif = atas, di layar y positif = bawah
+                self.paddles[side].pending.append((stamp, "hat", -event.value[1]))
+        elif event.type == pygame.JOYDEVICEADDED:
+            self.add_joystick(event.device_index)
+        elif event.type == pygame.JOYDEVICEREMOVED:
+            joystick = self.joysticks.pop(event.instance_id, None)
+            if joystick is not None:
+                paddle = self.paddles[joystick[1]]
+                paddle.pending.append((stamp, "axis", 0.0))
+                paddle.pending.append((stamp, "hat", 0))
+
+    def add_joystick(self, device_index):
+        """Pasang joystick ke paddle pertama yang belum punya joystick."""
+        try:
+            joystick = pygame.joystick.Joystick(device_index)
+        except pygame.error:
+            return None
+        used = {side for _, side in self.joysticks.values()}
+        for side in (1, 2):
+            if side not in used:
+                self.joysticks[joystick.get_instance_id()] = (joystick, side)
+                return side
+        return None
+
+    def _joystick_side(self, instance_id):
+        joystick = self.joysticks.get(instance_id)
+        return joystick[1] if joystick is not None else None
+
+    def sample(self, side, t0, t1):
+        return self.paddles[side].sample(t0, t1)
+
+    def discard_until(self, stamp):
+        """Terapkan event sampai `stamp` tanpa dihitung ke tick mana pun (mis. di luar gameplay)."""
+        for paddle in self.paddles.values():
+            paddle.sample(stamp, stamp + 1e-9)
@@ -0,0 +1,118 @@
+"""Backend tampilan: menampilkan game_surface 320x240 (atau grid meja) ke layar penuh.
+
+SoftwareDisplay: scale di CPU lalu flip (cara lama, selalu tersedia).
+GpuDisplay: pygame._sdl2.video Renderer dengan logical size 320x240. Upscale,
+offset getar layar, dan present dikerjakan renderer SDL: GPU jika ada,
+renderer software SDL jika tidak.
+
+Keduanya bisa menumpuk overlay CRT (postfx.build_crt_mask) di resolusi
+output; mask dibuat sekali saat diaktifkan.
+"""
+import pygame
+
+from constants import *
+
+SDL_BLENDMODE_MOD = 4  # SDL_BlendMode: dst = src * dst
+
+
+class SoftwareDisplay:
+    name = "software"
+
+    def __init__(self, caption, size=(LOW_RES_WIDTH, LOW_RES_HEIGHT)):
+        # Mendapatkan info display
+        display_info = pygame.display.Info()
+        screen_width = display_info.current_w
+        screen_height = display_info.current_h
+
+        # Buat screen fullscreen
+        self.screen = pygame.display.set_mode((screen_width, screen_height), pygame.FULLSCREEN)
+        pygame.display.set_caption(caption)
+
+        # Hitung scale factor untuk maintain aspect ratio
+        self.size = size
+        scale_x = screen_width / size[0]
+        scale_y = screen_height / size[1]
+        self.scale_factor = min(scale_x, scale_y)  # Gunakan yang terkecil untuk maintain aspect ratio
+
+        # Hitung posisi untuk center game
+        self.scaled_size = (int(size[0] * self.scale_factor), int(size[1] * self.scale_factor))
+        self.offset_x = (screen_width - self.scaled_size[0]) // 2
+        self.offset_y = (screen_height - self.scaled_size[1]) // 2
+        self.crt_mask = None
+
+    def set_crt(self, enabled):
+        if enabled:
+            from postfx import build_crt_mask
+            self.crt_mask = build_crt_mask(self.scaled_size, self.scale_factor)
+        else:
+            self.crt_mask = None
+
+    def present(self, surface, shake_x=0, shake_y=0):
+        """Tampilkan frame; offset getar dalam pixel resolusi rendah."""
+        screen = self.screen
+        # Bersihkan layar dengan warna hitam
+        screen.fill((0, 0, 0))
+        scaled_surface = pygame.transform.scale(surface, self.scaled_size)
+        final_x = self.offset_x + (shake_x * int(self.scale_factor))
+        final_y = self.offset_y + (shake_y * int(self.scale_factor))
+        screen.blit(scaled_surface, (final_x, final_y))
+        if self.crt_mask is not None:
+            # Mask menempel di "kaca" layar, tidak ikut bergetar
+            screen.blit(self.crt_mask, (self.offset_x, self.offset_y), special_flags=pygame.BLEND_MULT)
+        pygame.display.flip()
+
+
+class GpuDisplay:
+    name = "gpu"
+
+    def __init__(self, caption, size=(LOW_RES_WIDTH, LOW_RES_HEIGHT)):
+        # Modul privat pygame; diimpor di sini supaya kegagalannya bisa ditangkap
+        from pygame._sdl2.video import Renderer, Texture, Window
+
+        self.window = Window(caption, fullscreen_desktop=True)
+        # accelerated=-1: pakai driver pertama yang tersedia (GPU, lalu software)
+        self.renderer = Renderer(self.window, accelerated=-1)
+        # SDL menskalakan frame (320x240) ke layar dengan aspect ratio tetap (letterbox)
+        self.size = size
+        self.renderer.logical_size = size
+        self.texture = Texture(self.renderer, size, streaming=True)
+        self.dest = pygame.Rect((0, 0), size)
+        self.crt_texture = None
+
+    def set_crt(self, enabled):
+        self.crt_texture = None
+        if enabled:
+            from pygame._sdl2.video import Texture
+            from postfx import build_crt_mask
+            # Mask seukuran area letterbox di layar; renderer menggambarnya tanpa diperkecil
+            width, height = self.window.size
+            scale = min(width / self.size[0], height / self.size[1])
+            mask = build_crt_mask((int(self.size[0] * scale), int(self.size[1] * scale)), scale)
+            self.crt_texture = Texture.from_surface(self.renderer, mask)
+            self.crt_texture.blend_mode = SDL_BLENDMODE_MOD
+        self.crt_dest = pygame.Rect((0, 0), self.size)
+
+    def present(self, surface, shake_x=0, shake_y=0):
+        """Upload frame ke texture, lalu renderer yang menskalakan dan menggeser."""
+        renderer = self.renderer
+        self.texture.update(surface)
+        self.dest.x = shake_x
+        self.dest.y = shake_y
+        renderer.draw_color = (0, 0, 0, 255)
+        renderer.clear()
+        renderer.blit(self.texture, self.dest)
+        if self.crt_texture is not None:
+            renderer.blit(self.crt_texture, self.crt_dest)
+        renderer.present()
+
+
+def create_display(backend="software", caption="Cozy Pixel Pong", size=(LOW_RES_WIDTH, LOW_RES_HEIGHT)):
+    """Buat backend tampilan untuk frame berukuran `size`. "auto" mencoba GPU lalu jatuh ke software."""
+    if backend in ("gpu", "auto"):
+        try:
+            return GpuDisplay(caption, size)
+        except (ImportError, pygame.error) as e:
+            if backend == "gpu":
+                raise
+            print("Renderer SDL tidak tersedia (%s), menggunakan software." % e)
+    return SoftwareDisplay(caption, size)
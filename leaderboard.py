@@ -0,0 +1,223 @@
+"""Leaderboard lokal: hasil pertandingan dan rating Elo di SQLite (tanpa pygame).
+
+Pemain manusia (per profil) dan AI (per difficulty) sama-sama punya rating.
+Game memanggil `record()`, yang hanya memasukkan hasil ke antrean; thread
+writer menulisnya per batch dalam satu transaksi dan sekaligus menghitung
+rating baru, jadi game loop tidak pernah menunggu disk. Database memakai
+mode WAL supaya layar leaderboard bisa membaca sambil writer menulis.
+Query top-N dan riwayat pemain memakai index, jadi tetap di bawah satu
+milidetik untuk ratusan ribu pertandingan.
+"""
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+from constants import *
+
+LEADERBOARD_PATH = os.path.join(os.path.expanduser("~"), ".cache", "cozypong", "leaderboard.db")
+BATCH_RESULTS = 512
+
+ELO_K = 32
+ELO_INITIAL = 1200.0
+KIND_HUMAN = 0
+KIND_AI = 1
+# Nama dan rating awal pemain AI per difficulty
+AI_PLAYERS = {
+    DIFFICULTY_EASY: ("AI MUDAH", 1000.0),
+    DIFFICULTY_MEDIUM: ("AI SEDANG", 1200.0),
+    DIFFICULTY_HARD: ("AI SULIT", 1400.0),
+    DIFFICULTY_ADAPTIVE: ("AI ADAPTIF", 1200.0),
+    DIFFICULTY_NEURAL: ("AI NEURAL", 1200.0),
+}
+PLAYER_2_NAME = "PEMAIN 2"  # lawan lokal di mode 2 player
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    kind INTEGER NOT NULL,
+    rating REAL NOT NULL,
+    matches INTEGER NOT NULL DEFAULT 0,
+    wins INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS players_by_rating ON players (rating DESC);
+CREATE TABLE IF NOT EXISTS matches (
+    id INTEGER PRIMARY KEY,
+    played_at REAL NOT NULL,
+    mode INTEGER NOT NULL,
+    difficulty INTEGER NOT NULL,
+    player_1 INTEGER NOT NULL REFERENCES players (id),
+    player_2 INTEGER NOT NULL REFERENCES players (id),
+    score_1 INTEGER NOT NULL,
+    score_2 INTEGER NOT NULL,
+    winner INTEGER NOT NULL,
+    rating_1 REAL NOT NULL,
+    rating_2 REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS matches_by_player_1 ON matches (player_1, id DESC);
+CREATE INDEX IF NOT EXISTS matches_by_player_2 ON matches (player_2, id DESC);
+"""
+_STOP = object()
+
+
+def connect(path=LEADERBOARD_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    # Dengan WAL, NORMAL tetap konsisten; hanya transaksi terakhir yang bisa hilang saat listrik mati
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def expected_score(rating, opponent):
+    return 1.0 / (1.0 + 10 ** ((opponent - rating) / 400.0))
+
+
+def elo_update(rating_1, rating_2, winner):
+    """Rating baru setelah pertandingan; winner 1 atau 2."""
+    delta = ELO_K * ((1.0 if winner == 1 else 0.0) - expected_score(rating_1, rating_2))
+    return rating_1 + delta, rating_2 - delta
+
+
+def match_players(match, profile):
+    """(nama, kind, rating awal) untuk paddle kiri dan kanan."""
+    player_1 = (profile, KIND_HUMAN, ELO_INITIAL)
+    if match.mode == MODE_VS_COMPUTER:
+        name, rating = AI_PLAYERS.get(match.difficulty, AI_PLAYERS[DIFFICULTY_MEDIUM])
+        return player_1, (name, KIND_AI, rating)
+    return player_1, (PLAYER_2_NAME, KIND_HUMAN, ELO_INITIAL)
+
+
+class Leaderboard:
+    """Writer batch di thread latar belakang plus query untuk layar leaderboard.
+
+    Koneksi SQLite tidak boleh dipakai lintas thread, jadi writer punya
+    koneksinya sendiri dan query memakai koneksi milik thread pemanggil.
+    """
+
+    def __init__(self, path=LEADERBOARD_PATH, batch_results=BATCH_RESULTS):
+        self.path = path
+        self.batch_results = batch_results
+        self.written = 0  # jumlah hasil yang sudah di-commit (naik setelah tiap batch)
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._reader = connect(path)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="leaderboard-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def record(self, player_1, player_2, match, played_at=None):
+        """Antrekan hasil pertandingan yang sudah selesai. player_* = (nama, kind, rating awal)."""
+        self._queue.put((played_at or time.time(), match.mode, match.difficulty, player_1, player_2,
+                         match.score_1, match.score_2, match.winner))
+
+    def close(self, timeout=5.0):
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+            self._thread = None
+        self._reader.close()
+
+    def _run(self):
+        conn = connect(self.path)
+        get = self._queue.get
+        running = True
+        while running:
+            batch = [get()]
+            # Ambil semua yang sudah menunggu tanpa blok: hasil tunggal langsung
+            # ditulis, banyak hasil sekaligus (simulasi) jadi satu transaksi
+            while len(batch) < self.batch_results:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if _STOP in batch:
+                running = False
+                batch = [result for result in batch if result is not _STOP]
+            if batch:
+                try:
+                    with conn:
+                        write_results(conn, batch)
+                except sqlite3.Error as e:
+                    print("Gagal menulis leaderboard: %s" % e)
+                    continue
+                self.written += len(batch)
+        conn.close()
+
+    def top(self, limit=10):
+        return top_players(self._reader, limit)
+
+    def history(self, name, limit=10):
+        return player_history(self._reader, name, limit)
+
+
+def open_leaderboard(path=LEADERBOARD_PATH):
+    """Leaderboard yang sudah berjalan, atau None jika database tidak bisa dibuka."""
+    try:
+        return Leaderboard(path).start()
+    except (sqlite3.Error, OSError) as e:
+        print("Leaderboard tidak tersedia: %s" % e)
+        return None
+
+
+def _player(conn, cache, name, kind, rating):
+    """[id, rating, tambahan matches, tambahan wins] pemain; dibuat dengan rating awal jika belum ada."""
+    entry = cache.get(name)
+    if entry is None:
+        row = conn.execute("SELECT id, rating FROM players WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            row = (conn.execute("INSERT INTO players (name, kind, rating) VALUES (?, ?, ?)",
+                                (name, kind, rating)).lastrowid, rating)
+        entry = cache[name] = [row[0], row[1], 0, 0]
+    return entry
+
+
+def write_results(conn, results):
+    """Tulis hasil secara berurutan (rating memakai hasil sebelumnya di batch yang sama).
+
+    Baris pemain di-update sekali per batch, bukan sekali per pertandingan.
+    """
+    cache = {}
+    rows = []
+    for played_at, mode, difficulty, player_1, player_2, score_1, score_2, winner in results:
+        p1 = _player(conn, cache, *player_1)
+        p2 = _player(conn, cache, *player_2)
+        p1[1], p2[1] = elo_update(p1[1], p2[1], winner)
+        p1[2] += 1
+        p2[2] += 1
+        p1[3] += winner == 1
+        p2[3] += winner == 2
+        rows.append((played_at, mode, difficulty, p1[0], p2[0], score_1, score_2, winner, p1[1], p2[1]))
+    conn.executemany("INSERT INTO matches (played_at, mode, difficulty, player_1, player_2, score_1, score_2, "
+                     "winner, rating_1, rating_2) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    conn.executemany("UPDATE players SET rating = ?, matches = matches + ?, wins = wins + ? WHERE id = ?",
+                     [(rating, matches, wins, player_id) for player_id, rating, matches, wins in cache.values()])
+
+
+def top_players(conn, limit=10):
+    """[(nama, kind, rating, matches, wins)] urut rating (index players_by_rating)."""
+    return conn.execute("SELECT name, kind, rating, matches, wins FROM players ORDER BY rating DESC LIMIT ?",
+                        (limit,)).fetchall()
+
+
+def player_history(conn, name, limit=10):
+    """Pertandingan terakhir `name`: [(played_at, lawan, skor sendiri, skor lawan, menang, rating setelahnya)]."""
+    row = conn.execute("SELECT id FROM players WHERE name = ?", (name,)).fetchone()
+    if row is None:
+        return []
+    player_id = row[0]
+    # Dua query ber-index (sebagai paddle kiri / kanan) lalu digabung; masing-masing dibatasi `limit`
+    return conn.execute(
+        "SELECT played_at, name, own, other, won, new_rating FROM ("
+        " SELECT * FROM (SELECT id AS match_id, played_at, player_2 AS opponent, score_1 AS own, score_2 AS other,"
+        "  winner = 1 AS won, rating_1 AS new_rating FROM matches WHERE player_1 = ? ORDER BY id DESC LIMIT ?)"
+        " UNION ALL"
+        " SELECT * FROM (SELECT id, played_at, player_1, score_2, score_1, winner = 2, rating_2"
+        "  FROM matches WHERE player_2 = ? ORDER BY id DESC LIMIT ?)"
+        ") JOIN players ON players.id = opponent ORDER BY played_at DESC, match_id DESC LIMIT ?",
+        (player_id, limit, player_id, limit, limit)).fetchall()
@@ -0,0 +1,280 @@
+"""State pertandingan dalam objek __slots__ kecil (tanpa pygame).
+
+Semua yang menentukan langkah simulasi berikutnya ada di sini: bola, paddle,
+power up, AI, skor/timer, dan state RNG. `copy()` membuat snapshot lepas
+(untuk rollback atau simulasi cabang), `to_bytes()`/`from_bytes()`
+menyimpannya dalam format biner tetap. Float disimpan sebagai double, jadi
+state yang dipulihkan melanjutkan simulasi persis sama.
+"""
+import random
+import struct
+
+from constants import *
+
+# Kode power up di format biner; 0 = tidak ada
+_POWERUP_CODES = {ptype["type"]: i + 1 for i, ptype in enumerate(POWERUP_TYPES)}
+_POWERUP_COLORS = {ptype["type"]: ptype["color"] for ptype in POWERUP_TYPES}
+_OWNER_CODES = {None: 0, "p1": 1, "p2": 2}
+_OWNERS = {code: owner for owner, code in _OWNER_CODES.items()}
+
+# State Random.getstate(): versi 3, 624 word + posisi, gauss_next
+_RNG_WORDS = 625
+_RNG = struct.Struct("<%dIBd" % _RNG_WORDS)
+
+
+class BallState:
+    """Posisi (pojok kiri atas) dan kecepatan bola, plus posisi step sebelumnya."""
+
+    __slots__ = ("x", "y", "vel_x", "vel_y", "prev_x", "prev_y")
+    _STRUCT = struct.Struct("<6d")
+
+    def __init__(self, x=float(BALL_START_X), y=float(BALL_START_Y), vel_x=0.0, vel_y=0.0,
+                 prev_x=None, prev_y=None):
+        self.x = x
+        self.y = y
+        self.vel_x = vel_x
+        self.vel_y = vel_y
+        self.prev_x = x if prev_x is None else prev_x
+        self.prev_y = y if prev_y is None else prev_y
+
+    def copy(self):
+        return BallState(self.x, self.y, self.vel_x, self.vel_y, self.prev_x, self.prev_y)
+
+    def to_bytes(self):
+        return self._STRUCT.pack(self.x, self.y, self.vel_x, self.vel_y, self.prev_x, self.prev_y)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        return cls(*cls._STRUCT.unpack_from(data, offset))
+
+
+class PaddleState:
+    __slots__ = ("y", "prev_y")
+    _STRUCT = struct.Struct("<2d")
+
+    def __init__(self, y=float(PADDLE_START_Y), prev_y=None):
+        self.y = y
+        self.prev_y = y if prev_y is None else prev_y
+
+    def copy(self):
+        return PaddleState(self.y, self.prev_y)
+
+    def to_bytes(self):
+        return self._STRUCT.pack(self.y, self.prev_y)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        return cls(*cls._STRUCT.unpack_from(data, offset))
+
+
+class PowerupState:
+    """Power up di lapangan (x, y, size) atau efek aktif (timer, owner "p1"/"p2")."""
+
+    __slots__ = ("type", "color", "x", "y", "size", "timer", "owner")
+    # kode tipe (0 = None), x, y, size, timer, kode owner
+    _STRUCT = struct.Struct("<BhhBdB")
+
+    def __init__(self, type, x=0, y=0, size=POWERUP_SIZE, timer=0.0, owner=None):
+        self.type = type
+        self.color = _POWERUP_COLORS[type]
+        self.x = x
+        self.y = y
+        self.size = size
+        self.timer = timer
+        self.owner = owner
+
+    def copy(self):
+        return PowerupState(self.type, self.x, self.y, self.size, self.timer, self.owner)
+
+    @classmethod
+    def pack(cls, powerup):
+        """Bytes untuk power up atau None (ukuran selalu sama)."""
+        if powerup is None:
+            return cls._STRUCT.pack(0, 0, 0, 0, 0.0, 0)
+        return cls._STRUCT.pack(_POWERUP_CODES[powerup.type], powerup.x, powerup.y, powerup.size,
+                                powerup.timer, _OWNER_CODES[powerup.owner])
+
+    @classmethod
+    def unpack(cls, data, offset=0):
+        code, x, y, size, timer, owner = cls._STRUCT.unpack_from(data, offset)
+        if code == 0:
+            return None
+        return cls(POWERUP_TYPES[code - 1]["type"], x, y, size, timer, _OWNERS[owner])
+
+
+class AIState:
+    """State AI satu paddle. side=2 paddle kanan, side=1 paddle kiri.
+
+    `intercept_y` adalah titik potong lintasan bola dengan kecepatan
+    (path_vel_x, path_vel_y) di ronde path_round (cache ai.update_ai).
+    """
+
+    __slots__ = ("side", "difficulty", "target_y", "reaction_delay", "error_offset", "difficulty_adjustment",
+                 "path_vel_x", "path_vel_y", "path_round", "intercept_y")
+    _STRUCT = struct.Struct("<BB6dId")
+
+    def __init__(self, side=2, difficulty=DIFFICULTY_MEDIUM, target_y=float(LOW_RES_HEIGHT // 2),
+                 reaction_delay=0.0, error_offset=0.0, difficulty_adjustment=0.0, path_vel_x=0.0, path_vel_y=0.0, path_round=0, intercept_y=0.0):
+        self.side = side
+        self.difficulty = difficulty
+        self.target_y = target_y
+        self.reaction_delay = reaction_delay  # detik
+        self.error_offset = error_offset
+        self.difficulty_adjustment = difficulty_adjustment
+        # Kecepatan 0 tidak pernah cocok dengan bola yang bergerak: cache kosong
+        self.path_vel_x = path_vel_x
+        self.path_vel_y = path_vel_y
+        self.path_round = path_round
+        self.intercept_y = intercept_y
+
+    def copy(self):
+        return AIState(self.side, self.difficulty, self.target_y, self.reaction_delay, self.error_offset,
+                       self.difficulty_adjustment, self.path_vel_x, self.path_vel_y, self.path_round,
+                       self.intercept_y)
+
+    def to_bytes(self):
+        return self._STRUCT.pack(self.side, self.difficulty, self.target_y, self.reaction_delay,
+                                 self.error_offset, self.difficulty_adjustment, self.path_vel_x,
+                                 self.path_vel_y, self.path_round, self.intercept_y)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        return cls(*cls._STRUCT.unpack_from(data, offset))
+
+
+def copy_rng(rng):
+    # Random.__new__ + setstate: tanpa seeding dari os.urandom seperti Random()
+    new = random.Random.__new__(random.Random)
+    new.setstate(rng.getstate())
+    return new
+
+
+class MatchState:
+    """Seluruh state satu pertandingan. sim.Match menambahkan method fisikanya.
+
+    `events` hanya hasil step terakhir; tidak ikut di-copy atau diserialisasi.
+    """
+
+    __slots__ = ("mode", "difficulty", "rng", "ai", "ball", "paddle_1", "paddle_2",
+                 "round_start_step", "last_speed_increase_step", "current_speed_multiplier",
+                 "base_speed_x", "base_speed_y", "score_1", "score_2", "winner", "point_scored_by",
+                 "powerup_active", "powerup_obj", "powerup_spawn_timer", "time", "steps", "events")
+    # mode, difficulty, jumlah AI, skor 1, skor 2, winner, point_scored_by (0 = None), steps,
+    # round_start_step, last_speed_increase_step, multiplier, base speed x/y, spawn timer, time
+    _HEADER = struct.Struct("<BBBBBBBIII5d")
+
+    def __init__(self, mode=MODE_VS_COMPUTER, difficulty=DIFFICULTY_MEDIUM, seed=None, ai_sides=None):
+        self.mode = mode
+        self.difficulty = difficulty
+        self.rng = random.Random(seed)
+        if ai_sides is None:
+            ai_sides = (2,) if mode == MODE_VS_COMPUTER else ()
+        self.ai = {side: AIState(side, difficulty) for side in ai_sides}
+
+        self.ball = BallState()
+        self.paddle_1 = PaddleState()
+        self.paddle_2 = PaddleState()
+
+        # Sistem peningkatan kecepatan (timer dalam tick simulasi, lihat sim.SpeedRamp)
+        self.round_start_step = 0
+        self.last_speed_increase_step = 0
+        self.current_speed_multiplier = 1.0
+        self.base_speed_x = BALL_SPEED_X_INITIAL
+        self.base_speed_y = BALL_SPEED_Y_INITIAL
+
+        self.score_1 = 0
+        self.score_2 = 0
+        self.winner = None
+        self.point_scored_by = None
+
+        # Power up
+        self.powerup_active = None  # PowerupState efek yang sedang berjalan
+        self.powerup_obj = None     # PowerupState yang ada di lapangan
+        self.powerup_spawn_timer = 0.0  # detik sampai power up di lapangan hilang
+
+        self.time = 0.0  # detik simulasi
+        self.steps = 0
+        self.events = []
+
+    def copy(self):
+        """Snapshot lepas dengan tipe yang sama (Match.copy() bisa langsung di-step)."""
+        new = object.__new__(type(self))
+        new.mode = self.mode
+        new.difficulty = self.difficulty
+        new.rng = copy_rng(self.rng)
+        new.ai = {side: ai.copy() for side, ai in self.ai.items()}
+        new.ball = self.ball.copy()
+        new.paddle_1 = self.paddle_1.copy()
+        new.paddle_2 = self.paddle_2.copy()
+        new.round_start_step = self.round_start_step
+        new.last_speed_increase_step = self.last_speed_increase_step
+        new.current_speed_multiplier = self.current_speed_multiplier
+        new.base_speed_x = self.base_speed_x
+        new.base_speed_y = self.base_speed_y
+        new.score_1 = self.score_1
+        new.score_2 = self.score_2
+        new.winner = self.winner
+        new.point_scored_by = self.point_scored_by
+        new.powerup_active = self.powerup_active.copy() if self.powerup_active else None
+        new.powerup_obj = self.powerup_obj.copy() if self.powerup_obj else None
+        new.powerup_spawn_timer = self.powerup_spawn_timer
+        new.time = self.time
+        new.steps = self.steps
+        new.events = []
+        return new
+
+    def restore(self, state):
+        """Kembalikan objek ini ke `state` (hasil copy() atau from_bytes())."""
+        snapshot = state.copy()
+        for name in MatchState.__slots__:
+            setattr(self, name, getattr(snapshot, name))
+
+    def to_bytes(self):
+        ai = self.ai
+        parts = [
+            self._HEADER.pack(self.mode, self.difficulty, len(ai), self.score_1, self.score_2,
+                              self.winner or 0, self.point_scored_by or 0, self.steps,
+                              self.round_start_step, self.last_speed_increase_step,
+                              self.current_speed_multiplier, self.base_speed_x, self.base_speed_y,
+                              self.powerup_spawn_timer, self.time),
+            self.ball.to_bytes(),
+            self.paddle_1.to_bytes(),
+            self.paddle_2.to_bytes(),
+            PowerupState.pack(self.powerup_active),
+            PowerupState.pack(self.powerup_obj),
+        ]
+        parts.extend(ai[side].to_bytes() for side in sorted(ai))
+        version, words, gauss_next = self.rng.getstate()
+        parts.append(_RNG.pack(*words, gauss_next is not None, gauss_next or 0.0))
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, data, offset=0):
+        new = object.__new__(cls)
+        (new.mode, new.difficulty, ai_count, new.score_1, new.score_2, winner, point_scored_by, new.steps,
+         new.round_start_step, new.last_speed_increase_step, new.current_speed_multiplier,
+         new.base_speed_x, new.base_speed_y, new.powerup_spawn_timer,
+         new.time) = cls._HEADER.unpack_from(data, offset)
+        new.winner = winner or None
+        new.point_scored_by = point_scored_by or None
+        offset += cls._HEADER.size
+        new.ball = BallState.from_bytes(data, offset)
+        offset += BallState._STRUCT.size
+        new.paddle_1 = PaddleState.from_bytes(data, offset)
+        offset += PaddleState._STRUCT.size
+        new.paddle_2 = PaddleState.from_bytes(data, offset)
+        offset += PaddleState._STRUCT.size
+        new.powerup_active = PowerupState.unpack(data, offset)
+        offset += PowerupState._STRUCT.size
+        new.powerup_obj = PowerupState.unpack(data, offset)
+        offset += PowerupState._STRUCT.size
+        new.ai = {}
+        for _ in range(ai_count):
+            ai = AIState.from_bytes(data, offset)
+            new.ai[ai.side] = ai
+            offset += AIState._STRUCT.size
+        values = _RNG.unpack_from(data, offset)
+        new.rng = random.Random.__new__(random.Random)
+        new.rng.setstate((3, values[:_RNG_WORDS], values[-1] if values[-2] else None))
+        new.events = []
+        return new
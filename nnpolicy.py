@@ -0,0 +1,202 @@
+"""AI paddle berbasis MLP kecil (6-8-1) plus trainer evolution strategies.
+
+Input: jarak bola ke paddle, posisi y bola, kecepatan bola (menuju paddle
+dan vertikal), posisi y paddle, dan multiplier kecepatan; output: gerak
+paddle per step (tanh * NEURAL_MAX_SPEED). Sisi kiri dicerminkan, jadi satu
+set bobot dipakai untuk kedua paddle.
+
+Inferensi di game memakai Python murni dari bobot yang sudah di-unroll
+(~4 us per step; NumPy untuk satu sampel justru lebih lambat karena overhead
+per panggilan). NumPy dipakai untuk memuat/menyimpan .npz dan untuk
+inferensi batch saat training: semua pertandingan satu generasi maju
+bersama-sama dan satu forward pass menghitung gerak semuanya. Tidak
+bergantung pada pygame; tanpa NumPy AI neural tidak tersedia.
+"""
+import math
+import os
+
+from constants import *
+from sim import Match
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+POLICY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "models", "ai_mlp.npz")
+
+N_INPUTS = 6
+N_HIDDEN = 8
+# W1 (hidden x input), b1, w2, b2
+N_PARAMS = N_HIDDEN * N_INPUTS + N_HIDDEN + N_HIDDEN + 1
+NEURAL_MAX_SPEED = 1.6  # sama dengan AI SULIT (ai.get_ai_settings)
+VELOCITY_SCALE = 5.0    # normalisasi kecepatan bola (pixel/step)
+
+# Training: satu episode = satu ronde melawan AI heuristik
+EPISODE_STEPS = SIM_RATE * 30
+HIT_REWARD = 0.1
+
+
+def observe(side, match):
+    """Input policy untuk paddle `side`, dinormalisasi kira-kira ke -1..1."""
+    ball = match.ball
+    ball_centerx = ball.x + BALL_RADIUS
+    if side == 2:
+        distance = PADDLE_2_X - ball_centerx
+        vel_toward = ball.vel_x
+        paddle_y = match.paddle_2.y
+    else:
+        distance = ball_centerx - (PADDLE_1_X + PADDLE_WIDTH)
+        vel_toward = -ball.vel_x
+        paddle_y = match.paddle_1.y
+    return (distance / LOW_RES_WIDTH,
+            (ball.y + BALL_RADIUS) / (LOW_RES_HEIGHT / 2) - 1.0,
+            vel_toward / VELOCITY_SCALE,
+            ball.vel_y / VELOCITY_SCALE,
+            (paddle_y + PADDLE_HEIGHT / 2) / (LOW_RES_HEIGHT / 2) - 1.0,
+            match.current_speed_multiplier - 1.0)
+
+
+def split_params(params):
+    """Vektor parameter -> (W1, b1, w2, b2). Juga bekerja untuk batch (..., N_PARAMS)."""
+    i = N_HIDDEN * N_INPUTS
+    w1 = params[..., :i].reshape(params.shape[:-1] + (N_HIDDEN, N_INPUTS))
+    b1 = params[..., i:i + N_HIDDEN]
+    w2 = params[..., i + N_HIDDEN:i + 2 * N_HIDDEN]
+    b2 = params[..., -1]
+    return w1, b1, w2, b2
+
+
+def batch_forward(params, inputs):
+    """Gerak paddle untuk populasi: params (P, N_PARAMS), inputs (P, M, N_INPUTS) -> (P, M)."""
+    w1, b1, w2, b2 = split_params(params)
+    hidden = np.tanh(np.matmul(inputs, w1.transpose(0, 2, 1)) + b1[:, None, :])
+    return np.tanh(np.matmul(hidden, w2[:, :, None])[..., 0] + b2[:, None]) * NEURAL_MAX_SPEED
+
+
+class MLPPolicy:
+    """Policy dengan bobot tetap; `move()` dipanggil dari ai.update_ai."""
+
+    __slots__ = ("params", "_rows", "_out_bias")
+
+    def __init__(self, params):
+        self.params = np.asarray(params, dtype=np.float64)
+        w1, b1, w2, b2 = split_params(self.params)
+        # (w_0..w_5, bias hidden, bobot output) per neuron hidden, sebagai float Python
+        self._rows = tuple(tuple(row) + (bias, out)
+                           for row, bias, out in zip(w1.tolist(), b1.tolist(), w2.tolist()))
+        self._out_bias = float(b2)
+
+    def move(self, ai, match):
+        a, b, c, d, e, f = observe(ai.side, match)
+        tanh = math.tanh
+        total = self._out_bias
+        for w0, w1, w2, w3, w4, w5, bias, out in self._rows:
+            total += out * tanh(w0 * a + w1 * b + w2 * c + w3 * d + w4 * e + w5 * f + bias)
+        return tanh(total) * NEURAL_MAX_SPEED
+
+
+def load_policy(path=POLICY_PATH):
+    """MLPPolicy dari file .npz, atau None jika NumPy/file tidak ada atau tidak valid."""
+    if np is None:
+        return None
+    try:
+        with np.load(path) as data:
+            params = data["params"]
+    except (OSError, KeyError, ValueError):
+        return None
+    if params.shape != (N_PARAMS,):
+        return None
+    return MLPPolicy(params)
+
+
+def save_policy(params, path=POLICY_PATH, **info):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.savez(path, params=np.asarray(params, dtype=np.float64), **info)
+
+
+def evaluate_population(job):
+    """Fitness tiap anggota populasi (dipanggil di worker process).
+
+    job = (params (P, N_PARAMS), seeds, difficulty lawan). Tiap anggota
+    memainkan satu ronde per seed sebagai paddle kiri; semua P x M ronde
+    maju bersama dan gerak paddle dihitung dengan satu batch_forward per step.
+    Fitness: +1 jika mencetak poin, -1 dikurangi jarak meleset jika kebobolan,
+    plus HIT_REWARD per pukulan.
+    """
+    params, seeds, difficulty = job
+    population = len(params)
+    matches = []
+    for _ in range(population):
+        for seed in seeds:
+            match = Match(MODE_VS_COMPUTER, difficulty, seed=seed)
+            match.start()
+            matches.append(match)
+    fitness = np.zeros(len(matches))
+    active = list(range(len(matches)))
+    inputs = np.zeros((population, len(seeds), N_INPUTS))
+    flat_inputs = inputs.reshape(-1, N_INPUTS)
+    dt = SIM_DT
+    for _ in range(EPISODE_STEPS):
+        if not active:
+            break
+        for i in active:
+            flat_inputs[i] = observe(1, matches[i])
+        moves = batch_forward(params, inputs).ravel().tolist()
+        still_active = []
+        for i in active:
+            match = matches[i]
+            for event in match.step(dt, moves[i], 0):
+                if event[0] == "paddle_hit" and event[1] == 1:
+                    fitness[i] += HIT_REWARD
+                elif event[0] == "point":
+                    if event[1] == 1:
+                        fitness[i] += 1.0
+                    else:
+                        miss = abs((match.paddle_1.y + PADDLE_HEIGHT / 2) - (match.ball.y + BALL_RADIUS))
+                        fitness[i] -= 1.0 + miss / LOW_RES_HEIGHT
+            if match.point_scored_by is None:
+                still_active.append(i)
+        active = still_active
+    return fitness.reshape(population, len(seeds)).mean(axis=1)
+
+
+def centered_ranks(values):
+    """Fitness -> rank -0.5..0.5 (tahan terhadap outlier)."""
+    ranks = np.empty(len(values))
+    ranks[np.argsort(values)] = np.arange(len(values))
+    return ranks / (len(values) - 1) - 0.5
+
+
+def train(generations=60, population=32, episodes=8, sigma=0.1, learning_rate=0.05,
+          difficulty=DIFFICULTY_HARD, seed=0, workers=1, params=None, log=print):
+    """Evolution strategies (sampling antitetik, fitness berbasis rank).
+
+    Semua anggota satu generasi dinilai pada seed pertandingan yang sama
+    (common random numbers). Populasi dibagi rata ke `workers` process.
+    Mengembalikan vektor parameter terbaik (rata-rata distribusi).
+    """
+    rng = np.random.default_rng(seed)
+    theta = rng.normal(0.0, 0.3, N_PARAMS) if params is None else np.array(params, dtype=np.float64)
+    half = population // 2
+    pool = None
+    if workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers)
+    try:
+        for generation in range(generations):
+            noise = rng.normal(0.0, 1.0, (half, N_PARAMS))
+            noise = np.concatenate([noise, -noise])
+            candidates = theta + sigma * noise
+            seeds = [int(s) for s in rng.integers(0, 2 ** 63 - 1, episodes)]
+            chunks = np.array_split(candidates, max(1, workers))
+            jobs = [(chunk, seeds, difficulty) for chunk in chunks if len(chunk)]
+            results = pool.map(evaluate_population, jobs) if pool else [evaluate_population(job) for job in jobs]
+            fitness = np.concatenate(results)
+            weights = centered_ranks(fitness)
+            theta = theta + learning_rate / (len(candidates) * sigma) * noise.T.dot(weights)
+            log("gen %3d  fitness rata-rata %+.3f  terbaik %+.3f" % (generation, fitness.mean(), fitness.max()))
+    finally:
+        if pool:
+            pool.close()
+    return theta
@@ -0,0 +1,141 @@
+"""Sistem partikel dengan pool berbasis array NumPy.
+
+Semua partikel hidup disimpan rapat di awal array (pos, vel, life, ...),
+di-update secara vektor, lalu digambar dengan satu panggilan Surface.blits
+dari sprite yang sudah di-render sebelumnya. NumPy opsional: tanpa NumPy
+efek partikel dimatikan dan game tetap jalan.
+"""
+import math
+
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Jumlah tingkat fade (ukuran/kecerahan) sprite per warna
+FADE_LEVELS = 8
+PARTICLE_RADIUS = 3
+PARTICLE_CAPACITY = 4096
+PARTICLE_DRAG = 0.92        # per 1/60 detik
+PARTICLE_GRAVITY = 30.0     # pixel/detik^2
+
+
+def build_particle_sprites(color, levels=FADE_LEVELS, radius=PARTICLE_RADIUS):
+    """Sprite untuk blend aditif: makin pudar, makin kecil dan makin gelap."""
+    sprites = []
+    for level in range(levels):
+        strength = (level + 1) / levels
+        size = max(1, int(round(radius * (0.4 + 0.6 * strength))))
+        surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        # BLEND_RGBA_ADD mengabaikan alpha, jadi kecerahan dikalikan langsung ke RGB
+        faded = tuple(int(c * strength * 0.8) for c in color) + (int(255 * strength),)
+        pygame.draw.circle(surf, faded, (size, size), size)
+        sprites.append((surf, size))
+    return sprites
+
+
+class ParticleSystem:
+    """Pool partikel berkapasitas tetap dengan update vektor NumPy."""
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, seed=None):
+        self.capacity = capacity
+        self.count = 0
+        self.enabled = np is not None
+        # Palet warna -> index sprite; sprite disusun [warna * FADE_LEVELS + level]
+        self.palette = {}
+        self.sprites = []
+        self.offsets = []
+        if not self.enabled:
+            return
+        self.rng = np.random.default_rng(seed)
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.int32)
+        # Scratch untuk posisi blit (int) supaya tidak dialokasi tiap frame
+        self._blit_pos = np.zeros((capacity, 2), dtype=np.int32)
+        self._sprite_index = np.zeros(capacity, dtype=np.int32)
+
+    def _color_index(self, color):
+        index = self.palette.get(color)
+        if index is None:
+            index = len(self.palette)
+            self.palette[color] = index
+            for surf, size in build_particle_sprites(color):
+                self.sprites.append(surf)
+                self.offsets.append(size)
+            self._offsets = np.array(self.offsets, dtype=np.int32)
+        return index
+
+    def clear(self):
+        self.count = 0
+
+    def emit(self, x, y, count, color, speed=60.0, life=0.5, angle=0.0, spread=math.pi * 2):
+        """Semburkan `count` partikel dari (x, y) ke arah `angle` +- spread/2.
+
+        Partikel yang tidak muat di pool dibuang (pool tidak pernah tumbuh).
+        """
+        if not self.enabled:
+            return
+        count = min(count, self.capacity - self.count)
+        if count <= 0:
+            return
+        start = self.count
+        end = start + count
+        rng = self.rng
+        angles = angle + (rng.random(count, dtype=np.float32) - 0.5) * spread
+        speeds = speed * (0.3 + 0.7 * rng.random(count, dtype=np.float32))
+        self.pos[start:end, 0] = x
+        self.pos[start:end, 1] = y
+        self.vel[start:end, 0] = np.cos(angles) * speeds
+        self.vel[start:end, 1] = np.sin(angles) * speeds
+        lifetimes = life * (0.5 + 0.5 * rng.random(count, dtype=np.float32))
+        self.life[start:end] = lifetimes
+        self.max_life[start:end] = lifetimes
+        self.color[start:end] = self._color_index(color)
+        self.count = end
+
+    def update(self, dt):
+        """Gerakkan semua partikel hidup dan buang yang sudah habis umurnya."""
+        n = self.count
+        if not self.enabled or n == 0:
+            return
+        pos = self.pos[:n]
+        vel = self.vel[:n]
+        life = self.life[:n]
+        vel *= PARTICLE_DRAG ** (dt * 60)
+        vel[:, 1] += PARTICLE_GRAVITY * dt
+        pos += vel * dt
+        life -= dt
+
+        # Kompaksi: partikel hidup dipindah ke depan, urutan tetap
+        alive = life > 0
+        alive_count = int(np.count_nonzero(alive))
+        if alive_count != n:
+            for array in (self.pos, self.vel, self.life, self.max_life, self.color):
+                array[:alive_count] = array[:n][alive]
+            self.count = alive_count
+
+    def draw(self, surface):
+        """Gambar semua partikel dengan satu panggilan Surface.blits (blend aditif)."""
+        n = self.count
+        if not self.enabled or n == 0:
+            return
+        sprite_index = self._sprite_index[:n]
+        # Level fade dari sisa umur: 0 (hampir habis) .. FADE_LEVELS-1 (baru)
+        np.multiply(self.life[:n] / self.max_life[:n], FADE_LEVELS, out=sprite_index, casting="unsafe")
+        np.minimum(sprite_index, FADE_LEVELS - 1, out=sprite_index)
+        sprite_index += self.color[:n] * FADE_LEVELS
+        blit_pos = self._blit_pos[:n]
+        np.subtract(self.pos[:n], self._offsets[sprite_index][:, None], out=blit_pos, casting="unsafe")
+
+        sprites = self.sprites
+        flags = pygame.BLEND_RGBA_ADD
+        # Generator, bukan list: tiap tuple langsung dibebaskan setelah di-blit,
+        # jadi ribuan partikel tidak memicu garbage collector tiap frame
+        surface.blits(((sprites[i], (x, y), None, flags)
+                       for i, x, y in zip(sprite_index.tolist(), blit_pos[:, 0].tolist(), blit_pos[:, 1].tolist())),
+                      doreturn=False)
@@ -0,0 +1,117 @@
+"""Efek pasca-proses retro: bloom dan overlay CRT (scanline + vignette).
+
+Bloom dihitung di salinan game_surface yang diperkecil (1/BLOOM_DOWNSCALE):
+bright-pass, blur Gaussian terpisah (horizontal lalu vertikal) dengan NumPy
+lewat surfarray, lalu diperbesar lagi dengan smoothscale dan ditambahkan
+(BLEND_ADD) ke frame. Semua buffer dialokasi sekali.
+
+Overlay CRT adalah satu mask RGB yang dihitung sekali per resolusi output
+dan diterapkan dengan satu blit BLEND_MULT (atau texture blend MOD di
+GpuDisplay), jadi scanline tetap tipis walau layar jauh lebih besar dari
+320x240. Biaya terukur (`cli.py bench --render --postfx`): bloom ~0.8 ms,
+CRT ~0.6 ms di 1280x960 dan ~1.5 ms di 1920x1440 per frame. Keduanya
+opsional dan butuh NumPy; tanpa NumPy efek dimatikan.
+"""
+import pygame
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from constants import *
+
+BLOOM_DOWNSCALE = 4
+BLOOM_THRESHOLD = 170     # per channel; hanya bola, glow, power up, dan teks terang yang ikut
+BLOOM_INTENSITY = 1.6
+BLOOM_RADIUS = 3          # tap blur di tiap sisi (di resolusi kecil)
+SCANLINE_DARKNESS = 0.35  # pengurangan kecerahan di garis gelap
+VIGNETTE_STRENGTH = 0.35  # pengurangan kecerahan di pojok layar
+
+
+def gaussian_weights(radius=BLOOM_RADIUS):
+    x = np.arange(-radius, radius + 1, dtype=np.float32)
+    weights = np.exp(-0.5 * (x / (radius / 2.0)) ** 2)
+    return weights / weights.sum()
+
+
+class Bloom:
+    """Bloom untuk surface berukuran tetap (default resolusi rendah game)."""
+
+    def __init__(self, size=(LOW_RES_WIDTH, LOW_RES_HEIGHT), downscale=BLOOM_DOWNSCALE, radius=BLOOM_RADIUS):
+        self.size = size
+        width, height = size[0] // downscale, size[1] // downscale
+        self.small = pygame.Surface((width, height))
+        self.glow = pygame.Surface(size)
+        self.weights = [float(w) * BLOOM_INTENSITY ** 0.5 for w in gaussian_weights(radius)]
+        self.radius = radius
+        # Buffer float (lebar, tinggi, rgb) seperti surfarray, ditambah padding untuk blur
+        self.padded = np.zeros((width + 2 * radius, height + 2 * radius, 3), dtype=np.float32)
+        self.blurred = np.zeros((width, height + 2 * radius, 3), dtype=np.float32)
+        self.result = np.zeros((width, height, 3), dtype=np.float32)
+        self.scratch = np.zeros((width, height + 2 * radius, 3), dtype=np.float32)
+        self.pixels = np.zeros((width, height, 3), dtype=np.uint8)
+
+    def apply(self, surface):
+        pygame.transform.smoothscale(surface, self.small.get_size(), self.small)
+        r = self.radius
+        width, height = self.small.get_size()
+        center = self.padded[r:r + width, r:r + height]
+        # Bright-pass: hanya bagian di atas threshold, diskalakan lagi ke 0..255
+        pixels = pygame.surfarray.pixels3d(self.small)
+        np.copyto(center, pixels, casting="unsafe")
+        del pixels
+        np.subtract(center, BLOOM_THRESHOLD, out=center)
+        np.maximum(center, 0.0, out=center)
+        np.multiply(center, 255.0 / (255 - BLOOM_THRESHOLD), out=center)
+
+        # Blur horizontal (sumbu x surfarray) lalu vertikal; padding tetap nol
+        blurred, scratch, result = self.blurred, self.scratch, self.result
+        blurred.fill(0.0)
+        for i, weight in enumerate(self.weights):
+            np.multiply(self.padded[i:i + width], weight, out=scratch)
+            np.add(blurred, scratch, out=blurred)
+        result.fill(0.0)
+        column = scratch[:, :height]
+        for i, weight in enumerate(self.weights):
+            np.multiply(blurred[:, i:i + height], weight, out=column)
+            np.add(result, column, out=result)
+        np.minimum(result, 255.0, out=result)
+
+        np.copyto(self.pixels, result, casting="unsafe")
+        pygame.surfarray.blit_array(self.small, self.pixels)
+        # smoothscale ke ukuran penuh sekaligus menghaluskan tepi blur
+        pygame.transform.smoothscale(self.small, self.size, self.glow)
+        surface.blit(self.glow, (0, 0), special_flags=pygame.BLEND_ADD)
+
+
+def build_crt_mask(size, scale):
+    """Mask BLEND_MULT untuk output `size`: satu garis gelap per baris pixel game
+    (`scale` = pixel output per pixel game) dikali vignette."""
+    width, height = size
+    # Posisi dalam satu baris pixel game; sepertiga bawah jadi garis gelap
+    row = (np.arange(height, dtype=np.float32) / scale) % 1.0
+    scanline = np.where(row >= 0.66, 1.0 - SCANLINE_DARKNESS, 1.0) if scale >= 2 else np.ones(height)
+    x = np.linspace(-1.0, 1.0, width, dtype=np.float32)[:, None]
+    y = np.linspace(-1.0, 1.0, height, dtype=np.float32)[None, :]
+    vignette = 1.0 - VIGNETTE_STRENGTH * np.clip((x * x + y * y) / 2.0, 0.0, 1.0) ** 1.5
+    # BLEND_MULT menghitung (src * dst) / 256, jadi 255 hampir tanpa efek
+    mask = np.clip(vignette * scanline[None, :] * 256.0, 0, 255).astype(np.uint8)
+    surface = pygame.Surface(size)
+    pygame.surfarray.blit_array(surface, np.repeat(mask[:, :, None], 3, axis=2))
+    return surface
+
+
+class PostProcessor:
+    """Bloom di game_surface; CRT diteruskan ke backend display (resolusi output)."""
+
+    def __init__(self, display, bloom=False, crt=False):
+        self.display = display
+        self.enabled = np is not None
+        self.bloom = Bloom() if bloom and self.enabled else None
+        if crt and self.enabled:
+            display.set_crt(True)
+
+    def apply(self, surface):
+        if self.bloom is not None:
+            self.bloom.apply(surface)
@@ -0,0 +1,413 @@
+"""Renderer gameplay berlapis: background, playfield, efek, HUD.
+
+STATE_PLAY dan STATE_SCORE_SCREEN memakai layer yang sama. Semua surface dan
+Rect dialokasikan sekali lalu dipakai ulang, jadi frame in-play tidak
+mengalokasi apa pun setelah cache terisi.
+"""
+import colorsys
+
+import pygame
+
+from assets import TextCache
+from constants import *
+
+# Cache surface teks, dipakai bersama dengan AssetManager (pre-bake)
+text_cache = TextCache()
+
+
+def draw_dashed_line(surface, color, start_pos, end_pos, width=1, dash_length=5, space_length=3):
+    """ Helper function to draw a dashed line. """
+    x1, y1 = start_pos
+    x2, y2 = end_pos
+    dx = x2 - x1
+    dy = y2 - y1
+    distance = max(abs(dx), abs(dy))
+
+    if distance == 0:
+        return
+
+    segment_length = dash_length + space_length
+    num_dashes = int(distance / segment_length)
+
+    for i in range(num_dashes):
+        start = i * segment_length
+        end = start + dash_length
+        if y1 == y2:  # Horizontal line
+            pygame.draw.line(surface, color, (x1 + start, y1), (x1 + end, y1), width)
+        else:  # Vertical line
+            pygame.draw.line(surface, color, (x1, y1 + start), (x1, y1 + end), width)
+
+
+def draw_text_with_shadow(surface, text, font, color, shadow_color, x, y, centered=True):
+    """Helper function to draw text with shadow effect"""
+    shadow_text = text_cache.render(font, text, shadow_color)
+    main_text = text_cache.render(font, text, color)
+
+    if centered:
+        shadow_rect = shadow_text.get_rect(center=(x + 1, y + 1))
+        main_rect = main_text.get_rect(center=(x, y))
+    else:
+        shadow_rect = (x + 1, y + 1)
+        main_rect = (x, y)
+
+    surface.blit(shadow_text, shadow_rect)
+    surface.blit(main_text, main_rect)
+
+
+def wrap_text(text, font, max_width):
+    """Helper function to wrap text to fit within max_width"""
+    words = text.split(' ')
+    lines = []
+    current_line = ""
+
+    for word in words:
+        test_line = current_line + word + " "
+        if font.size(test_line)[0] <= max_width:
+            current_line = test_line
+        else:
+            if current_line:
+                lines.append(current_line.strip())
+                current_line = word + " "
+            else:
+                lines.append(word)
+
+    if current_line:
+        lines.append(current_line.strip())
+
+    return lines
+
+
+def build_powerup_glow(color, size=POWERUP_SIZE):
+    """Helper function to pre-render powerup glow (3 lapis BLEND_RGBA_ADD jadi satu)"""
+    glow_surf = pygame.Surface((size + 12, size + 12), pygame.SRCALPHA)
+    # Tiga layer dengan alpha 40, 60, 90 yang dijumlahkan
+    glow_color = tuple(min(255, c * 3) for c in color) + (40 + 60 + 90,)
+    pygame.draw.ellipse(glow_surf, glow_color, glow_surf.get_rect())
+    return glow_surf
+
+
+class CachedText:
+    """Surface teks yang hanya di-render ulang saat nilainya berubah."""
+
+    def __init__(self, fmt, center):
+        self.fmt = fmt
+        self.center = center
+        self.value = None
+        self.surface = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+
+    def invalidate(self):
+        self.value = None
+
+    def get(self, font, value, color):
+        if value != self.value or self.surface is None:
+            self.value = value
+            self.surface = font.render(self.fmt % value, True, color)
+            self.rect.size = self.surface.get_size()
+            self.rect.center = self.center
+        return self.surface
+
+
+class GameRenderer:
+    """Menggambar gameplay dalam empat layer: background, playfield, efek, HUD.
+
+    Sprite trail/glow di-cache per skin (dibuang saat skin berganti), teks
+    skor dan kecepatan hanya di-render ulang saat nilainya berubah, dan semua
+    Rect bayangan dialokasikan sekali di sini. Layar skor yang statis
+    digambar sekali ke `static_frame` lalu cukup di-blit tiap frame.
+    Partikel (particles.ParticleSystem, opsional) digambar di atas layer efek.
+    """
+
+    def __init__(self, small_font, medium_font, sprites=None, particles=None):
+        self.small_font = small_font
+        self.medium_font = medium_font
+        self.sprites = sprites if sprites is not None else {}
+        self.particles = particles
+        self.paddle_color = COLOR_PADDLE
+        self.ball_color = COLOR_BALL
+        self.trail_style = "default"
+        self.glow_color = COLOR_ACCENT
+        self.bg_color = COLOR_BACKGROUND_DARK
+        self.center_color = COLOR_BACKGROUND_LIGHT
+        # Naik setiap kali skin/font berubah, untuk invalidasi cache layar skor
+        self.version = 0
+
+        # Rect scratch, diisi ulang tiap frame
+        self.paddle_shadow = pygame.Rect(0, 0, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.ball_shadow = pygame.Rect(0, 0, BALL_RADIUS * 2, BALL_RADIUS * 2)
+        self.powerup_rect = pygame.Rect(0, 0, POWERUP_SIZE, POWERUP_SIZE)
+
+        self.score_1_text = CachedText("%d", (LOW_RES_WIDTH // 4, 20))
+        self.score_2_text = CachedText("%d", (LOW_RES_WIDTH * 3 // 4, 20))
+        self.speed_text = CachedText("Speed: %.1fx", (LOW_RES_WIDTH // 2, 40))
+        self.speed_up_texts = [None] * 31  # satu surface per 1/60 detik sisa efek
+        self.speed_up_rect = pygame.Rect(0, 0, 0, 0)
+        self.exit_text = None
+        self.exit_rect = pygame.Rect(0, 0, 0, 0)
+        self.prompt_text = None
+        self.prompt_rect = pygame.Rect(0, 0, 0, 0)
+
+        self.background = None
+        self.dashed_line = None
+        self.trail_sprites = {}
+        self.glow_sprites = {}
+        self.static_frame = pygame.Surface((LOW_RES_WIDTH, LOW_RES_HEIGHT))
+        self.static_key = None
+
+    def set_fonts(self, small_font, medium_font):
+        if small_font is self.small_font and medium_font is self.medium_font:
+            return
+        self.small_font = small_font
+        self.medium_font = medium_font
+        self.score_1_text.invalidate()
+        self.score_2_text.invalidate()
+        self.speed_text.invalidate()
+        self.speed_up_texts = [None] * 31
+        self.exit_text = None
+        self.prompt_text = None
+        self.version += 1
+
+    def set_skin(self, paddle_color, ball_color, trail_style, glow_color, bg_color, center_color):
+        """Ganti skin; cache yang bergantung pada warna dibuang hanya jika berubah."""
+        changed = False
+        if paddle_color != self.paddle_color:
+            self.paddle_color = paddle_color
+            self.dashed_line = None
+            changed = True
+        if ball_color != self.ball_color or trail_style != self.trail_style:
+            self.ball_color = ball_color
+            self.trail_style = trail_style
+            self.trail_sprites.clear()
+            changed = True
+        if glow_color != self.glow_color:
+            self.glow_color = glow_color
+            self.glow_sprites.clear()
+            changed = True
+        if bg_color != self.bg_color or center_color != self.center_color:
+            self.bg_color = bg_color
+            self.center_color = center_color
+            self.background = None
+            changed = True
+        if changed:
+            self.version += 1
+
+    # --- sprite cache ---
+
+    def _background(self):
+        if self.background is None:
+            surf = pygame.Surface((LOW_RES_WIDTH, LOW_RES_HEIGHT))
+            surf.fill(self.bg_color)
+            center_rect_width = LOW_RES_WIDTH // 1.5
+            center_rect_height = LOW_RES_HEIGHT
+            center_rect_x = (LOW_RES_WIDTH - center_rect_width) // 2
+            pygame.draw.rect(surf, self.center_color, (center_rect_x, 0, center_rect_width, center_rect_height))
+            self.background = surf
+        return self.background
+
+    def _dashed_line(self):
+        if self.dashed_line is None:
+            surf = pygame.Surface((2, LOW_RES_HEIGHT), pygame.SRCALPHA)
+            draw_dashed_line(surf, self.paddle_color, (0, 5), (0, LOW_RES_HEIGHT - 5),
+                             width=2, dash_length=6, space_length=4)
+            self.dashed_line = surf
+        return self.dashed_line
+
+    def _trail_sprite(self, i, length):
+        key = (i, length)
+        sprite = self.trail_sprites.get(key)
+        if sprite is None:
+            alpha = int(255 * (i + 1) / length * 0.8)
+            trail_size = max(1, int(BALL_RADIUS * (0.3 + 0.7 * (i + 1) / length)))
+            if self.trail_style == "fire":
+                # Efek api: gradasi oranye-merah
+                trail_color = (255, int(100 + 100 * (i + 1) / length), 40)
+            elif self.trail_style == "rainbow":
+                # Efek pelangi: cycling hue
+                rgb = colorsys.hsv_to_rgb(i / length, 1, 1)
+                trail_color = tuple(int(255 * c) for c in rgb)
+            else:
+                # Default: warna bola
+                trail_color = self.ball_color
+            surf = pygame.Surface((trail_size*2, trail_size*2), pygame.SRCALPHA)
+            surf.set_alpha(alpha)
+            pygame.draw.ellipse(surf, trail_color, (0, 0, trail_size*2, trail_size*2))
+            sprite = (surf, trail_size)
+            self.trail_sprites[key] = sprite
+        return sprite
+
+    def _glow_sprite(self, layer_size, alpha):
+        key = (layer_size, alpha)
+        surf = self.glow_sprites.get(key)
+        if surf is None:
+            surf = pygame.Surface((layer_size*2, layer_size*2), pygame.SRCALPHA)
+            pygame.draw.ellipse(surf, self.glow_color + (alpha,), (0, 0, layer_size*2, layer_size*2))
+            self.glow_sprites[key] = surf
+        return surf
+
+    def _powerup_glow(self, powerup_obj):
+        key = "glow_" + powerup_obj.type
+        surf = self.sprites.get(key)
+        if surf is None:
+            surf = build_powerup_glow(powerup_obj.color)
+            self.sprites[key] = surf
+        return surf
+
+    # --- layer ---
+
+    def draw_background(self, surface):
+        """Layer 1: warna background dan area tengah skin yang di-equip."""
+        surface.blit(self._background(), (0, 0))
+
+    def draw_playfield(self, surface, paddle_1_rect, paddle_2_rect, vs_computer):
+        """Layer 2: garis tengah dan paddle."""
+        shadow = self.paddle_shadow
+        # Garis tengah putus-putus (selalu muncul saat main)
+        surface.blit(self._dashed_line(), (LOW_RES_WIDTH // 2, 0))
+        # Gambar paddle dengan bayangan
+        shadow.x = paddle_1_rect.x + 1
+        shadow.y = paddle_1_rect.y + 1
+        surface.fill(COLOR_SHADOW, shadow)
+        surface.fill(self.paddle_color, paddle_1_rect)
+        shadow.x = paddle_2_rect.x + 1
+        shadow.y = paddle_2_rect.y + 1
+        surface.fill(COLOR_SHADOW, shadow)
+        # Paddle 2 pakai skin jika 2P, atau warna AI jika lawan komputer
+        surface.fill(COLOR_AI_PADDLE if vs_computer else self.paddle_color, paddle_2_rect)
+
+    def draw_effects(self, surface, match, ball_rect, ball_trail, ball_glow_timer, ticks):
+        """Layer 3: power up, trail, glow, dan bola."""
+        powerup_obj = match.powerup_obj
+        if powerup_obj:
+            powerup_rect = self.powerup_rect
+            powerup_rect.x = powerup_obj.x
+            powerup_rect.y = powerup_obj.y
+            # Efek glow di sekitar powerup
+            surface.blit(self._powerup_glow(powerup_obj), (powerup_rect.x-6, powerup_rect.y-6),
+                         special_flags=pygame.BLEND_RGBA_ADD)
+            # Kotak powerup
+            pygame.draw.rect(surface, powerup_obj.color, powerup_rect, border_radius=6)
+            # Icon di tengah powerup
+            cx, cy = powerup_rect.center
+            if powerup_obj.type == "slow":
+                pygame.draw.circle(surface, (0,180,255), (cx,cy), 5)
+                pygame.draw.line(surface, (0,180,255), (cx-4,cy), (cx+4,cy), 2)
+            elif powerup_obj.type == "shield":
+                pygame.draw.circle(surface, (255,255,180), (cx,cy), 6, 2)
+                pygame.draw.line(surface, (255,255,180), (cx,cy+3), (cx,cy-3), 2)
+
+        # Efek trail bola dengan alpha/transparansi, style bisa diganti dari shop
+        length = len(ball_trail)
+        if length > 1:
+            for i in range(length - 1):
+                trail_x, trail_y = ball_trail[i]
+                surf, trail_size = self._trail_sprite(i, length)
+                surface.blit(surf, (trail_x - trail_size, trail_y - trail_size))
+
+        # Efek glow bola (layer glow menyala/fire effect)
+        multiplier = match.current_speed_multiplier
+        glow_intensity = max(multiplier - 1.0, ball_glow_timer / BALL_GLOW_DURATION)
+        if glow_intensity > 0:
+            glow_size = int(BALL_RADIUS * (2 + glow_intensity * 1.5))
+            # Efek glow lebih tebal saat ball_glow_timer aktif
+            layer_count = int(6 + glow_intensity*2) if ball_glow_timer > 0 else int(4 + glow_intensity*1.5)
+            centerx = ball_rect.centerx
+            centery = ball_rect.centery
+            for i in range(layer_count):
+                layer_size = glow_size - i * 2
+                if layer_size > 0:
+                    alpha = max(30, 120 - i*15) if ball_glow_timer > 0 else 60
+                    surface.blit(self._glow_sprite(layer_size, alpha), (centerx - layer_size, centery - layer_size))
+
+        # Gambar bayangan bola
+        ball_shadow = self.ball_shadow
+        ball_shadow.x = ball_rect.x + 1
+        ball_shadow.y = ball_rect.y + 1
+        surface.fill(COLOR_SHADOW, ball_shadow)
+
+        # Gambar bola utama
+        pygame.draw.ellipse(surface, self.ball_color, ball_rect)
+
+        # Efek berkedip untuk kecepatan sangat tinggi
+        if multiplier > 2.0 and (ticks // 80) % 2:
+            pygame.draw.ellipse(surface, (255, 255, 255), ball_rect, 1)
+
+    def draw_hud(self, surface, match, speed_up_effect_timer, playing):
+        """Layer 4: skor, kecepatan, indikator power up, dan teks bantuan."""
+        text = self.score_1_text
+        surface.blit(text.get(self.medium_font, match.score_1, COLOR_TEXT), text.rect)
+        text = self.score_2_text
+        surface.blit(text.get(self.medium_font, match.score_2, COLOR_TEXT), text.rect)
+
+        # Indikator efek aktif
+        powerup_active = match.powerup_active
+        if powerup_active:
+            if powerup_active.type == "slow":
+                draw_text_with_shadow(surface, "SLOW MOTION!", self.small_font, (0,255,255), COLOR_SHADOW, LOW_RES_WIDTH//2, 18)
+            elif powerup_active.type == "shield":
+                if powerup_active.owner == "p1":
+                    draw_text_with_shadow(surface, "SHIELD P1!", self.small_font, (255,255,100), COLOR_SHADOW, 60, 18)
+                else:
+                    draw_text_with_shadow(surface, "SHIELD P2!", self.small_font, (255,255,100), COLOR_SHADOW, LOW_RES_WIDTH-60, 18)
+
+        if not playing:
+            # Layar skor: minta lanjut jika belum ada pemenang
+            if match.winner is None:
+                if self.prompt_text is None:
+                    self.prompt_text = self.small_font.render('Tekan SPACE untuk Lanjut', True, COLOR_ACCENT)
+                    self.prompt_rect.size = self.prompt_text.get_size()
+                    self.prompt_rect.center = (LOW_RES_WIDTH // 2, LOW_RES_HEIGHT - 30)
+                surface.blit(self.prompt_text, self.prompt_rect)
+            return
+
+        text = self.speed_text
+        surface.blit(text.get(self.small_font, match.current_speed_multiplier, COLOR_ACCENT), text.rect)
+
+        if speed_up_effect_timer > 0:
+            # Warna dikuantisasi per 1/60 detik supaya surface-nya bisa di-cache
+            timer = min(int(speed_up_effect_timer / SPEED_UP_EFFECT_DURATION * 30), 30)
+            speed_up_text = self.speed_up_texts[timer]
+            if speed_up_text is None:
+                flash_intensity = int(255 * (timer / 30.0))
+                flash_color = (255, 255 - flash_intensity, 255 - flash_intensity)
+                speed_up_text = self.small_font.render("SPEED UP!", True, flash_color)
+                self.speed_up_texts[timer] = speed_up_text
+                self.speed_up_rect.size = speed_up_text.get_size()
+                self.speed_up_rect.center = (LOW_RES_WIDTH // 2, 55)
+            surface.blit(speed_up_text, self.speed_up_rect)
+
+        # Info keluar (pojok bawah)
+        if self.exit_text is None:
+            self.exit_text = self.small_font.render('ESC untuk Keluar', True, COLOR_TEXT)
+            self.exit_rect.size = self.exit_text.get_size()
+            self.exit_rect.center = (LOW_RES_WIDTH // 2, LOW_RES_HEIGHT - 20)
+        surface.blit(self.exit_text, self.exit_rect)
+
+    def draw_particles(self, surface):
+        if self.particles is not None:
+            self.particles.draw(surface)
+
+    # --- frame per state ---
+
+    def draw_play(self, surface, match, ball_rect, paddle_1_rect, paddle_2_rect, ball_trail,
+                  ball_glow_timer, speed_up_effect_timer, vs_computer, ticks):
+        """Frame STATE_PLAY: semua layer digambar ulang."""
+        self.draw_background(surface)
+        self.draw_playfield(surface, paddle_1_rect, paddle_2_rect, vs_computer)
+        self.draw_effects(surface, match, ball_rect, ball_trail, ball_glow_timer, ticks)
+        self.draw_particles(surface)
+        self.draw_hud(surface, match, speed_up_effect_timer, True)
+
+    def draw_score_screen(self, surface, match, ball_rect, paddle_1_rect, paddle_2_rect, vs_computer):
+        """Frame STATE_SCORE_SCREEN: layer statis digambar sekali lalu di-blit."""
+        key = (id(match), match.steps, match.score_1, match.score_2, self.version, vs_computer)
+        if key != self.static_key:
+            frame = self.static_frame
+            self.draw_background(frame)
+            self.draw_playfield(frame, paddle_1_rect, paddle_2_rect, vs_computer)
+            # Bola beku: tanpa trail dan tanpa kedip
+            self.draw_effects(frame, match, ball_rect, (), 0, 0)
+            self.draw_hud(frame, match, 0, False)
+            self.static_key = key
+        surface.blit(self.static_frame, (0, 0))
+        # Ledakan skor masih beranimasi di atas layer statis
+        self.draw_particles(surface)
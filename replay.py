@@ -0,0 +1,116 @@
+"""Rekam dan putar ulang input pertandingan (tanpa pygame).
+
+Replay hanya menyimpan seed, mode, rate simulasi, dan input per step.
+Semua yang lain (AI, power up, pantulan) dihitung ulang oleh sim.Match
+secara deterministik dengan dt tetap 1/sim_rate.
+"""
+import struct
+
+from constants import *
+from sim import Match
+
+REPLAY_MAGIC = b"CPRP"
+# Versi 2: step simulasi tetap (tanpa dt/now per record), timer dalam detik
+# Versi 3: input paddle analog (int8, -127..127 = -PADDLE_SPEED..PADDLE_SPEED)
+# Versi 4: ramp kecepatan per tick integer (sim.SpeedRamp)
+# Versi 5: record difficulty adjustment AI adaptif (file versi 4 tetap bisa diputar)
+# Versi 6: titik potong AI dihitung sekali per lintasan (hasil float sedikit beda dari versi 5)
+REPLAY_VERSION = 6
+SUPPORTED_VERSIONS = (6,)
+MOVE_SCALE = 127
+
+# magic, versi, seed, mode, difficulty, step per detik
+_HEADER = struct.Struct("<4sHQBBH")
+# jenis, gerak paddle 1, gerak paddle 2 (terkuantisasi)
+_RECORD = struct.Struct("<Bbb")
+
+RECORD_STEP = 0
+RECORD_NEXT_ROUND = 1
+RECORD_START = 2
+RECORD_AI_ADJUSTMENT = 3  # gerak paddle 1 = adjustment terkuantisasi
+
+
+def encode_move(move):
+    """Gerak paddle (pixel/step) -> int8 yang disimpan di replay."""
+    q = int(round(move / PADDLE_SPEED * MOVE_SCALE))
+    return max(-MOVE_SCALE, min(MOVE_SCALE, q))
+
+
+def decode_move(q):
+    return q * PADDLE_SPEED / MOVE_SCALE
+
+
+def quantize_move(move):
+    """Gerak yang persis bisa direkam; game memakai ini supaya replay tidak menyimpang."""
+    return decode_move(encode_move(move))
+
+
+def encode_adjustment(adjustment):
+    """Difficulty adjustment AI (-AI_ADAPTIVE_RANGE..AI_ADAPTIVE_RANGE) -> int8."""
+    q = int(round(adjustment / AI_ADAPTIVE_RANGE * MOVE_SCALE))
+    return max(-MOVE_SCALE, min(MOVE_SCALE, q))
+
+
+def decode_adjustment(q):
+    return q * AI_ADAPTIVE_RANGE / MOVE_SCALE
+
+
+def quantize_adjustment(adjustment):
+    return decode_adjustment(encode_adjustment(adjustment))
+
+
+class ReplayRecorder:
+    """Mengumpulkan input pertandingan di memori, lalu ditulis ke file."""
+
+    def __init__(self, seed, mode, difficulty, sim_rate=SIM_RATE):
+        self.seed = seed
+        self.mode = mode
+        self.difficulty = difficulty
+        self.sim_rate = sim_rate
+        self.records = bytearray()
+
+    def step(self, paddle_1_move, paddle_2_move):
+        self.records += _RECORD.pack(RECORD_STEP, encode_move(paddle_1_move), encode_move(paddle_2_move))
+
+    def start(self):
+        self.records += _RECORD.pack(RECORD_START, 0, 0)
+
+    def next_round(self):
+        self.records += _RECORD.pack(RECORD_NEXT_ROUND, 0, 0)
+
+    def ai_adjustment(self, adjustment):
+        self.records += _RECORD.pack(RECORD_AI_ADJUSTMENT, encode_adjustment(adjustment), 0)
+
+    def save(self, path):
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.mode, self.difficulty,
+                                 self.sim_rate))
+            f.write(self.records)
+
+
+def load_replay(path):
+    """Baca file replay. Mengembalikan (seed, mode, difficulty, sim_rate, records)."""
+    with open(path, "rb") as f:
+        data = f.read()
+    magic, version = struct.unpack_from("<4sH", data)
+    if magic != REPLAY_MAGIC or version not in SUPPORTED_VERSIONS:
+        raise ValueError("Bukan file replay Cozy Pong yang didukung: %s" % path)
+    _, _, seed, mode, difficulty, sim_rate = _HEADER.unpack_from(data)
+    records = list(_RECORD.iter_unpack(data[_HEADER.size:]))
+    return seed, mode, difficulty, sim_rate, records
+
+
+def play_back(seed, mode, difficulty, sim_rate, records):
+    """Jalankan ulang replay di sim.Match dan kembalikan match akhirnya."""
+    match = Match(mode, difficulty, seed=seed)
+    dt = 1.0 / sim_rate
+    for kind, move_1, move_2 in records:
+        if kind == RECORD_START:
+            match.start()
+        elif kind == RECORD_NEXT_ROUND:
+            match.next_round()
+        elif kind == RECORD_AI_ADJUSTMENT:
+            match.set_ai_adjustment(decode_adjustment(move_1))
+        else:
+            match.step(dt, decode_move(move_1), decode_move(move_2))
+    return match
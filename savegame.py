@@ -0,0 +1,55 @@
+"""Simpan dan pulihkan pertandingan yang di-suspend (tanpa pygame).
+
+File berisi header kecil lalu Match.to_bytes() (lihat matchstate.py). Timer
+ronde dihitung dalam tick simulasi (match.steps - match.round_start_step),
+jadi setelah resume ramp kecepatan melanjutkan dari tick yang sama tanpa
+perlu disesuaikan dengan jam dinding.
+"""
+import os
+import struct
+
+from sim import Match
+
+SAVE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cozypong")
+SAVE_PATH = os.path.join(SAVE_DIR, "suspend.bin")
+SAVE_MAGIC = b"CPSV"
+# Versi 2: timer ronde dalam tick (round_start_step)
+# Versi 3: cache titik potong lintasan di AIState
+# Versi 4: tanpa last_ball_x/prediction_timer (tidak terpakai) di AIState
+SAVE_VERSION = 4
+
+# magic, versi
+_HEADER = struct.Struct("<4sH")
+
+
+def save_snapshot(match, path=SAVE_PATH):
+    """Tulis snapshot match. Ditulis ke file sementara dulu supaya tidak pernah setengah jadi."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_HEADER.pack(SAVE_MAGIC, SAVE_VERSION))
+            f.write(match.to_bytes())
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print("Gagal menyimpan pertandingan: %s" % e)
+
+
+def load_snapshot(path=SAVE_PATH):
+    """Match dari file snapshot, atau None jika tidak ada / tidak valid."""
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        magic, version = _HEADER.unpack_from(data)
+        if magic != SAVE_MAGIC or version != SAVE_VERSION:
+            return None
+        return Match.from_bytes(data, _HEADER.size)
+    except (OSError, struct.error, KeyError, IndexError, ValueError):
+        return None
+
+
+def delete_snapshot(path=SAVE_PATH):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,289 @@
+"""Simulasi fisika satu pertandingan pong tanpa pygame.
+
+Dipakai oleh game (pingpong.py) dan oleh subcommand headless di cli.py
+(simulate, bench, replay), jadi fisika yang diukur sama dengan yang dimainkan.
+"""
+from ai import update_ai
+from constants import *
+from matchstate import MatchState, PowerupState
+
+
+def rects_overlap(ax, ay, aw, ah, bx, by, bw, bh):
+    """Sama dengan Rect.colliderect, tapi untuk koordinat float."""
+    return ax < bx + bw and bx < ax + aw and ay < by + bh and by < ay + ah
+
+
+class SpeedRamp:
+    """Jadwal multiplier kecepatan bola dalam tick simulasi.
+
+    Naik `step` tiap `interval` detik sejak awal ronde, dibatasi `cap`.
+    Dihitung dari jumlah tick (integer), jadi hasilnya sama persis untuk
+    game, replay, dan simulasi batch, dan `multiplier()` O(1) untuk tick mana pun.
+    """
+
+    __slots__ = ("interval_ticks", "step", "cap")
+
+    def __init__(self, interval=SPEED_INCREASE_INTERVAL, step=SPEED_INCREASE_AMOUNT, cap=MAX_SPEED_MULTIPLIER,
+                 sim_rate=SIM_RATE):
+        self.interval_ticks = max(1, int(round(interval * sim_rate)))
+        self.step = step
+        self.cap = cap
+
+    def multiplier(self, ticks):
+        """Multiplier setelah `ticks` tick sejak awal ronde."""
+        return min(1.0 + (ticks // self.interval_ticks) * self.step, self.cap)
+
+
+SPEED_RAMP = SpeedRamp()
+
+
+class Match(MatchState):
+    """State dan fisika satu pertandingan.
+
+    Data ada di MatchState (matchstate.py), jadi `copy()`/`to_bytes()`
+    memberi snapshot yang bisa dilanjutkan. Posisi disimpan sebagai float
+    (pojok kiri atas, seperti Rect) supaya gerakan sub-pixel tidak dibulatkan
+    tiap frame. `step()` mengembalikan daftar event (tuple) yang dipakai game
+    untuk efek visual. Kecepatan dalam pixel per 1/60 detik; semua timer dalam
+    detik. Posisi sebelum step terakhir (`prev_*`) disimpan untuk interpolasi
+    render.
+    """
+
+    __slots__ = ()
+    speed_ramp = SPEED_RAMP
+
+    def save_previous(self):
+        ball = self.ball
+        ball.prev_x = ball.x
+        ball.prev_y = ball.y
+        self.paddle_1.prev_y = self.paddle_1.y
+        self.paddle_2.prev_y = self.paddle_2.y
+
+    def lerp_positions(self, alpha):
+        """Posisi (paddle_1_y, paddle_2_y, ball_x, ball_y) di antara dua step, 0 <= alpha <= 1."""
+        ball = self.ball
+        paddle_1 = self.paddle_1
+        paddle_2 = self.paddle_2
+        return (paddle_1.prev_y + (paddle_1.y - paddle_1.prev_y) * alpha,
+                paddle_2.prev_y + (paddle_2.y - paddle_2.prev_y) * alpha,
+                ball.prev_x + (ball.x - ball.prev_x) * alpha,
+                ball.prev_y + (ball.y - ball.prev_y) * alpha)
+
+    def reset_ball(self, direction_to_loser=1):
+        rng = self.rng
+        ball = self.ball
+        ball.x = float(BALL_START_X)
+        ball.y = float(BALL_START_Y)
+
+        # Reset kecepatan ke nilai awal
+        self.current_speed_multiplier = 1.0
+        self.base_speed_x = BALL_SPEED_X_INITIAL
+        self.base_speed_y = BALL_SPEED_Y_INITIAL
+
+        ball.vel_x = self.base_speed_x * direction_to_loser * rng.choice([-1, 1])
+        ball.vel_y = self.base_speed_y * rng.choice([-1, 1])
+        # Bola teleport ke tengah: jangan diinterpolasi dari posisi lama
+        self.save_previous()
+
+        # Reset timer (dalam tick simulasi)
+        self.round_start_step = self.steps
+        self.last_speed_increase_step = self.steps
+
+    def start(self):
+        """Mulai pertandingan baru dari skor 0-0."""
+        self.score_1 = 0
+        self.score_2 = 0
+        self.winner = None
+        self.point_scored_by = None
+        self.reset_ball(self.rng.choice([-1, 1]))
+
+    def next_round(self):
+        """Lanjut ke ronde berikutnya setelah poin, bola mengarah ke yang kalah poin."""
+        direction_to_loser = 1 if self.point_scored_by == 1 else -1
+        self.point_scored_by = None
+        self.reset_ball(direction_to_loser)
+
+    def set_ai_adjustment(self, adjustment):
+        """Difficulty adjustment untuk AI adaptif; dipanggil di antara poin."""
+        for ai in self.ai.values():
+            if ai.difficulty == DIFFICULTY_ADAPTIVE:
+                ai.difficulty_adjustment = adjustment
+
+    def update_ball_speed(self):
+        new_speed_multiplier = self.speed_ramp.multiplier(self.steps - self.round_start_step)
+
+        # Jika ada peningkatan kecepatan
+        if new_speed_multiplier > self.current_speed_multiplier:
+            self.current_speed_multiplier = new_speed_multiplier
+
+            # Terapkan multiplier ke kecepatan bola
+            ball = self.ball
+            speed_direction_x = 1 if ball.vel_x > 0 else -1
+            speed_direction_y = 1 if ball.vel_y > 0 else -1
+
+            ball.vel_x = self.base_speed_x * self.current_speed_multiplier * speed_direction_x
+            ball.vel_y = self.base_speed_y * self.current_speed_multiplier * speed_direction_y
+            self.last_speed_increase_step = self.steps
+            self.events.append(("speed_up", self.current_speed_multiplier))
+
+    def update_powerups(self, dt):
+        """Efek, spawn, dan pengambilan power up. Mengembalikan (slow, shield_p1, shield_p2)."""
+        rng = self.rng
+        events = self.events
+        # === POWER UP EFFECT ===
+        slow_active = False
+        shield_p1 = False
+        shield_p2 = False
+        powerup_active = self.powerup_active
+        if powerup_active:
+            if powerup_active.type == "slow":
+                slow_active = True
+            elif powerup_active.type == "shield":
+                if powerup_active.owner == "p1":
+                    shield_p1 = True
+                elif powerup_active.owner == "p2":
+                    shield_p2 = True
+            powerup_active.timer -= dt
+            if powerup_active.timer <= 0:
+                self.powerup_active = None
+                events.append(("powerup_expire", powerup_active.type))
+
+        # === POWER UP SPAWN ===
+        if not self.powerup_obj and self.powerup_spawn_timer <= 0:
+            # Peluang spawn sebanding dt: rata-rata sekali tiap POWERUP_SPAWN_MEAN detik
+            if rng.random() < dt / POWERUP_SPAWN_MEAN:
+                ptype = rng.choice(POWERUP_TYPES)
+                size = POWERUP_SIZE
+                px = LOW_RES_WIDTH//2 - size//2 + rng.randint(-40,40)
+                py = LOW_RES_HEIGHT//2 - size//2 + rng.randint(-60,60)
+                self.powerup_obj = PowerupState(ptype["type"], px, py, size)
+                self.powerup_spawn_timer = float(rng.randint(*POWERUP_LIFETIME))  # waktu sebelum powerup hilang jika tidak diambil
+                events.append(("powerup_spawn", ptype["type"]))
+        elif self.powerup_obj:
+            self.powerup_spawn_timer -= dt
+            if self.powerup_spawn_timer <= 0:
+                self.powerup_obj = None
+
+        # Cek bola ambil powerup
+        obj = self.powerup_obj
+        ball = self.ball
+        if obj and rects_overlap(ball.x, ball.y, BALL_RADIUS * 2, BALL_RADIUS * 2,
+                                 obj.x, obj.y, obj.size, obj.size):
+            owner = None
+            if obj.type == "shield":
+                # Shield diberikan ke paddle terakhir yang menyentuh bola
+                owner = "p1" if ball.vel_x < 0 else "p2"
+            self.powerup_active = PowerupState(obj.type, timer=POWERUP_DURATION, owner=owner)
+            self.powerup_obj = None
+            events.append(("powerup", obj.type, owner))
+        return slow_active, shield_p1, shield_p2
+
+    def step(self, dt, paddle_1_move=0, paddle_2_move=0):
+        """Maju `dt` detik (game memakai SIM_DT). Gerakan paddle AI menimpa input untuk sisi AI.
+
+        Ramp kecepatan dihitung per tick (`speed_ramp`), jadi satu step selalu satu tick.
+        """
+        events = self.events
+        events.clear()
+        self.time += dt
+        self.steps += 1
+        self.save_previous()
+
+        slow_active, shield_p1, shield_p2 = self.update_powerups(dt)
+
+        # Update kecepatan bola secara bertahap
+        self.update_ball_speed()
+
+        # Update AI
+        ai = self.ai
+        if 1 in ai:
+            paddle_1_move = update_ai(ai[1], self, dt)
+        if 2 in ai:
+            paddle_2_move = update_ai(ai[2], self, dt)
+
+        # Pergerakan paddle
+        speed_mod = 0.4 if slow_active else 1.0
+        frame_scale = 60 * dt * speed_mod
+        paddle_1 = self.paddle_1
+        paddle_2 = self.paddle_2
+        paddle_1.y = min(max(paddle_1.y + paddle_1_move * frame_scale, 0), LOW_RES_HEIGHT - PADDLE_HEIGHT)
+        paddle_2.y = min(max(paddle_2.y + paddle_2_move * frame_scale, 0), LOW_RES_HEIGHT - PADDLE_HEIGHT)
+
+        # Pergerakan bola
+        ball = self.ball
+        ball.x += ball.vel_x * frame_scale
+        ball.y += ball.vel_y * frame_scale
+
+        # Kolisi bola dengan dinding atas/bawah
+        ball_size = BALL_RADIUS * 2
+        if ball.y <= 0:
+            ball.y = 0.0
+            ball.vel_y *= -1
+            events.append(("wall", 0))
+        if ball.y + ball_size >= LOW_RES_HEIGHT:
+            ball.y = float(LOW_RES_HEIGHT - ball_size)
+            ball.vel_y *= -1
+            events.append(("wall", 1))
+
+        # Kolisi bola dengan paddle
+        multiplier = self.current_speed_multiplier
+        if ball.vel_x < 0 and rects_overlap(PADDLE_1_X, paddle_1.y, PADDLE_WIDTH, PADDLE_HEIGHT,
+                                            ball.x, ball.y, ball_size, ball_size):
+            # Shield: bola mantul tanpa efek jika shield aktif
+            if shield_p1:
+                ball.vel_x *= -1
+                self.powerup_active = None
+                events.append(("shield_block", 1))
+            else:
+                # Pertahankan kecepatan yang sudah ditingkatkan
+                ball.vel_x = abs(ball.vel_x) * 1.05
+                ball.x = PADDLE_1_X + PADDLE_WIDTH + 1
+                relative_intersect_y = ((paddle_1.y + PADDLE_HEIGHT / 2) - (ball.y + BALL_RADIUS)) / (PADDLE_HEIGHT / 2)
+                ball.vel_y -= relative_intersect_y * 0.5 * multiplier
+                events.append(("paddle_hit", 1, relative_intersect_y))
+
+        if ball.vel_x > 0 and rects_overlap(PADDLE_2_X, paddle_2.y, PADDLE_WIDTH, PADDLE_HEIGHT,
+                                            ball.x, ball.y, ball_size, ball_size):
+            if shield_p2:
+                ball.vel_x *= -1
+                self.powerup_active = None
+                events.append(("shield_block", 2))
+            else:
+                ball.vel_x = -abs(ball.vel_x) * 1.05
+                ball.x = PADDLE_2_X - 1 - ball_size
+                relative_intersect_y = ((paddle_2.y + PADDLE_HEIGHT / 2) - (ball.y + BALL_RADIUS)) / (PADDLE_HEIGHT / 2)
+                ball.vel_y -= relative_intersect_y * 0.5 * multiplier
+                events.append(("paddle_hit", 2, relative_intersect_y))
+
+        # Cek skor
+        if ball.x <= 0:
+            self.score_2 += 1
+            self.point_scored_by = 2
+            if self.score_2 >= WINNING_SCORE:
+                self.winner = 2
+            events.append(("point", 2))
+        elif ball.x + ball_size >= LOW_RES_WIDTH:
+            self.score_1 += 1
+            self.point_scored_by = 1
+            if self.score_1 >= WINNING_SCORE:
+                self.winner = 1
+            events.append(("point", 1))
+        return events
+
+
+def run_match(match, dt=SIM_DT, max_steps=SIM_RATE * 60 * 30, on_step=None):
+    """Mainkan satu pertandingan headless sampai ada pemenang.
+
+    Sisi yang bukan AI diam. `on_step(match, events)` (opsional) dipanggil
+    setelah tiap step, sebelum ronde di-reset. Mengembalikan jumlah step.
+    """
+    match.start()
+    steps = 0
+    while match.winner is None and steps < max_steps:
+        events = match.step(dt)
+        steps += 1
+        if on_step is not None and events:
+            on_step(match, events)
+        if match.point_scored_by is not None and match.winner is None:
+            match.next_round()
+    return steps
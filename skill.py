@@ -0,0 +1,99 @@
+"""Model skill pemain untuk AI adaptif (tanpa pygame).
+
+Tiga rata-rata bergerak eksponensial (EWMA), masing-masing O(1) per update:
+hit rate (bola yang dikembalikan vs yang lolos), intercept error (jarak
+bola dari tengah paddle, dinormalisasi ke setengah tinggi paddle) dan
+panjang rally. `adjustment()` memetakan skill secara kontinu ke
+AIState.difficulty_adjustment (lihat ai.get_ai_settings). State-nya cukup
+empat angka, disimpan per profil di profiles.json.
+"""
+import json
+import os
+
+from constants import *
+
+PROFILE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cozypong")
+PROFILE_PATH = os.path.join(PROFILE_DIR, "profiles.json")
+DEFAULT_PROFILE = "player"
+
+SKILL_ALPHA = 0.1         # bobot observasi baru di EWMA
+RALLY_REFERENCE = 20.0    # detik; rally sepanjang ini dianggap skill penuh
+MAX_MISS_ERROR = 3.0      # batas intercept error untuk bola yang lolos
+
+
+class SkillModel:
+    """Estimasi skill satu pemain (paddle kiri melawan AI)."""
+
+    __slots__ = ("hit_rate", "intercept_error", "rally_length", "samples")
+
+    def __init__(self, hit_rate=0.5, intercept_error=1.0, rally_length=RALLY_REFERENCE / 2, samples=0):
+        self.hit_rate = hit_rate
+        self.intercept_error = intercept_error
+        self.rally_length = rally_length
+        self.samples = samples
+
+    def observe_return(self, hit, error):
+        """Bola sampai di paddle pemain: `hit` True jika dikembalikan."""
+        self.hit_rate += SKILL_ALPHA * ((1.0 if hit else 0.0) - self.hit_rate)
+        self.intercept_error += SKILL_ALPHA * (min(error, MAX_MISS_ERROR) - self.intercept_error)
+        self.samples += 1
+
+    def observe_rally(self, seconds):
+        self.rally_length += SKILL_ALPHA * (seconds - self.rally_length)
+
+    def observe(self, match, events, side=1):
+        """Update dari event Match.step() untuk pemain di `side`."""
+        for event in events:
+            kind = event[0]
+            if kind == "paddle_hit" and event[1] == side:
+                self.observe_return(True, abs(event[2]))
+            elif kind == "point":
+                if event[1] != side:
+                    # Bola lolos: seberapa jauh paddle dari bola
+                    paddle_y = match.paddle_1.y if side == 1 else match.paddle_2.y
+                    miss = abs((paddle_y + PADDLE_HEIGHT / 2) - (match.ball.y + BALL_RADIUS))
+                    self.observe_return(False, miss / (PADDLE_HEIGHT / 2))
+                self.observe_rally((match.steps - match.round_start_step) / SIM_RATE)
+
+    def skill(self):
+        """Skill 0 (pemula) .. 1 (sangat baik)."""
+        precision = 1.0 - min(self.intercept_error, 2.0) / 2.0
+        endurance = min(self.rally_length / RALLY_REFERENCE, 1.0)
+        return 0.6 * self.hit_rate + 0.2 * precision + 0.2 * endurance
+
+    def adjustment(self):
+        """Difficulty adjustment AI: -AI_ADAPTIVE_RANGE (lebih mudah) .. +AI_ADAPTIVE_RANGE."""
+        return (self.skill() - 0.5) * 2 * AI_ADAPTIVE_RANGE
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{name: data[name] for name in cls.__slots__ if name in data})
+
+
+def load_profile(name=DEFAULT_PROFILE, path=PROFILE_PATH):
+    """SkillModel untuk profil `name` (baru jika belum ada / file rusak)."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return SkillModel.from_dict(json.load(f)[name])
+    except (OSError, ValueError, KeyError, TypeError):
+        return SkillModel()
+
+
+def save_profile(model, name=DEFAULT_PROFILE, path=PROFILE_PATH):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            profiles = json.load(f)
+    except (OSError, ValueError):
+        profiles = {}
+    profiles[name] = model.to_dict()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(profiles, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print("Gagal menyimpan profil: %s" % e)
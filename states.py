@@ -0,0 +1,696 @@
+"""State game: satu objek per layar dengan handle_event/update/render.
+
+Game (pingpong.py) memilih state aktif lewat tabel `states[state_id]`, jadi
+tiap frame hanya kode milik state aktif yang jalan. Menu tidak punya logika
+per frame (`needs_update = False`) dan frame-nya di-cache sampai ada yang
+berubah.
+"""
+import math
+import time
+
+import pygame
+
+from ai import get_neural_policy
+from constants import *
+from render import draw_text_with_shadow
+from replay import quantize_move
+from tables import Table
+from telemetry import match_event_rows
+
+MENU_OPTIONS = ["2 PLAYER", "VS COMPUTER", "SHOP", "PERINGKAT", "QUIT"]
+MENU_RESUME = "LANJUTKAN"  # Muncul di atas menu jika ada pertandingan yang di-suspend
+MENU_INSTRUCTIONS = ["UP/DOWN: navigasi", "SPACE: pilih", "ESC: keluar"]
+DIFFICULTY_OPTIONS = [("MUDAH", DIFFICULTY_EASY), ("SEDANG", DIFFICULTY_MEDIUM), ("SULIT", DIFFICULTY_HARD)]
+if AI_DIFFICULTY_ADAPTIVE:
+    DIFFICULTY_OPTIONS.append(("ADAPTIF", DIFFICULTY_ADAPTIVE))
+DIFFICULTY_NEURAL_OPTION = ("NEURAL", DIFFICULTY_NEURAL)  # hanya jika bobot policy bisa dimuat
+SHOP_INSTRUCTIONS = ["UP/DOWN: pilih skin", "SPACE: beli/pakai", "ESC/BACKSPACE: kembali"]
+LEADERBOARD_ROWS = 7      # baris top rating
+LEADERBOARD_HISTORY = 3   # pertandingan terakhir profil aktif
+
+# Demo attract mode di menu utama
+ATTRACT_EVENT = pygame.event.custom_type()
+ATTRACT_DIFFICULTY = DIFFICULTY_HARD  # rally panjang, lebih menarik ditonton
+ATTRACT_BUDGET = 0.25       # bagian maksimum waktu frame untuk demo (simulasi + gambar)
+ATTRACT_MAX_DIVISOR = 4     # demo paling jarang digambar tiap 4 frame (15 FPS di 60 FPS)
+ATTRACT_DIM_ALPHA = 120     # gelapkan demo supaya menu tetap terbaca
+ATTRACT_INPUT_EVENTS = (pygame.KEYDOWN, pygame.JOYBUTTONDOWN, pygame.JOYHATMOTION)
+
+
+class GameState:
+    """Antarmuka dasar. Semua method boleh tidak di-override."""
+
+    # False untuk state yang tidak berubah tanpa input (Game melewati update)
+    needs_update = True
+
+    def __init__(self, game):
+        self.game = game
+
+    def on_enter(self, previous):
+        pass
+
+    def on_exit(self, next_state):
+        pass
+
+    def handle_event(self, event):
+        pass
+
+    def update(self, dt):
+        pass
+
+    def render(self, surface):
+        pass
+
+
+class MenuState(GameState):
+    """State statis: frame digambar ulang hanya jika `frame_key()` berubah."""
+
+    needs_update = False
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.frame = pygame.Surface((LOW_RES_WIDTH, LOW_RES_HEIGHT))
+        self.cached_key = None
+
+    def frame_key(self):
+        """Nilai yang menentukan isi frame (selain skin/font)."""
+        return ()
+
+    def draw(self, surface):
+        pass
+
+    def render(self, surface):
+        # renderer.version naik saat skin atau font berganti
+        key = (self.game.renderer.version, self.game.fonts_ready) + self.frame_key()
+        if key != self.cached_key:
+            self.game.renderer.draw_background(self.frame)
+            self.draw(self.frame)
+            self.cached_key = key
+        surface.blit(self.frame, (0, 0))
+
+
+class MainMenuState(MenuState):
+    """Menu utama. Setelah ATTRACT_DELAY_MS tanpa input, pertandingan demo AI
+    vs AI (tables.Table, kedua paddle digerakkan update_ai) berjalan di
+    belakang menu. Demo hanya digambar tiap `demo_divisor` frame dan
+    divisor naik otomatis jika biaya demo melebihi ATTRACT_BUDGET dari
+    waktu frame (atau frame sudah telat); di divisor maksimum demo berhenti
+    dan dicoba lagi setelah delay berikutnya. Input apa pun menghentikan
+    demo, jadi menu kembali statis dan menunggu event tanpa jeda frame.
+    """
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.selected = 0  # Index ke options()
+        self.needs_update = False  # True selama demo berjalan
+        self.demo = None
+        self.demo_frame = pygame.Surface((LOW_RES_WIDTH, LOW_RES_HEIGHT))
+        self.overlay = pygame.Surface((LOW_RES_WIDTH, LOW_RES_HEIGHT), pygame.SRCALPHA)
+        self.dim = pygame.Surface((LOW_RES_WIDTH, LOW_RES_HEIGHT), pygame.SRCALPHA)
+        self.dim.fill((0, 0, 0, ATTRACT_DIM_ALPHA))
+        self.demo_fonts = None
+        self.demo_seed = 0
+        self.demo_divisor = 1
+        self.demo_frames = 0
+        self.demo_accumulator = 0.0
+        self.demo_cost = 0.0  # EWMA detik per frame loop yang dipakai demo
+        self.frame_dt = 0.0   # EWMA waktu frame loop selama demo
+
+    def start_demo(self):
+        game = self.game
+        self.demo_seed += 1
+        self.demo = Table(0, self.demo_frame, ATTRACT_DIFFICULTY, self.demo_seed)
+        self.demo_fonts = {"small": game.small_font, "medium": game.medium_font, "title": game.title_font}
+        self.demo_divisor = 1
+        self.demo_frames = 0
+        self.demo_accumulator = 0.0
+        self.demo_cost = 0.0
+        self.frame_dt = 0.0
+        self.needs_update = True
+        self.draw_demo()
+
+    def stop_demo(self, retry=True):
+        self.demo = None
+        self.needs_update = False
+        self.cached_key = None  # kembali ke frame statis
+        # Timer sekali jalan; dipasang ulang setiap kali menu kembali diam
+        pygame.time.set_timer(ATTRACT_EVENT, ATTRACT_DELAY_MS if retry else 0, 1)
+
+    def draw_demo(self):
+        demo = self.demo
+        demo.draw(self.game.renderer, self.demo_fonts, self.demo_accumulator / SIM_DT, self.game.get_ticks(),
+                  hud=False)
+        self.demo_frame.blit(self.dim, (0, 0))
+
+    def update(self, dt):
+        demo = self.demo
+        if demo is None:
+            return
+        self.demo_accumulator += min(dt, MAX_FRAME_TIME)
+        frame_time = 1.0 / (self.game.render_fps or TARGET_FPS)
+        self.frame_dt = dt if not self.frame_dt else self.frame_dt * 0.9 + dt * 0.1
+        self.demo_frames += 1
+        if self.demo_frames % self.demo_divisor:
+            return  # frame ini hanya blit frame demo terakhir; simulasi menyusul di frame berikutnya
+        start = time.perf_counter()
+        # Satu pemanggilan update_ai per paddle per tick; titik potong di-cache per lintasan
+        while self.demo_accumulator >= SIM_DT:
+            self.demo_accumulator -= SIM_DT
+            demo.step()
+        if demo.ball_glow_timer > 0:
+            demo.ball_glow_timer -= dt * self.demo_divisor
+        self.draw_demo()
+        cost = (time.perf_counter() - start) / self.demo_divisor
+        self.demo_cost = cost if not self.demo_cost else self.demo_cost * 0.9 + cost * 0.1
+
+        # Budget: turunkan frame rate demo jika mahal atau frame loop sudah telat
+        if self.demo_cost > ATTRACT_BUDGET * frame_time or self.frame_dt > 1.5 * frame_time:
+            if self.demo_divisor >= ATTRACT_MAX_DIVISOR:
+                self.stop_demo()
+                return
+            self.demo_divisor *= 2
+            self.demo_cost = 0.0
+            self.frame_dt = 0.0
+        elif self.demo_divisor > 1 and self.demo_cost * 2 < ATTRACT_BUDGET * frame_time / 4:
+            self.demo_divisor //= 2
+            self.demo_cost = 0.0
+            self.frame_dt = 0.0
+
+    def render(self, surface):
+        if self.demo is None:
+            super().render(surface)
+            return
+        # Layer menu (teks saja) di-cache seperti frame statis, ditumpuk di atas demo
+        key = (self.game.renderer.version, self.game.fonts_ready) + self.frame_key()
+        if key != self.cached_key:
+            self.overlay.fill((0, 0, 0, 0))
+            self.draw(self.overlay)
+            self.cached_key = key
+        surface.blit(self.demo_frame, (0, 0))
+        surface.blit(self.overlay, (0, 0))
+
+    def options(self):
+        if self.game.suspended is not None:
+            return [MENU_RESUME] + MENU_OPTIONS
+        return MENU_OPTIONS
+
+    def on_enter(self, previous):
+        if self.game.suspended is not None:
+            # Kursor di LANJUTKAN: pertandingan baru (yang membuang suspend) harus dipilih sendiri
+            self.selected = 0
+        else:
+            self.selected = min(self.selected, len(self.options()) - 1)
+        self.stop_demo()
+
+    def on_exit(self, next_state):
+        self.stop_demo(retry=False)
+
+    def frame_key(self):
+        return (self.selected, self.game.suspended is not None)
+
+    def handle_event(self, event):
+        game = self.game
+        if event.type == ATTRACT_EVENT:
+            if self.demo is None and game.fonts_ready:
+                self.start_demo()
+            else:
+                self.stop_demo()
+            return
+        if event.type in ATTRACT_INPUT_EVENTS:
+            if self.demo is not None:
+                self.stop_demo()
+            else:
+                # Hitung ulang delay dari input terakhir
+                pygame.time.set_timer(ATTRACT_EVENT, ATTRACT_DELAY_MS, 1)
+        if event.type != pygame.KEYDOWN:
+            return
+        options = self.options()
+        if event.key == pygame.K_ESCAPE:
+            game.running = False
+        elif event.key == pygame.K_UP:
+            self.selected = (self.selected - 1) % len(options)
+            game.audio.play("menu_move")
+        elif event.key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % len(options)
+            game.audio.play("menu_move")
+        elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
+            game.audio.play("menu_select")
+            choice = options[self.selected]
+            if choice == MENU_RESUME:
+                game.resume()
+            elif choice == "2 PLAYER":
+                game.start_new_game(MODE_TWO_PLAYER)
+            elif choice == "VS COMPUTER":
+                game.change_state(STATE_DIFFICULTY_SELECT)
+            elif choice == "SHOP":
+                game.change_state(STATE_SHOP)
+            elif choice == "PERINGKAT":
+                game.change_state(STATE_LEADERBOARD)
+            elif choice == "QUIT":
+                game.running = False
+
+    def draw(self, surface):
+        game = self.game
+        # Judul game
+        draw_text_with_shadow(surface, 'COZY PONG', game.title_font, COLOR_TEXT, COLOR_SHADOW, LOW_RES_WIDTH // 2, 40)
+        # Menu options (lebih rapat jika ada opsi LANJUTKAN)
+        options = self.options()
+        if len(options) <= 4:
+            menu_start_y, menu_spacing = 100, 25
+        elif len(options) == 5:
+            menu_start_y, menu_spacing = 92, 20
+        else:
+            menu_start_y, menu_spacing = 80, 18
+        for i, option in enumerate(options):
+            color = COLOR_SELECTED if i == self.selected else COLOR_TEXT
+            draw_text_with_shadow(surface, option, game.medium_font, color, COLOR_SHADOW, LOW_RES_WIDTH // 2, menu_start_y + i * menu_spacing)
+            if i == self.selected:
+                draw_text_with_shadow(surface, '>', game.medium_font, COLOR_SELECTED, COLOR_SHADOW, LOW_RES_WIDTH // 2 - 80, menu_start_y + i * menu_spacing)
+        # Instruksi
+        instruction_y = 190
+        for instruction in MENU_INSTRUCTIONS:
+            draw_text_with_shadow(surface, instruction, game.small_font, COLOR_ACCENT, COLOR_SHADOW, LOW_RES_WIDTH // 2, instruction_y)
+            instruction_y += 15
+
+
+class ShopState(MenuState):
+    max_visible = 4  # Maksimal item shop yang ditampilkan per halaman
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.selected = 0
+
+    def frame_key(self):
+        game = self.game
+        return (self.selected, game.coins, len(game.owned_skins), tuple(game.equipped.values()))
+
+    def handle_event(self, event):
+        game = self.game
+        if event.type != pygame.KEYDOWN:
+            return
+        shop_options = game.shop_options
+        if event.key == pygame.K_UP:
+            self.selected = (self.selected - 1) % len(shop_options)
+            game.audio.play("menu_move")
+        elif event.key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % len(shop_options)
+            game.audio.play("menu_move")
+        elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
+            game.audio.play("menu_select")
+            # Sistem beli dan pakai skin: yang sudah dimiliki langsung dipakai,
+            # yang belum dibeli dulu jika koin cukup lalu langsung dipakai
+            if self.selected not in game.owned_skins:
+                price = shop_options[self.selected]["price"]
+                if game.coins < price:
+                    return
+                game.coins -= price
+                game.owned_skins.add(self.selected)
+            game.equipped[shop_options[self.selected]["type"]] = self.selected
+            game.apply_skin()
+        elif event.key == pygame.K_BACKSPACE or event.key == pygame.K_ESCAPE:
+            game.change_state(STATE_MAIN_MENU)
+
+    def draw(self, surface):
+        game = self.game
+        medium_font = game.medium_font
+        draw_text_with_shadow(surface, 'SHOP', game.title_font, COLOR_ACCENT, COLOR_SHADOW, LOW_RES_WIDTH // 2, 30)
+        shop_start_y = 65
+        shop_spacing = 32
+        max_visible = self.max_visible
+        total_items = len(game.shop_options)
+        # Hitung halaman shop
+        current_page = self.selected // max_visible
+        total_pages = (total_items + max_visible - 1) // max_visible
+        page_start = current_page * max_visible
+        page_end = min(page_start + max_visible, total_items)
+        for idx, i in enumerate(range(page_start, page_end)):
+            item = game.shop_options[i]
+            owned = i in game.owned_skins
+            equipped = game.equipped[item["type"]] == i
+            color = COLOR_SELECTED if i == self.selected else (COLOR_ACCENT if owned else COLOR_TEXT)
+            price = item["price"]
+            label = item["name"]
+            if owned:
+                label += " (Owned)"
+            if equipped:
+                label += " [Equipped]"
+            if not owned and price > 0:
+                label += f" - {price} koin"
+            draw_text_with_shadow(surface, label, medium_font, color, COLOR_SHADOW, LOW_RES_WIDTH // 2, shop_start_y + idx * shop_spacing)
+            if i == self.selected:
+                draw_text_with_shadow(surface, '>', medium_font, COLOR_SELECTED, COLOR_SHADOW, LOW_RES_WIDTH // 2 - 100, shop_start_y + idx * shop_spacing)
+        # Tampilkan panah jika ada halaman berikutnya/sebelumnya
+        if current_page > 0:
+            draw_text_with_shadow(surface, '^', medium_font, COLOR_ACCENT, COLOR_SHADOW, LOW_RES_WIDTH // 2 + 90, shop_start_y - 18)
+        if current_page < total_pages - 1:
+            draw_text_with_shadow(surface, 'v', medium_font, COLOR_ACCENT, COLOR_SHADOW, LOW_RES_WIDTH // 2 + 90, shop_start_y + (max_visible-1) * shop_spacing + 18)
+        # Tampilkan jumlah koin
+        draw_text_with_shadow(surface, f"Koin: {game.coins}", medium_font, COLOR_ACCENT, COLOR_SHADOW, LOW_RES_WIDTH // 2, LOW_RES_HEIGHT - 15)
+        # Instruksi di bagian paling bawah, di atas koin
+        shop_instruction_y = LOW_RES_HEIGHT - 55
+        for instruction in SHOP_INSTRUCTIONS:
+            draw_text_with_shadow(surface, instruction, game.small_font, COLOR_ACCENT, COLOR_SHADOW, LOW_RES_WIDTH // 2, shop_instruction_y)
+            shop_instruction_y += 13
+
+
+class DifficultySelectState(MenuState):
+    def __init__(self, game):
+        super().__init__(game)
+        self.selected = 1  # Index ke options(); default SEDANG
+
+    def options(self):
+        if get_neural_policy() is not None:
+            return DIFFICULTY_OPTIONS + [DIFFICULTY_NEURAL_OPTION]
+        return DIFFICULTY_OPTIONS
+
+    def frame_key(self):
+        return (self.selected,)
+
+    def handle_event(self, event):
+        game = self.game
+        if event.type != pygame.KEYDOWN:
+            return
+        options = self.options()
+        if event.key == pygame.K_ESCAPE:
+            game.running = False
+        elif event.key == pygame.K_UP:
+            self.selected = (self.selected - 1) % len(options)
+            game.audio.play("menu_move")
+        elif event.key == pygame.K_DOWN:
+            self.selected = (self.selected + 1) % len(options)
+            game.audio.play("menu_move")
+        elif event.key == pygame.K_SPACE or event.key == pygame.K_RETURN:
+            game.audio.play("menu_select")
+            game.start_new_game(MODE_VS_COMPUTER, options[self.selected][1])
+        elif event.key == pygame.K_BACKSPACE:
+            game.change_state(STATE_MAIN_MENU)
+
+    def draw(self, surface):
+        game = self.game
+        # Judul
+        draw_text_with_shadow(surface, 'PILIH TINGKAT KESULITAN', game.medium_font, COLOR_TEXT, COLOR_SHADOW,
+                              LOW_RES_WIDTH // 2, 60)
+        # Lebih rapat jika lebih dari 4 opsi
+        options = self.options()
+        difficulty_start_y = 100 if len(options) <= 4 else 92
+        difficulty_spacing = 25 if len(options) <= 4 else 20
+        for i, (option, _) in enumerate(options):
+            color = COLOR_SELECTED if i == self.selected else COLOR_TEXT
+            draw_text_with_shadow(surface, option, game.medium_font, color, COLOR_SHADOW,
+                                  LOW_RES_WIDTH // 2, difficulty_start_y + i * difficulty_spacing)
+            # Indicator untuk opsi yang dipilih
+            if i == self.selected:
+                draw_text_with_shadow(surface, '>', game.medium_font, COLOR_SELECTED, COLOR_SHADOW,
+                                      LOW_RES_WIDTH // 2 - 80, difficulty_start_y + i * difficulty_spacing)
+        # Instruksi untuk kembali ke menu utama
+        draw_text_with_shadow(surface, 'BACKSPACE: kembali', game.small_font, COLOR_ACCENT, COLOR_SHADOW,
+                              LOW_RES_WIDTH // 2, 190)
+
+
+class LeaderboardState(MenuState):
+    """Top rating dan riwayat profil aktif dari leaderboard SQLite.
+
+    Query (ber-index, < 1 ms) hanya dijalankan saat masuk layar atau saat
+    writer selesai menulis batch baru, bukan tiap frame.
+    """
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.loaded = None  # leaderboard.written saat baris terakhir dimuat
+        self.top = []
+        self.history = []
+
+    def frame_key(self):
+        leaderboard = self.game.leaderboard
+        written = leaderboard.written if leaderboard else 0
+        if written != self.loaded:
+            self.loaded = written
+            if leaderboard:
+                self.top = leaderboard.top(LEADERBOARD_ROWS)
+                self.history = leaderboard.history(self.game.profile, LEADERBOARD_HISTORY)
+        return (written,)
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_BACKSPACE):
+            self.game.change_state(STATE_MAIN_MENU)
+
+    def draw(self, surface):
+        game = self.game
+        small_font = game.small_font
+        draw_text_with_shadow(surface, 'PERINGKAT', game.title_font, COLOR_ACCENT, COLOR_SHADOW, LOW_RES_WIDTH // 2, 22)
+        if game.leaderboard is None:
+            draw_text_with_shadow(surface, 'Leaderboard tidak tersedia', small_font, COLOR_TEXT, COLOR_SHADOW,
+                                  LOW_RES_WIDTH // 2, 100)
+        y = 45
+        for rank, (name, kind, rating, matches, wins) in enumerate(self.top, 1):
+            color = COLOR_SELECTED if name == game.profile else COLOR_TEXT
+            draw_text_with_shadow(surface, "%d. %s" % (rank, name), small_font, color, COLOR_SHADOW, 40, y - 6,
+                                  centered=False)
+            draw_text_with_shadow(surface, "%d" % round(rating), small_font, color, COLOR_SHADOW, 200, y)
+            draw_text_with_shadow(surface, "%d/%d" % (wins, matches), small_font, color, COLOR_SHADOW, 255, y)
+            y += 14
+        if self.history:
+            y = 155
+            draw_text_with_shadow(surface, 'TERAKHIR: %s' % game.profile, small_font, COLOR_ACCENT, COLOR_SHADOW,
+                                  LOW_RES_WIDTH // 2, y)
+            for played_at, opponent, own, other, won, rating in self.history:
+                y += 13
+                line = "%s %d-%d vs %s (%d)" % ("MENANG" if won else "KALAH", own, other, opponent, round(rating))
+                draw_text_with_shadow(surface, line, small_font, COLOR_TEXT, COLOR_SHADOW, LOW_RES_WIDTH // 2, y)
+        draw_text_with_shadow(surface, 'ESC/BACKSPACE: kembali', small_font, COLOR_ACCENT, COLOR_SHADOW,
+                              LOW_RES_WIDTH // 2, LOW_RES_HEIGHT - 15)
+
+
+class StartState(MenuState):
+    def frame_key(self):
+        return (self.game.game_mode,)
+
+    def handle_event(self, event):
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            self.game.running = False
+        elif event.key == pygame.K_SPACE:
+            self.game.start_new_game(self.game.game_mode)
+
+    def draw(self, surface):
+        game = self.game
+        title_text = game.large_font.render('COZY PONG', True, COLOR_TEXT)
+        surface.blit(title_text, title_text.get_rect(center=(LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 3)))
+        prompt_text = game.small_font.render('Tekan SPACE untuk Mulai', True, COLOR_ACCENT)
+        surface.blit(prompt_text, prompt_text.get_rect(center=(LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 1.5)))
+        # Tampilkan mode game
+        mode_text = "Mode: " + ("2 Player" if game.game_mode == MODE_TWO_PLAYER else "VS Computer")
+        mode_display = game.small_font.render(mode_text, True, COLOR_TEXT)
+        surface.blit(mode_display, mode_display.get_rect(center=(LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 1.5 + 20)))
+        # Tambahkan info kecepatan progresif
+        speed_info = game.small_font.render('Kecepatan meningkat tiap 3 detik!', True, COLOR_TEXT)
+        surface.blit(speed_info, speed_info.get_rect(center=(LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 1.5 + 40)))
+
+
+class PlayState(GameState):
+    """Simulasi maju per SIM_DT tetap; render (berapapun rate-nya) menginterpolasi
+    posisi di antara dua step, jadi kecepatan game tidak bergantung FPS."""
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.paddle_1_move = 0
+        self.paddle_2_move = 0
+        self.ball_trail = []  # Menyimpan posisi bola untuk efek trail
+        self.ball_glow_timer = 0.0  # Detik efek glow berdenyut
+        self.speed_up_effect_timer = 0.0
+        self.accumulator = 0.0  # Waktu render yang belum disimulasikan
+
+    def on_enter(self, previous):
+        # Input yang masuk sebelum state ini (menu, score screen) tetap mengubah
+        # tombol yang ditahan, tapi tidak dihitung ke tick mana pun
+        self.game.input.discard_until(self.game.frame_time)
+        self.paddle_1_move = 0
+        self.paddle_2_move = 0
+        self.ball_trail.clear()
+        self.accumulator = 0.0
+
+    def handle_event(self, event):
+        # Paddle dibaca dari game.input per tick (lihat update)
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            # Pertandingan di-suspend, bisa dilanjutkan dari menu utama
+            self.game.suspend()
+            self.game.change_state(STATE_MAIN_MENU)
+
+    def update(self, dt):
+        game = self.game
+        match = game.match
+        controls = game.input
+        two_player = game.game_mode == MODE_TWO_PLAYER
+
+        # Update timer efek (waktu render, bukan waktu simulasi)
+        if self.ball_glow_timer > 0:
+            self.ball_glow_timer -= dt
+        if self.speed_up_effect_timer > 0:
+            self.speed_up_effect_timer -= dt
+
+        self.accumulator += min(dt, MAX_FRAME_TIME)
+        # Tick pertama frame ini mewakili waktu dinding frame_time - accumulator;
+        # input tiap tick adalah rata-rata selama jendela SIM_DT-nya sendiri
+        tick_start = game.frame_time - self.accumulator
+        while self.accumulator >= SIM_DT:
+            self.accumulator -= SIM_DT
+            tick_end = tick_start + SIM_DT
+            # Dikuantisasi ke resolusi replay supaya rekaman memutar ulang persis
+            self.paddle_1_move = quantize_move(PADDLE_SPEED * controls.sample(1, tick_start, tick_end))
+            self.paddle_2_move = (quantize_move(PADDLE_SPEED * controls.sample(2, tick_start, tick_end))
+                                  if two_player else 0)
+            tick_start = tick_end
+            events = match.step(SIM_DT, self.paddle_1_move, self.paddle_2_move)
+            if game.recorder:
+                game.recorder.step(self.paddle_1_move, self.paddle_2_move)
+            self.handle_match_events(events)
+            if match.point_scored_by:
+                # Bola berhenti di posisi poin; tidak perlu interpolasi
+                match.save_previous()
+                game.sync_rects()
+                game.change_state(STATE_GAME_OVER if match.winner else STATE_SCORE_SCREEN)
+                return
+        game.sync_rects(self.accumulator / SIM_DT)
+
+    def handle_match_events(self, events):
+        game = self.game
+        match = game.match
+        multiplier = match.current_speed_multiplier
+        ball_x = int(match.ball.x) + BALL_RADIUS
+        ball_y = int(match.ball.y) + BALL_RADIUS
+
+        # Update trail bola untuk efek visual (satu titik per step simulasi)
+        self.ball_trail.append((ball_x, ball_y))
+        if len(self.ball_trail) > int(8 + multiplier * 2):  # Trail lebih panjang untuk kecepatan tinggi
+            self.ball_trail.pop(0)
+
+        if game.telemetry and events:
+            game.telemetry.emit_many(match_event_rows(game.match_id, match, events))
+        if events and game.game_mode == MODE_VS_COMPUTER:
+            # Model skill pemain untuk AI adaptif (paddle kiri)
+            game.skill.observe(match, events)
+
+        particles = game.particles
+        explosion_color = game.shop_options[game.equipped["explosion"]].get("explosion_color", (255, 220, 100))
+        play_sound = game.audio.play
+        # Nada pukulan naik bersama kecepatan bola (varian yang sudah disintesis)
+        hit_pitch = int((multiplier - 1.0) * 2)
+        for event in events:
+            kind = event[0]
+            # Nama suara = jenis event; event tanpa suara diabaikan
+            play_sound(kind, hit_pitch)
+            if kind == "paddle_hit":
+                game.screen_shake_timer = max(SCREEN_SHAKE_HIT, 3 * multiplier / 60)
+                self.ball_glow_timer = max(BALL_GLOW_DURATION, 10 * multiplier / 60)
+                # Semburan ke arah pantulan bola
+                particles.emit(ball_x, ball_y, 40, explosion_color, speed=90 * multiplier,
+                               life=0.4, angle=0.0 if match.ball.vel_x > 0 else math.pi, spread=math.pi)
+            elif kind == "wall":
+                particles.emit(ball_x, ball_y, 12, explosion_color, speed=50, life=0.3,
+                               angle=math.pi / 2 if event[1] == 0 else -math.pi / 2, spread=math.pi)
+            elif kind == "point":
+                # Ledakan skor di posisi bola terakhir
+                particles.emit(ball_x, ball_y, 400, explosion_color, speed=160, life=1.2)
+            elif kind == "speed_up":
+                # Aktifkan efek visual
+                self.speed_up_effect_timer = SPEED_UP_EFFECT_DURATION
+                # Tambahkan sedikit screen shake
+                game.screen_shake_timer = max(game.screen_shake_timer, SCREEN_SHAKE_SPEED_UP)
+
+    def render(self, surface):
+        game = self.game
+        game.renderer.draw_play(surface, game.match, game.ball_rect, game.paddle_1_rect, game.paddle_2_rect,
+                                self.ball_trail, self.ball_glow_timer, self.speed_up_effect_timer,
+                                game.game_mode == MODE_VS_COMPUTER, game.get_ticks())
+
+
+class ScoreScreenState(GameState):
+    """Jeda setelah poin; SPACE melanjutkan ronde berikutnya."""
+
+    needs_update = False
+
+    def handle_event(self, event):
+        game = self.game
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            game.suspend()
+            game.change_state(STATE_MAIN_MENU)
+        elif event.key == pygame.K_SPACE:
+            # AI adaptif hanya berubah di antara poin
+            game.update_ai_adjustment()
+            game.match.next_round()
+            if game.recorder:
+                game.recorder.next_round()
+            game.sync_rects()
+            game.change_state(STATE_PLAY)
+
+    def render(self, surface):
+        game = self.game
+        game.renderer.draw_score_screen(surface, game.match, game.ball_rect, game.paddle_1_rect, game.paddle_2_rect,
+                                        game.game_mode == MODE_VS_COMPUTER)
+
+
+class GameOverState(MenuState):
+    def on_enter(self, previous):
+        game = self.game
+        # Pertandingan selesai: hapus snapshot suspend, tutup telemetri pertandingan
+        game.end_match()
+        # Statistik untuk adaptive AI
+        game.total_games += 1
+        if game.match.winner == 1:
+            game.player_wins += 1
+        elif game.game_mode == MODE_VS_COMPUTER:
+            game.ai_wins += 1
+
+    def frame_key(self):
+        match = self.game.match
+        return (id(match), match.score_1, match.score_2, match.winner)
+
+    def handle_event(self, event):
+        game = self.game
+        if event.type != pygame.KEYDOWN:
+            return
+        if event.key == pygame.K_ESCAPE:
+            game.change_state(STATE_MAIN_MENU)
+        elif event.key == pygame.K_SPACE:
+            game.states[STATE_MAIN_MENU].selected = 0  # Reset menu selection
+            game.change_state(STATE_MAIN_MENU)
+
+    def draw(self, surface):
+        game = self.game
+        match = game.match
+        if match.winner == 1:
+            win_text_content = "Player 1 MENANG!"
+        elif match.winner == 2:
+            win_text_content = ("Computer" if game.game_mode == MODE_VS_COMPUTER else "Player 2") + " MENANG!"
+        else:
+            win_text_content = "GAME OVER"
+        win_text = game.large_font.render(win_text_content, True, COLOR_ACCENT)
+        surface.blit(win_text, win_text.get_rect(center=(LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 3)))
+        restart_text = game.small_font.render('Tekan SPACE untuk Main Lagi', True, COLOR_TEXT)
+        surface.blit(restart_text, restart_text.get_rect(center=(LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 1.5)))
+        final_score_text_1 = game.medium_font.render(f"P1: {match.score_1}", True, COLOR_TEXT)
+        surface.blit(final_score_text_1, final_score_text_1.get_rect(center=(LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 2 + 10)))
+        final_score_text_2 = game.medium_font.render(f"P2: {match.score_2}", True, COLOR_TEXT)
+        surface.blit(final_score_text_2, final_score_text_2.get_rect(center=(LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 2 + 35)))
+
+    def render(self, surface):
+        super().render(surface)
+        # Sisa ledakan poin terakhir beranimasi di atas frame statis
+        self.game.renderer.draw_particles(surface)
+
+
+def build_states(game):
+    """Tabel dispatch state_id -> objek state."""
+    return {
+        STATE_START: StartState(game),
+        STATE_PLAY: PlayState(game),
+        STATE_SCORE_SCREEN: ScoreScreenState(game),
+        STATE_GAME_OVER: GameOverState(game),
+        STATE_MAIN_MENU: MainMenuState(game),
+        STATE_DIFFICULTY_SELECT: DifficultySelectState(game),
+        STATE_SHOP: ShopState(game),
+        STATE_LEADERBOARD: LeaderboardState(game),
+    }
@@ -0,0 +1,215 @@
+"""Mode turnamen: 4, 9, atau 16 pertandingan sekaligus dalam grid di satu layar.
+
+Tiap meja adalah playfield 320x240 yang sama dengan game utama, digambar
+ke subsurface dari satu surface grid yang lalu ditampilkan oleh backend
+display biasa. Simulasi semua meja maju bersama per tick SIM_DT (satu
+loop untuk semua meja), dan semua meja memakai satu GameRenderer, jadi
+background, garis tengah, dan sprite trail/glow di-cache sekali untuk
+semua; skor disusun dari atlas glyph bersama (glyphs.py). Meja yang tidak
+sedang difokus digambar ulang hanya tiap `unfocused_divisor` frame
+(bergiliran, supaya beban per frame rata); meja fokus selalu tiap frame.
+
+Semua meja AI vs AI, kecuali dengan `human=True`: paddle kiri meja pertama
+dikendalikan pemain (W/S atau joystick). Panah memindah fokus, ESC keluar.
+"""
+import math
+import time
+
+import pygame
+
+from assets import FONT_SPECS, resolve_font
+from constants import *
+from controls import InputManager
+from display import create_display
+from glyphs import draw_bitmap_text
+from render import GameRenderer, draw_text_with_shadow
+from replay import quantize_move
+from sim import Match
+
+TABLE_COUNTS = (4, 9, 16)
+TABLE_DIFFICULTIES = (DIFFICULTY_EASY, DIFFICULTY_MEDIUM, DIFFICULTY_HARD)
+DIFFICULTY_LABELS = {DIFFICULTY_EASY: "MUDAH", DIFFICULTY_MEDIUM: "SEDANG", DIFFICULTY_HARD: "SULIT"}
+POINT_PAUSE_STEPS = SIM_RATE // 2   # jeda setelah poin sebelum ronde berikutnya
+WINNER_PAUSE_STEPS = SIM_RATE * 3   # pemenang ditampilkan sebelum pertandingan baru
+UNFOCUSED_DIVISOR = 4               # meja lain 60/4 = 15 FPS
+
+
+class Table:
+    """Satu meja: pertandingan plus state render-nya (Rect, trail, glow)."""
+
+    def __init__(self, index, tile, difficulty, seed, human=False):
+        self.index = index
+        self.tile = tile
+        self.human = human
+        self.match = Match(MODE_VS_COMPUTER, difficulty, seed=seed, ai_sides=(2,) if human else (1, 2))
+        self.match.start()
+        self.label = "%d %s" % (index + 1, "PEMAIN" if human else DIFFICULTY_LABELS.get(difficulty, ""))
+        self.pause_steps = 0
+        self.ball_rect = pygame.Rect(BALL_START_X, BALL_START_Y, BALL_RADIUS * 2, BALL_RADIUS * 2)
+        self.paddle_1_rect = pygame.Rect(PADDLE_1_X, PADDLE_START_Y, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.paddle_2_rect = pygame.Rect(PADDLE_2_X, PADDLE_START_Y, PADDLE_WIDTH, PADDLE_HEIGHT)
+        self.ball_trail = []
+        self.ball_glow_timer = 0.0
+
+    def step(self, paddle_1_move=0):
+        """Satu tick simulasi (atau jeda setelah poin)."""
+        match = self.match
+        if self.pause_steps:
+            self.pause_steps -= 1
+            if not self.pause_steps:
+                if match.winner is not None:
+                    match.start()
+                else:
+                    match.next_round()
+                self.ball_trail.clear()
+            return
+        events = match.step(SIM_DT, paddle_1_move, 0)
+        ball_x = int(match.ball.x) + BALL_RADIUS
+        ball_y = int(match.ball.y) + BALL_RADIUS
+        self.ball_trail.append((ball_x, ball_y))
+        if len(self.ball_trail) > int(8 + match.current_speed_multiplier * 2):
+            self.ball_trail.pop(0)
+        for event in events:
+            if event[0] == "paddle_hit":
+                self.ball_glow_timer = max(BALL_GLOW_DURATION, 10 * match.current_speed_multiplier / 60)
+        if match.point_scored_by is not None:
+            match.save_previous()
+            self.pause_steps = WINNER_PAUSE_STEPS if match.winner is not None else POINT_PAUSE_STEPS
+
+    def draw(self, renderer, fonts, alpha, ticks, focused=False, hud=True):
+        match = self.match
+        tile = self.tile
+        paddle_1_y, paddle_2_y, ball_x, ball_y = match.lerp_positions(1.0 if self.pause_steps else alpha)
+        self.paddle_1_rect.y = int(paddle_1_y)
+        self.paddle_2_rect.y = int(paddle_2_y)
+        self.ball_rect.topleft = (int(ball_x), int(ball_y))
+        # Layer background/playfield/efek dari renderer bersama; HUD ringkas sendiri
+        # (CachedText renderer hanya menyimpan satu nilai skor)
+        renderer.draw_background(tile)
+        renderer.draw_playfield(tile, self.paddle_1_rect, self.paddle_2_rect, True)
+        renderer.draw_effects(tile, match, self.ball_rect, self.ball_trail, self.ball_glow_timer, ticks)
+        if not hud:
+            return
+        # Skor berbeda per meja dan terus berubah: disusun dari atlas glyph, bukan cache per string
+        medium_font = fonts["medium"]
+        draw_bitmap_text(tile, "%d" % match.score_1, medium_font, COLOR_TEXT, COLOR_SHADOW, LOW_RES_WIDTH // 4, 20)
+        draw_bitmap_text(tile, "%d" % match.score_2, medium_font, COLOR_TEXT, COLOR_SHADOW,
+                         LOW_RES_WIDTH * 3 // 4, 20)
+        draw_text_with_shadow(tile, self.label, fonts["small"], COLOR_ACCENT, COLOR_SHADOW, LOW_RES_WIDTH // 2,
+                              LOW_RES_HEIGHT - 12)
+        if match.winner is not None:
+            draw_text_with_shadow(tile, "P%d MENANG!" % match.winner, fonts["title"], COLOR_ACCENT, COLOR_SHADOW,
+                                  LOW_RES_WIDTH // 2, LOW_RES_HEIGHT // 2)
+        if focused:
+            pygame.draw.rect(tile, COLOR_SELECTED, tile.get_rect(), 3)
+
+
+class TableWall:
+    """Grid meja di satu surface (kolom x baris meja 320x240)."""
+
+    def __init__(self, count=4, seed=0, human=False, difficulties=TABLE_DIFFICULTIES,
+                 unfocused_divisor=UNFOCUSED_DIVISOR):
+        self.columns = math.isqrt(count)
+        if self.columns * self.columns != count:
+            raise ValueError("jumlah meja harus kuadrat (4, 9, 16): %d" % count)
+        self.surface = pygame.Surface((self.columns * LOW_RES_WIDTH, self.columns * LOW_RES_HEIGHT))
+        self.tables = []
+        for i in range(count):
+            row, column = divmod(i, self.columns)
+            tile = self.surface.subsurface((column * LOW_RES_WIDTH, row * LOW_RES_HEIGHT,
+                                            LOW_RES_WIDTH, LOW_RES_HEIGHT))
+            self.tables.append(Table(i, tile, difficulties[i % len(difficulties)], seed + i, human and i == 0))
+        self.focus = 0
+        self.unfocused_divisor = max(1, unfocused_divisor)
+        self.frame = 0
+        self.tables_drawn = 0  # jumlah meja yang digambar di frame terakhir
+
+    def move_focus(self, dx, dy):
+        row, column = divmod(self.focus, self.columns)
+        row = (row + dy) % self.columns
+        column = (column + dx) % self.columns
+        self.focus = row * self.columns + column
+
+    def step(self, human_move=0):
+        """Satu tick untuk semua meja."""
+        for table in self.tables:
+            table.step(human_move if table.human else 0)
+
+    def update_timers(self, dt):
+        for table in self.tables:
+            if table.ball_glow_timer > 0:
+                table.ball_glow_timer -= dt
+
+    def draw(self, renderer, fonts, alpha, ticks):
+        divisor = self.unfocused_divisor
+        frame = self.frame
+        self.frame += 1
+        drawn = 0
+        for table in self.tables:
+            focused = table.index == self.focus
+            # Giliran meja lain bergeser tiap frame, jadi tiap frame menggambar jumlah yang sama
+            if focused or table.human or (frame + table.index) % divisor == 0:
+                table.draw(renderer, fonts, alpha, ticks, focused)
+                drawn += 1
+        self.tables_drawn = drawn
+
+
+def run_tables(count=4, seed=0, human=False, render_fps=TARGET_FPS, display_backend="software",
+               unfocused_divisor=UNFOCUSED_DIVISOR, frames=None):
+    """Loop mode turnamen. `frames` (opsional) berhenti setelah sekian frame dan
+    mengembalikan rata-rata waktu (simulasi, render, present) per frame dalam detik."""
+    pygame.display.init()
+    pygame.font.init()
+    pygame.joystick.init()
+    wall = TableWall(count, seed, human, unfocused_divisor=unfocused_divisor)
+    display = create_display(display_backend, 'Cozy Pixel Pong - %d meja' % count, wall.surface.get_size())
+    fonts = {name: pygame.font.Font(*resolve_font(name)) for name in FONT_SPECS}
+    renderer = GameRenderer(fonts["small"], fonts["medium"])
+    controls = InputManager()
+    timings = [0.0, 0.0, 0.0]
+    frame_count = 0
+    accumulator = 0.0
+    start = frame_time = time.perf_counter()
+    running = True
+    while running:
+        deadline = frame_time + 1.0 / render_fps if render_fps else 0.0
+        events = controls.wait_events(deadline)
+        now = time.perf_counter()
+        dt = now - frame_time
+        frame_time = now
+        for stamp, event in events:
+            if event.type == pygame.QUIT:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                running = False
+            elif event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                wall.move_focus(1 if event.key == pygame.K_RIGHT else -1, 0)
+            elif event.type == pygame.KEYDOWN and event.key in (pygame.K_UP, pygame.K_DOWN):
+                wall.move_focus(0, 1 if event.key == pygame.K_DOWN else -1)
+            else:
+                controls.handle_event(event, stamp)
+
+        # Semua meja maju bersama per tick tetap, sama seperti PlayState.update
+        t0 = time.perf_counter()
+        accumulator += min(dt, MAX_FRAME_TIME)
+        tick_start = frame_time - accumulator
+        while accumulator >= SIM_DT:
+            accumulator -= SIM_DT
+            tick_end = tick_start + SIM_DT
+            human_move = quantize_move(PADDLE_SPEED * controls.sample(1, tick_start, tick_end)) if human else 0
+            tick_start = tick_end
+            wall.step(human_move)
+        wall.update_timers(dt)
+        t1 = time.perf_counter()
+        wall.draw(renderer, fonts, accumulator / SIM_DT, int((t1 - start) * 1000))
+        t2 = time.perf_counter()
+        display.present(wall.surface)
+        t3 = time.perf_counter()
+        timings[0] += t1 - t0
+        timings[1] += t2 - t1
+        timings[2] += t3 - t2
+        frame_count += 1
+        if frames is not None and frame_count >= frames:
+            break
+    pygame.quit()
+    return [total / max(1, frame_count) for total in timings]
@@ -0,0 +1,202 @@
+"""Telemetri pertandingan: event per rally ke file kolom, plus agregator offline.
+
+Game dan `cli.py simulate` memanggil `emit()`, yang hanya memasukkan tuple
+ke antrean; thread writer di background mengumpulkannya per batch lalu
+menulis satu file chunk baru (append-only). Format Parquet jika pyarrow
+terpasang, jika tidak CSV ber-gzip. Tidak bergantung pada pygame.
+"""
+import csv
+import glob
+import gzip
+import importlib.util
+import os
+import queue
+import threading
+import time
+
+from constants import *
+
+# pyarrow diimpor malas (~0.2 detik): di thread writer atau saat membaca chunk
+HAVE_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+TELEMETRY_DIR = os.path.join(os.path.expanduser("~"), ".cache", "cozypong", "telemetry")
+BATCH_ROWS = 8192
+FLUSH_INTERVAL = 5.0  # detik; batch kecil tetap ditulis setelah selang ini
+
+COLUMNS = ("match_id", "mode", "difficulty", "step", "kind", "side", "value", "detail")
+_OWNER_SIDES = {None: 0, "p1": 1, "p2": 2}
+_STOP = object()
+
+
+def match_event_rows(match_id, match, events):
+    """Ubah event dari Match.step() menjadi baris telemetri."""
+    mode = match.mode
+    difficulty = match.difficulty
+    step = match.steps
+    rows = []
+    for event in events:
+        kind = event[0]
+        if kind == "paddle_hit":
+            # value = relative_intersect_y: -1 (ujung bawah) .. 1 (ujung atas)
+            rows.append((match_id, mode, difficulty, step, kind, event[1], event[2], ""))
+        elif kind in ("wall", "shield_block"):
+            rows.append((match_id, mode, difficulty, step, kind, event[1], 0.0, ""))
+        elif kind == "speed_up":
+            rows.append((match_id, mode, difficulty, step, kind, 0, event[1], ""))
+        elif kind == "powerup":
+            rows.append((match_id, mode, difficulty, step, kind, _OWNER_SIDES[event[2]], 0.0, event[1]))
+        elif kind == "point":
+            # value = durasi rally (detik simulasi)
+            rally = (step - match.round_start_step) / SIM_RATE
+            rows.append((match_id, mode, difficulty, step, kind, event[1], rally, ""))
+    return rows
+
+
+def match_start_row(match_id, match, skins=()):
+    """Baris awal pertandingan; detail = nama skin yang dipakai, dipisah ';'."""
+    return (match_id, match.mode, match.difficulty, match.steps, "match_start", 0, 0.0, ";".join(skins))
+
+
+def match_end_row(match_id, match):
+    """Baris akhir pertandingan; side = pemenang (0 jika belum ada), value = durasi (detik)."""
+    return (match_id, match.mode, match.difficulty, match.steps, "match_end", match.winner or 0,
+            match.steps / SIM_RATE, "%d-%d" % (match.score_1, match.score_2))
+
+
+class TelemetryWriter:
+    """Thread latar belakang yang menulis baris telemetri per batch.
+
+    `emit()` tidak pernah menunggu I/O, jadi aman dipanggil dari game loop.
+    """
+
+    def __init__(self, directory=TELEMETRY_DIR, batch_rows=BATCH_ROWS, flush_interval=FLUSH_INTERVAL,
+                 format=None):
+        self.directory = directory
+        self.batch_rows = batch_rows
+        self.flush_interval = flush_interval
+        self.format = format or ("parquet" if HAVE_PYARROW else "csv")
+        if self.format == "parquet" and not HAVE_PYARROW:
+            raise ValueError("Format parquet butuh pyarrow")
+        # Nama chunk unik per sesi: waktu mulai + pid, lalu nomor urut
+        self.session = "%d-%d" % (int(time.time() * 1000), os.getpid())
+        self.chunks = 0
+        self.rows_written = 0
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="telemetry-writer", daemon=True)
+        self._thread.start()
+        return self
+
+    def emit(self, row):
+        self._queue.put(row)
+
+    def emit_many(self, rows):
+        put = self._queue.put
+        for row in rows:
+            put(row)
+
+    def close(self, timeout=5.0):
+        """Tulis sisa batch dan hentikan thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self):
+        if self.format == "parquet":
+            import pyarrow
+            import pyarrow.parquet
+            self._pa = pyarrow
+            self._pq = pyarrow.parquet
+        get = self._queue.get
+        batch = []
+        oldest = 0.0  # waktu baris pertama di batch
+        while True:
+            try:
+                row = get(timeout=self.flush_interval)
+            except queue.Empty:
+                row = None
+            if row is _STOP:
+                break
+            if row is not None:
+                if not batch:
+                    oldest = time.monotonic()
+                batch.append(row)
+            if len(batch) >= self.batch_rows or (batch and time.monotonic() - oldest >= self.flush_interval):
+                self._write(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+
+    def _write(self, rows):
+        name = "events-%s-%05d" % (self.session, self.chunks)
+        try:
+            if self.format == "parquet":
+                columns = list(zip(*rows))
+                table = self._pa.table({column: list(values) for column, values in zip(COLUMNS, columns)})
+                self._pq.write_table(table, os.path.join(self.directory, name + ".parquet"))
+            else:
+                with gzip.open(os.path.join(self.directory, name + ".csv.gz"), "wt", newline="") as f:
+                    writer = csv.writer(f)
+                    writer.writerow(COLUMNS)
+                    writer.writerows(rows)
+        except OSError as e:
+            print("Gagal menulis telemetri: %s" % e)
+            return
+        self.chunks += 1
+        self.rows_written += len(rows)
+
+
+def read_chunks(directory=TELEMETRY_DIR):
+    """Iterasi chunk telemetri sebagai dict kolom -> list nilai."""
+    paths = sorted(glob.glob(os.path.join(directory, "events-*.parquet")) +
+                   glob.glob(os.path.join(directory, "events-*.csv.gz")))
+    for path in paths:
+        if path.endswith(".parquet"):
+            if not HAVE_PYARROW:
+                print("Lewati %s: pyarrow tidak terpasang" % os.path.basename(path))
+                continue
+            import pyarrow.parquet
+            yield pyarrow.parquet.read_table(path, columns=list(COLUMNS)).to_pydict()
+        else:
+            with gzip.open(path, "rt", newline="") as f:
+                reader = csv.reader(f)
+                header = next(reader)
+                columns = [list(values) for values in zip(*reader)] or [[] for _ in header]
+            data = dict(zip(header, columns))
+            for column in ("match_id", "mode", "difficulty", "step", "side"):
+                data[column] = [int(v) for v in data[column]]
+            data["value"] = [float(v) for v in data["value"]]
+            yield data
+
+
+def aggregate(chunks):
+    """Ringkasan keseimbangan difficulty dan popularitas skin dari chunk telemetri."""
+    # (mode, difficulty) -> statistik
+    balance = {}
+    skins = {}
+    for data in chunks:
+        for mode, difficulty, kind, side, value, detail in zip(data["mode"], data["difficulty"], data["kind"],
+                                                              data["side"], data["value"], data["detail"]):
+            if kind == "match_start":
+                for skin in detail.split(";") if detail else ():
+                    skins[skin] = skins.get(skin, 0) + 1
+                continue
+            stats = balance.get((mode, difficulty))
+            if stats is None:
+                stats = balance[(mode, difficulty)] = {"matches": 0, "p1_wins": 0, "rallies": 0, "rally_time": 0.0,
+                                                       "hits": 0, "offset_sum": 0.0}
+            if kind == "paddle_hit":
+                stats["hits"] += 1
+                stats["offset_sum"] += abs(value)
+            elif kind == "point":
+                stats["rallies"] += 1
+                stats["rally_time"] += value
+            elif kind == "match_end" and side:
+                stats["matches"] += 1
+                stats["p1_wins"] += side == 1
+    return balance, skins